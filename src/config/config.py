@@ -30,6 +30,41 @@ class Config:
     
     # Rate Limits
     DATAFORSEO_RATE_LIMIT = int(os.getenv('DATAFORSEO_RATE_LIMIT', '12'))  # requests per minute
+    DATAFORSEO_TRENDS_RATE_LIMIT = int(os.getenv('DATAFORSEO_TRENDS_RATE_LIMIT', '2000'))  # requests per minute
+    
+    # Response cache (set DATAFORSEO_CACHE_PATH to an empty string to disable)
+    DATAFORSEO_CACHE_PATH = os.getenv(
+        'DATAFORSEO_CACHE_PATH',
+        str(Path(__file__).parent.parent.parent / 'data' / 'cache' / 'dataforseo_cache.sqlite3')
+    )
+    DATAFORSEO_CACHE_MAX_MB = int(os.getenv('DATAFORSEO_CACHE_MAX_MB', '256'))
+    
+    # API root; set to a local MockDataForSEOServer URL to run without spending credits
+    DATAFORSEO_BASE_URL = os.getenv('DATAFORSEO_BASE_URL', 'https://api.dataforseo.com/v3')
+    
+    # HTTP (seconds; large live search volume tasks can take well over 30s)
+    DATAFORSEO_TIMEOUT = float(os.getenv('DATAFORSEO_TIMEOUT', '180'))
+    DATAFORSEO_CONNECT_TIMEOUT = float(os.getenv('DATAFORSEO_CONNECT_TIMEOUT', '10'))
+    DATAFORSEO_READ_TIMEOUT = float(os.getenv('DATAFORSEO_READ_TIMEOUT', '120'))
+    DATAFORSEO_COMPRESS_REQUESTS = os.getenv('DATAFORSEO_COMPRESS_REQUESTS', 'false').lower() == 'true'
+    # Seconds a search volume request should take; batch sizes adapt to stay under it
+    DATAFORSEO_BATCH_TARGET_LATENCY = float(os.getenv('DATAFORSEO_BATCH_TARGET_LATENCY', '60'))
+    
+    # Cost control in USD (empty = no limit); the ledger tracks spend across runs
+    DATAFORSEO_BUDGET_PER_RUN = float(os.getenv('DATAFORSEO_BUDGET_PER_RUN') or 'inf')
+    DATAFORSEO_BUDGET_PER_DAY = float(os.getenv('DATAFORSEO_BUDGET_PER_DAY') or 'inf')
+    # Use the cheaper standard queue (results take minutes) even when live fits the budget
+    DATAFORSEO_PREFER_QUEUED = os.getenv('DATAFORSEO_PREFER_QUEUED', 'false').lower() == 'true'
+    DATAFORSEO_COST_LEDGER_PATH = os.getenv(
+        'DATAFORSEO_COST_LEDGER_PATH',
+        str(Path(__file__).parent.parent.parent / 'data' / 'costs' / 'cost_ledger.json')
+    )
+    
+    # Daily Google Trends tracking (snapshots and materialized history)
+    TRENDS_TRACKING_PATH = os.getenv(
+        'TRENDS_TRACKING_PATH',
+        str(Path(__file__).parent.parent.parent / 'data' / 'trends')
+    )
     
     # Application Settings
     MAX_KEYWORDS_PER_BATCH = int(os.getenv('MAX_KEYWORDS_PER_BATCH', '1000'))
@@ -37,6 +72,12 @@ class Config:
     
     # Database
     FIRESTORE_PROJECT_ID = os.getenv('GOOGLE_PROJECT_ID', 'ai-tracker-466821')
+    # Concurrent write commits, and the starting writes/s of the 500/50/5 ramp-up (0 = no ramp)
+    FIRESTORE_WRITE_CONCURRENCY = int(os.getenv('FIRESTORE_WRITE_CONCURRENCY', '10'))
+    FIRESTORE_INITIAL_WRITE_RATE = float(os.getenv('FIRESTORE_INITIAL_WRITE_RATE', '500'))
+    # Keyword scans: documents per page and id ranges read in parallel (1 = no partitioning)
+    FIRESTORE_READ_PAGE_SIZE = int(os.getenv('FIRESTORE_READ_PAGE_SIZE', '1000'))
+    FIRESTORE_READ_PARTITIONS = int(os.getenv('FIRESTORE_READ_PARTITIONS', '8'))
     
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -62,9 +103,23 @@ class Config:
     def to_dict(cls) -> dict:
         """Return configuration as dictionary (excluding secrets)."""
         return {
+            'dataforseo_base_url': cls.DATAFORSEO_BASE_URL,
             'dataforseo_rate_limit': cls.DATAFORSEO_RATE_LIMIT,
+            'dataforseo_trends_rate_limit': cls.DATAFORSEO_TRENDS_RATE_LIMIT,
+            'dataforseo_cache_path': cls.DATAFORSEO_CACHE_PATH,
+            'dataforseo_timeout': cls.DATAFORSEO_TIMEOUT,
+            'dataforseo_compress_requests': cls.DATAFORSEO_COMPRESS_REQUESTS,
+            'dataforseo_batch_target_latency': cls.DATAFORSEO_BATCH_TARGET_LATENCY,
+            'dataforseo_budget_per_run': cls.DATAFORSEO_BUDGET_PER_RUN,
+            'dataforseo_budget_per_day': cls.DATAFORSEO_BUDGET_PER_DAY,
+            'dataforseo_prefer_queued': cls.DATAFORSEO_PREFER_QUEUED,
+            'trends_tracking_path': cls.TRENDS_TRACKING_PATH,
             'max_keywords_per_batch': cls.MAX_KEYWORDS_PER_BATCH,
             'max_trend_score': cls.MAX_TREND_SCORE,
             'firestore_project_id': cls.FIRESTORE_PROJECT_ID,
+            'firestore_write_concurrency': cls.FIRESTORE_WRITE_CONCURRENCY,
+            'firestore_initial_write_rate': cls.FIRESTORE_INITIAL_WRITE_RATE,
+            'firestore_read_page_size': cls.FIRESTORE_READ_PAGE_SIZE,
+            'firestore_read_partitions': cls.FIRESTORE_READ_PARTITIONS,
             'log_level': cls.LOG_LEVEL
         }
\ No newline at end of file
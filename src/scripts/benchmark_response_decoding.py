@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for search volume response decoding.
+
+Compares the old path (json.loads into a dict tree, walking it and building
+SearchVolumeResult objects by hand) with the typed path the client now uses
+(msgspec envelope decode with the task result left raw, decoded straight
+into SearchVolumeRow structs and converted to array-backed SearchVolumeResult
+objects). Also reports the memory held per keyword by the old list-of-dicts
+monthly breakdown versus MonthlySeries.
+
+Usage:
+    python benchmark_response_decoding.py --keywords 1000 --months 12 --repeat 20
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add parent path to sys.path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.dataforseo_client import SearchVolumeResult, _search_volume_rows
+from utils.decoding import decode_response
+from utils.monthly_series import MonthlySeries
+
+
+def build_response(num_keywords: int, num_months: int) -> bytes:
+    """Build a synthetic search_volume/live response body."""
+    rows = []
+    for i in range(num_keywords):
+        monthly = []
+        for m in range(num_months):
+            year, month = 2025 - m // 12, 12 - m % 12
+            monthly.append({"year": year, "month": month, "search_volume": 1000 + i * 7 + m})
+        rows.append({
+            "keyword": f"benchmark keyword {i}",
+            "spell": None,
+            "location_code": 2840,
+            "language_code": "en",
+            "search_partners": False,
+            "competition": "LOW",
+            "competition_index": 12,
+            "search_volume": 1000 + i * 7,
+            "low_top_of_page_bid": 0.5,
+            "high_top_of_page_bid": 2.1,
+            "cpc": 1.2,
+            "monthly_searches": monthly,
+        })
+
+    response = {
+        "version": "0.1.20250101",
+        "status_code": 20000,
+        "status_message": "Ok.",
+        "time": "1.2 sec.",
+        "cost": 0.075,
+        "tasks_count": 1,
+        "tasks_error": 0,
+        "tasks": [{
+            "id": "01010101-0000-0000-0000-000000000000",
+            "status_code": 20000,
+            "status_message": "Ok.",
+            "time": "1.1 sec.",
+            "cost": 0.075,
+            "result_count": len(rows),
+            "path": ["v3", "keywords_data", "google", "search_volume", "live"],
+            "data": {"api": "keywords_data", "function": "search_volume"},
+            "result": rows,
+        }],
+    }
+    return json.dumps(response).encode()
+
+
+def legacy_decode(body: bytes) -> List[SearchVolumeResult]:
+    """Decode the way the client did before typed decoding."""
+    response = json.loads(body)
+    results = []
+    for task in response.get("tasks") or []:
+        for row in task.get("result") or []:
+            if "keyword" in row and "search_volume" in row:
+                results.append(SearchVolumeResult(
+                    keyword=row["keyword"],
+                    search_volume=row["search_volume"],
+                    monthly_searches=row.get("monthly_searches", []),
+                    location_code=row.get("location_code"),
+                    language_code=row.get("language_code"),
+                    use_clickstream=row.get("use_clickstream", True)
+                ))
+    return results
+
+
+def typed_decode(body: bytes) -> List[SearchVolumeResult]:
+    """Decode the way the client does now."""
+    response = decode_response(body, lazy_results=True)
+    results = []
+    for task in response["tasks"]:
+        results.extend(SearchVolumeResult.from_row(row) for row in _search_volume_rows(task))
+    return results
+
+
+def time_it(func: Callable[[bytes], Any], body: bytes, repeat: int) -> Dict[str, float]:
+    """Run ``func`` ``repeat`` times and return best and mean seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    return {"best": min(timings), "mean": sum(timings) / len(timings)}
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by the object ``build`` returns."""
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark search volume response decoding")
+    parser.add_argument("--keywords", type=int, default=1000, help="Keywords in the response")
+    parser.add_argument("--months", type=int, default=12, help="Monthly data points per keyword")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per decoder")
+    args = parser.parse_args()
+
+    body = build_response(args.keywords, args.months)
+    assert legacy_decode(body) == typed_decode(body), "Decoders disagree"
+
+    print(f"Response: {args.keywords} keywords x {args.months} months, {len(body) / 1024:.0f} KiB")
+    baseline = None
+    for name, func in (("json + dict walk", legacy_decode), ("msgspec typed", typed_decode)):
+        stats = time_it(func, body, args.repeat)
+        baseline = baseline or stats["best"]
+        print(
+            f"  {name:<18} best {stats['best'] * 1000:7.2f} ms  "
+            f"mean {stats['mean'] * 1000:7.2f} ms  "
+            f"{args.keywords / stats['best']:>10,.0f} keywords/s  "
+            f"x{baseline / stats['best']:.1f}"
+        )
+
+    monthly = [row["monthly_searches"] for row in json.loads(body)["tasks"][0]["result"]]
+    dict_bytes = retained_bytes(lambda: [[dict(month) for month in months] for months in monthly])
+    series_bytes = retained_bytes(lambda: [MonthlySeries.from_api(months) for months in monthly])
+    print(
+        f"Monthly breakdown per keyword: list of dicts {dict_bytes / args.keywords:.0f} B, "
+        f"MonthlySeries {series_bytes / args.keywords:.0f} B (x{dict_bytes / series_bytes:.1f} smaller)"
+    )
+
+
+if __name__ == "__main__":
+    main()
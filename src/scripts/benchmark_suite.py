@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the search volume pipeline.
+
+Runs entirely locally: DataForSEO is replaced by MockDataForSEOServer and
+Firestore by an in-memory fake (with a per-RPC latency; the async variant by
+default, like the updaters), so numbers reflect
+this code rather than the network or account limits. Cases:
+
+- decode: response decode and SearchVolumeResult construction throughput
+- e2e:N: FirestoreKeywordUpdater.get_monthly_search_volumes for N keywords
+- firestore:N: FirestoreKeywordUpdater.update_firestore_with_volumes for N documents
+- pipeline:N: FirestoreKeywordUpdater.run_pipeline, Firestore -> API -> Firestore, for N documents
+- scan:N: fetch_keywords_from_firestore against streaming N whole documents
+- trends:N: TrendsNormalizer for N keywords, anchored below nearly all of
+  them; fails if most keywords end up imprecise
+
+Each case runs in its own process so its peak RSS is its own. Results are
+written to data/benchmarks/ as JSON; pass --compare with an earlier file to
+see the change.
+
+Usage:
+    python benchmark_suite.py
+    python benchmark_suite.py --e2e 1000 10000 --firestore 1000 --compare data/benchmarks/<earlier>.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent path to sys.path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.dataforseo_client import SearchVolumeResult, _search_volume_rows
+from utils.decoding import decode_response
+from utils.async_firestore import stream_query
+from utils.firestore_fake import AsyncInMemoryFirestore, InMemoryFirestore
+from utils.mock_server import (
+    MockBehavior,
+    MockDataForSEOServer,
+    synthetic_interest,
+    synthetic_monthly_searches,
+    synthetic_volume
+)
+from utils.trends_client import GoogleTrendsClient
+from utils.trends_normalizer import TrendsNormalizer
+from utils.monthly_series import LONG, MonthlySeries
+from scripts.benchmark_response_decoding import build_response
+
+
+RESULTS_DIR = Path(__file__).parent.parent.parent / "data" / "benchmarks"
+COLLECTION = "dataforseo_keywords"
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_keywords(count: int) -> List[str]:
+    """Deterministic keyword list; about 1 in 20 needs cleaning before the API call."""
+    suffixes = [".AI", ", Inc.", ".io", ".com"]
+    return [
+        f"benchmark product {i}{suffixes[i // 20 % len(suffixes)]}" if i % 20 == 0 else f"benchmark product {i}"
+        for i in range(count)
+    ]
+
+
+def best_of(func, repeat: int) -> float:
+    """Best of ``repeat`` runs, with the collector off as in timeit."""
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+def bench_decode(args) -> Dict[str, Any]:
+    """Typed decode of a search_volume response, then SearchVolumeResult construction."""
+    body = build_response(args.decode_keywords, 12)
+    rows = []
+
+    def decode():
+        rows.clear()
+        for task in decode_response(body, lazy_results=True)["tasks"]:
+            rows.extend(_search_volume_rows(task))
+
+    decode_seconds = best_of(decode, args.repeat)
+    construct_seconds = best_of(lambda: [SearchVolumeResult.from_row(row) for row in rows], args.repeat)
+    keywords = args.decode_keywords
+    return {
+        "keywords": keywords,
+        "response_kib": round(len(body) / 1024, 1),
+        "decode_seconds": decode_seconds,
+        "construct_seconds": construct_seconds,
+        "decode_keywords_per_second": keywords / decode_seconds,
+        "construct_keywords_per_second": keywords / construct_seconds,
+        "total_keywords_per_second": keywords / (decode_seconds + construct_seconds),
+    }
+
+
+def load_updater():
+    """Import the updater script with logging quietened and config pointed at local fakes."""
+    import logging
+    from config.config import Config
+    from scripts.update_firestore_search_volumes_clean import FirestoreKeywordUpdater
+
+    logging.getLogger().setLevel(logging.WARNING)
+    Config.DATAFORSEO_LOGIN_DECODED = "benchmark"
+    Config.DATAFORSEO_PASSWORD_DECODED = "benchmark"
+    # No cache (every run must hit the API) and the account's real request ceiling
+    Config.DATAFORSEO_CACHE_PATH = ""
+    Config.DATAFORSEO_RATE_LIMIT = 2000
+    return Config, FirestoreKeywordUpdater
+
+
+async def bench_e2e(count: int, args) -> Dict[str, Any]:
+    """get_monthly_search_volumes against the mock API."""
+    Config, FirestoreKeywordUpdater = load_updater()
+    behavior = MockBehavior(
+        latency=args.api_latency,
+        latency_per_keyword=args.api_latency_per_keyword,
+        seed=args.seed
+    )
+    keywords = make_keywords(count)
+    async with MockDataForSEOServer(port=0, behavior=behavior) as server:
+        Config.DATAFORSEO_BASE_URL = server.url
+        updater = FirestoreKeywordUpdater(db=InMemoryFirestore())
+        start = time.perf_counter()
+        volumes = await updater.get_monthly_search_volumes(keywords)
+        seconds = time.perf_counter() - start
+    return {
+        "keywords": count,
+        "results": len(volumes),
+        "seconds": seconds,
+        "keywords_per_second": count / seconds,
+        "api_requests": server.stats.requests,
+        "api_tasks": server.stats.tasks,
+        "api_cost": round(server.stats.cost, 4),
+    }
+
+
+def synthetic_volumes(keywords: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Search volume records as get_monthly_search_volumes returns them."""
+    updated = datetime.now().isoformat()
+    volumes = {}
+    for keyword in keywords:
+        volume = synthetic_volume(keyword)
+        series = MonthlySeries.from_api(synthetic_monthly_searches(keyword, volume))
+        volumes[keyword] = {
+            "search_volume": series.as_dict(LONG),
+            "total_volume": volume,
+            "last_updated": updated,
+            "cleaned_keyword": None,
+        }
+    return volumes
+
+
+def seeded_firestore(keywords: List[str], args, with_volumes: bool = False) -> InMemoryFirestore:
+    """Fake Firestore holding one document per keyword, optionally already carrying volumes."""
+    fake = AsyncInMemoryFirestore if args.firestore_client == "async" else InMemoryFirestore
+    db = fake(rpc_latency=args.firestore_latency, write_latency=args.firestore_write_latency)
+    volumes = synthetic_volumes(keywords) if with_volumes else {}
+    documents = {}
+    for i, keyword in enumerate(keywords):
+        document = {"keyword": keyword}
+        if keyword in volumes:
+            document.update(
+                search_volume=volumes[keyword]["search_volume"],
+                total_search_volume=volumes[keyword]["total_volume"],
+                search_volume_updated=volumes[keyword]["last_updated"]
+            )
+        # Most documents are keyed by keyword; a few only carry it in a field
+        documents[f"doc-{i}" if i % 50 == 1 else keyword] = document
+    db.seed(COLLECTION, documents)
+    return db
+
+
+def bench_firestore(count: int, args) -> Dict[str, Any]:
+    """update_firestore_with_volumes into a seeded in-memory Firestore."""
+    Config, FirestoreKeywordUpdater = load_updater()
+    Config.FIRESTORE_INITIAL_WRITE_RATE = args.firestore_write_rate
+    keywords = make_keywords(count)
+    db = seeded_firestore(keywords, args)
+    volumes = synthetic_volumes(keywords)
+
+    updater = FirestoreKeywordUpdater(db=db)
+    start = time.perf_counter()
+    asyncio.run(updater.update_firestore_with_volumes(volumes, collection_name=COLLECTION))
+    seconds = time.perf_counter() - start
+
+    written = sum(1 for data in db.documents(COLLECTION).values() if "search_volume" in data)
+    return {
+        "documents": count,
+        "updated": written,
+        "seconds": seconds,
+        "documents_per_second": count / seconds,
+        "rpc_latency": args.firestore_latency,
+        "write_latency": args.firestore_write_latency,
+        "initial_write_rate": args.firestore_write_rate,
+        "client": args.firestore_client,
+        "commits": db.stats["rpcs_commit"],
+        "rpcs": db.stats["rpcs"],
+        "reads": db.stats["reads"],
+        "writes": db.stats["writes"],
+    }
+
+
+async def bench_pipeline(count: int, args) -> Dict[str, Any]:
+    """run_pipeline from a seeded in-memory Firestore through the mock API and back."""
+    Config, FirestoreKeywordUpdater = load_updater()
+    Config.FIRESTORE_INITIAL_WRITE_RATE = args.firestore_write_rate
+    # A re-run: documents already hold volumes, so writes replace data rather
+    # than grow the fake
+    db = seeded_firestore(make_keywords(count), args, with_volumes=True)
+    behavior = MockBehavior(
+        latency=args.api_latency,
+        latency_per_keyword=args.api_latency_per_keyword,
+        seed=args.seed
+    )
+
+    first_write = None
+    async def watch_writes(start: float) -> None:
+        nonlocal first_write
+        while not db.stats["rpcs_commit"]:
+            await asyncio.sleep(0.005)
+        first_write = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        async with MockDataForSEOServer(port=0, behavior=behavior) as server:
+            Config.DATAFORSEO_BASE_URL = server.url
+            updater = FirestoreKeywordUpdater(db=db)
+            start = time.perf_counter()
+            watcher = asyncio.ensure_future(watch_writes(start))
+            summary = await updater.run_pipeline(Path(directory) / "volumes.json", collection_name=COLLECTION)
+            seconds = time.perf_counter() - start
+            watcher.cancel()
+
+    return {
+        "documents": count,
+        "updated": summary.write_stats.written,
+        "seconds": seconds,
+        "documents_per_second": count / seconds,
+        "first_write_seconds": round(first_write, 3) if first_write is not None else None,
+        "api_requests": server.stats.requests,
+        "commits": db.stats["rpcs_commit"],
+    }
+
+
+async def bench_scan(count: int, args) -> Dict[str, Any]:
+    """Keyword list loading: projected, paged, partitioned scan against whole documents."""
+    Config, FirestoreKeywordUpdater = load_updater()
+    db = seeded_firestore(make_keywords(count), args, with_volumes=True)
+
+    # What a plain collection stream costs: every field of every document
+    start = time.perf_counter()
+    streamed = 0
+    async for _ in stream_query(db, db.collection(COLLECTION)):
+        streamed += 1
+    full_seconds = time.perf_counter() - start
+    full = dict(db.stats)
+    db.stats.clear()
+
+    updater = FirestoreKeywordUpdater(db=db)
+    start = time.perf_counter()
+    keywords = await updater.fetch_keywords_from_firestore(COLLECTION)
+    seconds = time.perf_counter() - start
+
+    return {
+        "documents": count,
+        "keywords": len(keywords),
+        "seconds": seconds,
+        "keywords_per_second": count / seconds,
+        "bytes_read": db.stats["bytes_read"],
+        "rpcs": db.stats["rpcs"],
+        "page_size": Config.FIRESTORE_READ_PAGE_SIZE,
+        "partitions": Config.FIRESTORE_READ_PARTITIONS,
+        "full_seconds": full_seconds,
+        "full_bytes_read": full["bytes_read"],
+        "full_rpcs": full["rpcs"],
+        "bytes_fraction": round(db.stats["bytes_read"] / full["bytes_read"], 4) if full.get("bytes_read") else None,
+    }
+
+
+async def bench_trends(count: int, args) -> Dict[str, Any]:
+    """TrendsNormalizer against the mock API, with an anchor far below most keywords."""
+    keywords = make_keywords(count)
+    # 5th percentile by interest: most keywords are too far above it to measure in one step
+    ranked = sorted(keywords, key=lambda keyword: synthetic_interest(keyword, time.time()))
+    anchor = ranked[len(ranked) // 20]
+    behavior = MockBehavior(
+        latency=args.api_latency,
+        latency_per_keyword=args.api_latency_per_keyword,
+        seed=args.seed
+    )
+    async with MockDataForSEOServer(port=0, behavior=behavior) as server:
+        async with GoogleTrendsClient("benchmark", "benchmark", base_url=server.url, trends_rate_limit=2000) as trends:
+            start = time.perf_counter()
+            normalized = await TrendsNormalizer(trends).normalize(keywords, anchor=anchor)
+            seconds = time.perf_counter() - start
+
+    imprecise = sum(1 for keyword in normalized.keywords if not normalized.is_precise(keyword))
+    if imprecise > len(normalized.keywords) / 2:
+        raise RuntimeError(f"{imprecise} of {len(normalized.keywords)} keywords imprecise; bridging is not working")
+    return {
+        "keywords": count,
+        "imprecise": imprecise,
+        "seconds": seconds,
+        "keywords_per_second": count / seconds,
+        "api_requests": server.stats.requests,
+    }
+
+
+def run_case(case: str, args) -> Dict[str, Any]:
+    """Run one case in this process."""
+    kind, _, size = case.partition(":")
+    if kind == "decode":
+        result = bench_decode(args)
+    elif kind == "e2e":
+        result = asyncio.run(bench_e2e(int(size), args))
+    elif kind == "firestore":
+        result = bench_firestore(int(size), args)
+    elif kind == "pipeline":
+        result = asyncio.run(bench_pipeline(int(size), args))
+    elif kind == "scan":
+        result = asyncio.run(bench_scan(int(size), args))
+    elif kind == "trends":
+        result = asyncio.run(bench_trends(int(size), args))
+    else:
+        raise ValueError(f"Unknown case: {case}")
+    result["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return result
+
+
+def forwarded_args(args) -> List[str]:
+    return [
+        "--repeat", str(args.repeat),
+        "--decode-keywords", str(args.decode_keywords),
+        "--api-latency", str(args.api_latency),
+        "--api-latency-per-keyword", str(args.api_latency_per_keyword),
+        "--firestore-latency", str(args.firestore_latency),
+        "--firestore-write-latency", str(args.firestore_write_latency),
+        "--firestore-write-rate", str(args.firestore_write_rate),
+        "--firestore-client", args.firestore_client,
+        "--seed", str(args.seed),
+    ]
+
+
+def run_isolated(case: str, args) -> Dict[str, Any]:
+    """Run one case in a fresh interpreter and return its result."""
+    completed = subprocess.run(
+        [sys.executable, __file__, "--case", case, *forwarded_args(args)],
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).parent, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], previous_path: str) -> None:
+    """Print throughput and memory changes against an earlier run."""
+    with open(previous_path, "r") as f:
+        previous = json.load(f)
+    print(f"\nCompared with {previous_path} ({previous.get('commit')}, {previous.get('timestamp')}):")
+    for case, result in current["cases"].items():
+        before = previous.get("cases", {}).get(case)
+        if not before or "error" in result or "error" in before:
+            continue
+        for metric, value in result.items():
+            if not (metric.endswith("per_second") or metric == "peak_rss_mb") or not before.get(metric):
+                continue
+            change = (value / before[metric] - 1) * 100
+            print(f"  {case:<16} {metric:<32} {before[metric]:>14,.1f} -> {value:>14,.1f} ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the search volume pipeline")
+    parser.add_argument("--e2e", type=int, nargs="*", default=[1000, 10000, 100000], help="Keyword counts for end-to-end runs")
+    parser.add_argument("--firestore", type=int, nargs="*", default=[1000, 10000], help="Document counts for Firestore updates")
+    parser.add_argument("--pipeline", type=int, nargs="*", default=[10000], help="Document counts for streaming pipeline runs")
+    parser.add_argument("--scan", type=int, nargs="*", default=[10000], help="Document counts for keyword scans")
+    parser.add_argument("--trends", type=int, nargs="*", default=[100], help="Keyword counts for trends normalization")
+    parser.add_argument("--skip-decode", action="store_true", help="Skip the decode case")
+    parser.add_argument("--decode-keywords", type=int, default=1000, help="Keywords per decoded response")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per decode measurement")
+    parser.add_argument("--api-latency", type=float, default=0.05, help="Mock API median seconds per request")
+    parser.add_argument("--api-latency-per-keyword", type=float, default=0.0005, help="Mock API extra seconds per keyword")
+    parser.add_argument("--firestore-latency", type=float, default=0.002, help="Fake Firestore seconds per RPC")
+    parser.add_argument("--firestore-write-latency", type=float, default=0.0001, help="Fake Firestore extra seconds per document written")
+    parser.add_argument("--firestore-write-rate", type=float, default=0, help="Writer ramp-up start in writes/s (0 = unthrottled, measures the writer itself)")
+    parser.add_argument("--firestore-client", choices=["async", "sync"], default="async", help="Fake Firestore client flavour")
+    parser.add_argument("--seed", type=int, default=1, help="Mock API random seed")
+    parser.add_argument("--output", help="Result file (default: data/benchmarks/benchmark_<time>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Child process: one case, result as the last stdout line
+        print(json.dumps(run_case(args.case, args)))
+        return
+
+    cases = ([] if args.skip_decode else ["decode"])
+    cases += [f"e2e:{count}" for count in args.e2e]
+    cases += [f"firestore:{count}" for count in args.firestore]
+    cases += [f"pipeline:{count}" for count in args.pipeline]
+    cases += [f"scan:{count}" for count in args.scan]
+    cases += [f"trends:{count}" for count in args.trends]
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "decode_keywords": args.decode_keywords,
+            "repeat": args.repeat,
+            "api_latency": args.api_latency,
+            "api_latency_per_keyword": args.api_latency_per_keyword,
+            "firestore_latency": args.firestore_latency,
+            "firestore_write_latency": args.firestore_write_latency,
+            "firestore_write_rate": args.firestore_write_rate,
+            "firestore_client": args.firestore_client,
+            "seed": args.seed,
+        },
+        "cases": {},
+    }
+
+    print(f"Benchmark suite ({report['commit']}, Python {report['python']})")
+    print("=" * 60)
+    for case in cases:
+        result = run_isolated(case, args)
+        report["cases"][case] = result
+        if "error" in result:
+            print(f"  {case:<16} FAILED: {result['error']}")
+            continue
+        rate = next((f"{value:>12,.0f} {metric.replace('_per_second', '')}/s"
+                     for metric, value in result.items() if metric.endswith("per_second")), "")
+        print(f"  {case:<16} {rate}  peak RSS {result['peak_rss_mb']:.0f} MB")
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
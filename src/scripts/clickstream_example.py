@@ -211,7 +211,8 @@ async def main():
     async with DataForSEOClient(
         login=Config.DATAFORSEO_LOGIN_DECODED,
         password=Config.DATAFORSEO_PASSWORD_DECODED,
-        rate_limit=Config.DATAFORSEO_RATE_LIMIT
+        rate_limit=Config.DATAFORSEO_RATE_LIMIT,
+        base_url=Config.DATAFORSEO_BASE_URL
     ) as client:
         
         # Analyze for US market
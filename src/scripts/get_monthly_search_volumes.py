@@ -37,6 +37,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.dataforseo_client import DataForSEOClient, DataForSEOError
+from utils.monthly_series import ISO
 from config.config import Config
 
 
@@ -69,70 +70,42 @@ async def get_monthly_volumes_for_keywords(
     
     results = {}
     
-    async with DataForSEOClient(
-        login=Config.DATAFORSEO_LOGIN_DECODED,
-        password=Config.DATAFORSEO_PASSWORD_DECODED,
-        rate_limit=Config.DATAFORSEO_RATE_LIMIT
-    ) as client:
+    async with DataForSEOClient.from_config(Config) as client:
         
-        # Process in batches (DataForSEO recommends max 700 keywords per request)
-        batch_size = 700
-        total_batches = (len(keywords) + batch_size - 1) // batch_size
+        # Batches run concurrently under the client's rate limiter, starting
+        # at 700 keywords (DataForSEO's recommended max) and resized by
+        # observed latency; batches that time out are split and retried
         
-        for i in range(0, len(keywords), batch_size):
-            batch = keywords[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} keywords)")
-            
-            try:
-                # Get search volume data
-                search_results = await client.get_search_volume(
-                    keywords=batch,
-                    location_name=location_name,
-                    language_name=language_name,
-                    use_clickstream=True,
-                    tag=f"monthly_volumes_batch_{batch_num}"
-                )
+        async for batch in client.get_search_volume_many(
+            keywords=keywords,
+            location_name=location_name,
+            language_name=language_name,
+            use_clickstream=True,
+            tag_prefix="monthly_volumes_batch"
+        ):
+            if batch.error:
+                logger.error(f"API error in batch {batch.batch_number}: {batch.error}")
+                # Continue with other batches
+                continue
                 
-                # Process results
-                for result in search_results:
-                    # Convert monthly searches to dictionary format
-                    monthly_data = {}
-                    
-                    for month_data in result.monthly_searches:
-                        year = month_data.get('year')
-                        month = month_data.get('month')
-                        volume = month_data.get('search_volume', 0)
-                        
-                        if year and month:
-                            # Format as YYYY-MM
-                            month_key = f"{year}-{month:02d}"
-                            monthly_data[month_key] = volume
-                    
-                    # Store result
-                    results[result.keyword] = {
-                        "total_search_volume": result.search_volume,
-                        "monthly_breakdown": monthly_data,
-                        "location": location_name,
-                        "language": language_name,
-                        "last_updated": datetime.now().isoformat()
-                    }
-                    
-                logger.info(f"Batch {batch_num} completed: {len([r for r in batch if r in results])} keywords with data")
+            # Process results
+            for result in batch.results:
+                # Monthly breakdown keyed YYYY-MM
+                monthly_data = result.monthly_series.as_dict(ISO)
                 
-            except DataForSEOError as e:
-                logger.error(f"API error in batch {batch_num}: {e}")
-                # Continue with next batch
+                # Store result
+                results[result.keyword] = {
+                    "total_search_volume": result.search_volume,
+                    "monthly_breakdown": monthly_data,
+                    "location": location_name,
+                    "language": language_name,
+                    "last_updated": datetime.now().isoformat()
+                }
                 
-            except Exception as e:
-                logger.error(f"Unexpected error in batch {batch_num}: {e}")
-                # Continue with next batch
-            
-            # Rate limiting between batches
-            if i + batch_size < len(keywords):
-                logger.info("Waiting 5 seconds before next batch...")
-                await asyncio.sleep(5)
+            logger.info(
+                f"Batch {batch.batch_number} completed: "
+                f"{len([r for r in batch.keywords if r in results])} keywords with data"
+            )
     
     return results
 
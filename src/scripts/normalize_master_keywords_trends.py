@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Put all master keywords on one Google Trends scale using a shared anchor.
+Output format: keyword, average, precise, series
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.config.config import Config
+from src.utils.trends_client import GoogleTrendsClient
+from src.utils.trends_normalizer import TrendsNormalizer
+
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+
+
+def pick_anchor(keywords: List[str]) -> str:
+    """
+    Median keyword by search volume (from keyword_volumes.json), so as few
+    keywords as possible sit far above or below the anchor.
+    """
+    volumes_path = CONFIG_DIR / "keyword_volumes.json"
+    if volumes_path.exists():
+        with open(volumes_path, "r") as f:
+            volumes = {row["keyword"]: row["volume"] for row in json.load(f) if row.get("volume")}
+        ranked = sorted((k for k in keywords if k in volumes), key=volumes.get)
+        if ranked:
+            return ranked[len(ranked) // 2]
+    return keywords[0]
+
+
+async def main(anchor: Optional[str], days_back: int, rounds: int):
+    """Normalize master keyword trends and save results."""
+
+    print("Google Trends Master Keywords Normalizer")
+    print("=" * 60)
+
+    with open(CONFIG_DIR / "master_keywords.json", "r") as f:
+        keywords = json.load(f)["products"]
+    anchor = anchor or pick_anchor(keywords)
+
+    print(f"Loaded {len(keywords)} keywords; anchor: '{anchor}', last {days_back} days")
+
+    try:
+        Config.validate()
+    except ValueError as e:
+        print(f"❌ Configuration error: {e}")
+        return
+
+    async with GoogleTrendsClient(
+        Config.DATAFORSEO_LOGIN_DECODED,
+        Config.DATAFORSEO_PASSWORD_DECODED,
+        trends_rate_limit=Config.DATAFORSEO_TRENDS_RATE_LIMIT,
+        base_url=Config.DATAFORSEO_BASE_URL
+    ) as trends:
+        normalized = await TrendsNormalizer(trends, max_rounds=rounds).normalize(
+            keywords,
+            anchor=anchor,
+            days_back=days_back,
+            tag_prefix="master_trends"
+        )
+        cost = trends.client.metrics.total_cost
+
+    output_path = CONFIG_DIR / "keyword_trends_normalized.json"
+    with open(output_path, "w") as f:
+        json.dump({
+            "anchor": anchor,
+            "scale": "anchor average over the period = 100",
+            "dates": [day.isoformat() for day in normalized.dates()],
+            "keywords": normalized.as_dict()
+        }, f, indent=2)
+
+    print(f"\n✅ Results saved to {output_path}")
+
+    print(f"\n🏆 Top 10 keywords (anchor = 100):")
+    for i, (keyword, average) in enumerate(normalized.ranking()[:10], 1):
+        flag = "" if normalized.is_precise(keyword) else " (approximate)"
+        print(f"   {i}. {keyword}: {average:.2f}{flag}")
+
+    imprecise = sum(1 for keyword in normalized.keywords if not normalized.is_precise(keyword))
+    print(f"\n   Approximate values: {imprecise}/{len(normalized.keywords)}")
+    print(f"💰 API cost: ${cost:.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Normalize master keyword trends onto one scale")
+    parser.add_argument("--anchor", help="Keyword shared by every group (default: median by search volume)")
+    parser.add_argument("--days", type=int, default=30, help="Days to look back")
+    parser.add_argument("--rounds", type=int, default=4, help="Maximum request rounds, including bridging")
+    args = parser.parse_args()
+    asyncio.run(main(args.anchor, args.days, args.rounds))
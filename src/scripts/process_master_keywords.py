@@ -15,22 +15,17 @@ import time
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.utils.dataforseo_client import DataForSEOClient, DataForSEOError
+from src.utils.dataforseo_client import DataForSEOClient, SearchVolumeBatch
+from src.utils.budget import Budget, CostLedger
 from src.config.config import Config
 
 
-async def process_keywords_batch(
-    client: DataForSEOClient,
-    keywords: List[str],
-    location_code: int = 2840  # United States
-) -> List[Dict]:
+def format_batch_results(batch: SearchVolumeBatch) -> List[Dict]:
     """
-    Process a batch of keywords and return formatted results.
+    Format one finished batch as keyword, volume, date rows.
     
     Args:
-        client: DataForSEO client instance
-        keywords: List of keywords to process
-        location_code: Location code (default: US)
+        batch: Completed batch from DataForSEOClient.get_search_volume_many
         
     Returns:
         List of dictionaries with keyword, volume, date
@@ -38,39 +33,32 @@ async def process_keywords_batch(
     results = []
     current_date = datetime.now().strftime("%Y-%m-%d")
     
-    try:
-        # Get search volume data
-        search_results = await client.get_search_volume(
-            keywords=keywords,
-            location_code=location_code,
-            language_code="en"
-        )
-        
-        # Format results
-        for result in search_results:
+    if batch.error:
+        print(f"Error processing batch {batch.batch_number}: {batch.error}")
+        # Add all keywords with error status
+        for keyword in batch.keywords:
             results.append({
-                "keyword": result.keyword,
-                "volume": result.search_volume if result.search_volume is not None else 0,
+                "keyword": keyword,
+                "volume": -1,  # -1 indicates error
                 "date": current_date
             })
-            
-        # Add missing keywords with 0 volume
-        found_keywords = {r.keyword.lower() for r in search_results}
-        for keyword in keywords:
-            if keyword.lower() not in found_keywords:
-                results.append({
-                    "keyword": keyword,
-                    "volume": 0,
-                    "date": current_date
-                })
-                
-    except DataForSEOError as e:
-        print(f"Error processing batch: {e}")
-        # Add all keywords with error status
-        for keyword in keywords:
+        return results
+        
+    # Format results
+    for result in batch.results:
+        results.append({
+            "keyword": result.keyword,
+            "volume": result.search_volume if result.search_volume is not None else 0,
+            "date": current_date
+        })
+        
+    # Add missing keywords with 0 volume
+    found_keywords = {r.keyword.lower() for r in batch.results}
+    for keyword in batch.keywords:
+        if keyword.lower() not in found_keywords:
             results.append({
                 "keyword": keyword,
-                "volume": -1,  # -1 indicates error
+                "volume": 0,
                 "date": current_date
             })
     
@@ -102,38 +90,40 @@ async def main():
     # Initialize results
     all_results = []
     
-    # Process keywords in batches
-    # DataForSEO allows up to 700 keywords per request
-    batch_size = 100  # Conservative batch size
-    total_batches = (len(keywords) + batch_size - 1) // batch_size
+    # Batch size and live/queued mode are chosen to fit the budget
+    budget = Budget(
+        per_run=Config.DATAFORSEO_BUDGET_PER_RUN,
+        per_day=Config.DATAFORSEO_BUDGET_PER_DAY
+    )
+    ledger = CostLedger(Config.DATAFORSEO_COST_LEDGER_PATH)
     
-    async with DataForSEOClient(
-        login=Config.DATAFORSEO_LOGIN_DECODED,
-        password=Config.DATAFORSEO_PASSWORD_DECODED,
-        rate_limit=Config.DATAFORSEO_RATE_LIMIT
-    ) as client:
+    async with DataForSEOClient.from_config(Config) as client:
         
+        plan = client.plan_search_volume(
+            len(keywords),
+            budget,
+            ledger,
+            prefer_queued=Config.DATAFORSEO_PREFER_QUEUED
+        )
+        total_batches = plan.tasks
+        print(f"\nPlan: {plan}")
         print(f"\nProcessing {total_batches} batches...")
         
-        for i in range(0, len(keywords), batch_size):
-            batch_num = (i // batch_size) + 1
-            batch = keywords[i:i + batch_size]
-            
-            print(f"\nBatch {batch_num}/{total_batches}: Processing {len(batch)} keywords...")
-            
-            # Process batch
-            batch_results = await process_keywords_batch(client, batch)
-            all_results.extend(batch_results)
+        processed = 0
+        async for batch in client.get_search_volume_planned(
+            keywords,
+            plan,
+            location_code=2840,  # United States
+            language_code="en",
+            tag_prefix="master_keywords",
+            ledger=ledger
+        ):
+            all_results.extend(format_batch_results(batch))
             
             # Show progress
-            processed = min(i + batch_size, len(keywords))
-            print(f"Progress: {processed}/{len(keywords)} keywords processed")
-            
-            # Rate limiting - wait between batches
-            if batch_num < total_batches:
-                wait_time = 5  # 5 seconds between batches
-                print(f"Waiting {wait_time} seconds before next batch...")
-                await asyncio.sleep(wait_time)
+            processed += len(batch.keywords)
+            print(f"Batch {batch.batch_number}/{total_batches} done - "
+                  f"Progress: {processed}/{len(keywords)} keywords processed")
     
     # Save results
     output_path = Path("/workspace/dataforseo_app/config/keyword_volumes.json")
@@ -170,9 +160,11 @@ async def main():
         for i, kw in enumerate(top_keywords, 1):
             print(f"   {i}. {kw['keyword']}: {kw['volume']:,}")
     
-    # Estimate cost
-    estimated_cost = total_batches * 0.075  # $0.075 per request
-    print(f"\n💰 Estimated API cost: ${estimated_cost:.2f}")
+    # Cost as billed by the API (cached keywords cost nothing)
+    print(f"\n💰 API cost: ${client.metrics.total_cost:.4f} (planned ${plan.estimated_cost:.2f})")
+    if plan.skipped:
+        print(f"   {plan.skipped} keywords skipped to stay within budget")
+    print(f"   Spent today: ${ledger.spent():.4f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Run a local mock of the DataForSEO API for offline load and regression tests.
+Point scripts at it with DATAFORSEO_BASE_URL=http://127.0.0.1:8787/v3
+(any credentials are accepted).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.utils.mock_server import MockBehavior, MockDataForSEOServer
+
+
+async def main(args):
+    """Serve until interrupted, printing what was served every interval."""
+    behavior = MockBehavior(
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        latency_per_keyword=args.latency_per_keyword,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        throttle_rate=args.throttle_rate,
+        task_error_rate=args.task_error_rate,
+        requests_per_minute=args.requests_per_minute or None,
+        max_simultaneous=args.max_simultaneous or None,
+        queue_delay=args.queue_delay,
+        seed=args.seed
+    )
+    recordings = MockDataForSEOServer.load_recordings(args.recordings) if args.recordings else None
+
+    async with MockDataForSEOServer(args.host, args.port, behavior, recordings, compress=args.gzip) as server:
+        print(f"Mock DataForSEO API at {server.url}")
+        print(f"  export DATAFORSEO_BASE_URL={server.url}")
+        if recordings:
+            print(f"  Serving {len(recordings)} recorded endpoints from {args.recordings}")
+        try:
+            while True:
+                await asyncio.sleep(args.report)
+                print(json.dumps(server.stats.to_dict()))
+        except asyncio.CancelledError:
+            pass
+        print(f"\nFinal stats: {json.dumps(server.stats.to_dict(), indent=2)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock DataForSEO API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=0.05, help="Median seconds per request")
+    parser.add_argument("--latency-sigma", type=float, default=0.3, help="Log-normal spread (0 = constant)")
+    parser.add_argument("--latency-per-keyword", type=float, default=0.0, help="Extra seconds per keyword in the largest task")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 504")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 40202")
+    parser.add_argument("--task-error-rate", type=float, default=0.0, help="Fraction of tasks failing with 50000")
+    parser.add_argument("--requests-per-minute", type=int, default=2000, help="Account rate limit (0 = none)")
+    parser.add_argument("--max-simultaneous", type=int, default=30, help="Simultaneous request limit (0 = none)")
+    parser.add_argument("--queue-delay", type=float, default=1.0, help="Seconds until a task_post task is ready")
+    parser.add_argument("--recordings", help="Directory of recorded responses to serve instead of synthetic ones")
+    parser.add_argument("--gzip", action="store_true", help="Gzip responses")
+    parser.add_argument("--seed", type=int, help="Random seed for latency and failures")
+    parser.add_argument("--report", type=float, default=30.0, help="Seconds between stats lines")
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -4,77 +4,34 @@ Demonstrate how time period affects Google Trends scaling.
 """
 
 import asyncio
-import aiohttp
-import base64
-from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.config.config import Config
+from src.utils.monthly_series import MISSING
+from src.utils.trends_client import GoogleTrendsClient, TrendsSeries, date_range
 
 
-async def test_trends_timeperiod(keyword: str, days: int):
-    """Test Google Trends with different time periods."""
-    
-    auth = base64.b64encode(f"{Config.DATAFORSEO_LOGIN_DECODED}:{Config.DATAFORSEO_PASSWORD_DECODED}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth}",
-        "Content-Type": "application/json"
-    }
-    
-    date_to = datetime.now()
-    date_from = date_to - timedelta(days=days)
-    
-    payload = [{
-        "keywords": [keyword],
-        "location_code": 2840,
-        "language_code": "en",
-        "date_from": date_from.strftime("%Y-%m-%d"),
-        "date_to": date_to.strftime("%Y-%m-%d")
-    }]
-    
-    print(f"\nTime period: Last {days} days ({date_from.strftime('%Y-%m-%d')} to {date_to.strftime('%Y-%m-%d')})")
+def print_timeperiod(keyword: str, days: int, series: TrendsSeries):
+    """Print the scale of one keyword over one time period."""
+    date_from, date_to = date_range(days_back=days)
+    print(f"\nTime period: Last {days} days ({date_from} to {date_to})")
     print("-" * 60)
     
-    async with aiohttp.ClientSession() as session:
-        url = "https://api.dataforseo.com/v3/keywords_data/google_trends/explore/live"
+    print(f"Average value: {series.average(keyword) or 0}")
+    
+    # Get min/max from data
+    values = [value for value in series.series(keyword) if value != MISSING]
+    if values:
+        print(f"Peak value: {max(values)} (this will always be scaled to ~100)")
+        print(f"Lowest value: {min(values)}")
+        print(f"Today's value: {values[-1]}")
         
-        async with session.post(url, json=payload, headers=headers) as response:
-            result = await response.json()
-            
-            if result.get("status_code") == 20000:
-                tasks = result.get("tasks", [])
-                if tasks and tasks[0].get("status_code") == 20000:
-                    task_result = tasks[0].get("result", [])
-                    if task_result and "items" in task_result[0]:
-                        item = task_result[0]["items"][0]
-                        
-                        # Get average
-                        if "averages" in item:
-                            avg = item["averages"][0] if isinstance(item["averages"][0], (int, float)) else 0
-                            print(f"Average value: {avg}")
-                        
-                        # Get min/max from data
-                        if "data" in item:
-                            values = []
-                            for point in item["data"]:
-                                vals = point.get("values", [])
-                                if vals:
-                                    val = vals[0] if isinstance(vals[0], (int, float)) else 0
-                                    values.append(val)
-                            
-                            if values:
-                                print(f"Peak value: {max(values)} (this will always be scaled to ~100)")
-                                print(f"Lowest value: {min(values)}")
-                                print(f"Today's value: {values[-1] if values else 'N/A'}")
-                                
-                                # Show sample of values
-                                print(f"\nSample values (last 5 days):")
-                                for i, point in enumerate(item["data"][-5:]):
-                                    date = point.get("date_from", "")
-                                    val = point.get("values", [0])[0]
-                                    print(f"  {date}: {val}")
+        # Show sample of values
+        print(f"\nSample values (last 5 days):")
+        for day, value in list(zip(series.dates(), series.series(keyword)))[-5:]:
+            print(f"  {day}: {max(value, 0)}")
 
 
 async def main():
@@ -86,10 +43,20 @@ async def main():
     print("\nNOTE: The peak in each time period will be scaled to 100,")
     print("so the same date can have different values in different periods!")
     
-    # Test different time periods
-    for days in [7, 30, 90, 365]:
-        await test_trends_timeperiod("chatgpt", days)
-        await asyncio.sleep(2)
+    periods = [7, 30, 90, 365]
+    async with GoogleTrendsClient(
+        Config.DATAFORSEO_LOGIN_DECODED,
+        Config.DATAFORSEO_PASSWORD_DECODED,
+        trends_rate_limit=Config.DATAFORSEO_TRENDS_RATE_LIMIT,
+        base_url=Config.DATAFORSEO_BASE_URL
+    ) as trends:
+        # Test different time periods concurrently
+        results = await asyncio.gather(*(
+            trends.explore(["chatgpt"], days_back=days) for days in periods
+        ))
+        
+    for days, series in zip(periods, results):
+        print_timeperiod("chatgpt", days, series)
     
     print("\n" + "=" * 60)
     print("KEY INSIGHTS:")
@@ -102,4 +69,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Daily Google Trends tracking: fetch only what changed since the last run
+and keep every group's history on one scale.
+Run once a day; re-running the same day makes no requests.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.config.config import Config
+from src.utils.trends_client import GoogleTrendsClient
+from src.utils.trends_tracker import TrendsSnapshotStore, TrendsTracker
+
+
+DEFAULT_GROUP = ["chatgpt", "claude", "gemini", "copilot", "perplexity"]
+
+
+async def main(keywords, days_shown: int, rebuild: bool):
+    """Update the tracked group and print its recent history."""
+
+    print("Daily Google Trends Tracking")
+    print("=" * 60)
+
+    store = TrendsSnapshotStore(Config.TRENDS_TRACKING_PATH)
+    if rebuild:
+        meta = store.rebuild(keywords)
+        print(f"Rebuilt history from snapshots: {meta.days} days from {meta.start}")
+
+    try:
+        Config.validate()
+    except ValueError as e:
+        print(f"❌ Configuration error: {e}")
+        return
+
+    async with GoogleTrendsClient(
+        Config.DATAFORSEO_LOGIN_DECODED,
+        Config.DATAFORSEO_PASSWORD_DECODED,
+        trends_rate_limit=Config.DATAFORSEO_TRENDS_RATE_LIMIT,
+        base_url=Config.DATAFORSEO_BASE_URL
+    ) as trends:
+        tracker = TrendsTracker(trends, store)
+        snapshot = (await tracker.update([keywords]))[tuple(keywords)]
+        cost = trends.client.metrics.total_cost
+
+    if snapshot is None:
+        print("\nNo new snapshot (already updated today, or the request failed)")
+    else:
+        print(f"\n✅ Fetched {snapshot.date_from} to {snapshot.date_to} "
+              f"({len(snapshot.days)} days, scale factor {snapshot.factor:.3f})")
+
+    history = tracker.history(keywords, start=date.today() - timedelta(days=days_shown - 1))
+    print(f"\n{'Date':<12}" + "".join(f"{keyword[:10]:>12}" for keyword in keywords))
+    for day, values in history.as_dict().items():
+        print(f"{day:<12}" + "".join(
+            f"{'-' if values[keyword] is None else f'{values[keyword]:.1f}':>12}" for keyword in keywords
+        ))
+
+    print(f"\n📁 Store: {store.group_dir(keywords)}")
+    print(f"💰 API cost: ${cost:.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally track daily Google Trends for a keyword group")
+    parser.add_argument("keywords", nargs="*", default=DEFAULT_GROUP, help="Up to 5 keywords (default: AI assistants)")
+    parser.add_argument("--show", type=int, default=14, help="Days of history to print")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the history from stored snapshots first")
+    args = parser.parse_args()
+    asyncio.run(main(args.keywords, args.show, args.rebuild))
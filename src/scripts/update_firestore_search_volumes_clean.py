@@ -3,30 +3,39 @@
 Script to fetch keywords from Firestore and update their search volume data with monthly breakdown.
 This version cleanly handles keywords with special characters by removing/replacing them.
 
-This script:
-1. Fetches keywords from Firestore
+This script streams keywords through a pipeline of stages joined by bounded
+queues, so writes start with the first API batch and memory stays flat
+however many keywords are tracked:
+1. Reads keywords from Firestore
 2. Cleans keywords to remove invalid characters
 3. Gets monthly search volume data from DataForSEO API
-4. Outputs JSON with monthly breakdown
+4. Formats the monthly breakdown
 5. Updates Firestore with the new data
+6. Appends each result to a JSON file
 """
 
 import asyncio
+import heapq
 import json
 import os
 import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore_async
 
 # Add parent path to sys.path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.dataforseo_client import DataForSEOClient, SearchVolumeResult, DataForSEOError
+from utils.monthly_series import LONG
+from utils.async_firestore import scan_collection
+from utils.keyword_documents import KeywordDocumentIndex, KEYWORD_FIELDS
+from utils.firestore_writer import ParallelBatchWriter, WriteStats
 from config.config import Config
 
 
@@ -75,19 +84,111 @@ def setup_logging():
 logger = setup_logging()
 
 
+# Items waiting between two pipeline stages
+PIPELINE_QUEUE_SIZE = 1000
+
+# Keywords kept for the summary printouts
+SUMMARY_SIZE = 10
+
+
+@dataclass
+class KeywordItem:
+    """A keyword on its way through the pipeline"""
+    keyword: str
+    reference: Any
+    cleaned: Optional[str] = None
+
+
+@dataclass
+class PipelineSummary:
+    """Counts and top keywords of a pipeline run"""
+    keywords: int = 0
+    with_data: int = 0
+    no_data: int = 0
+    # Keywords the API returned no search volume for
+    missing: int = 0
+    # Keywords whose API batch failed
+    failed: int = 0
+    output_path: Optional[Path] = None
+    write_stats: Optional[WriteStats] = None
+    # (total volume, arrival, keyword, record) for the highest volumes seen
+    top: List[Tuple[int, int, str, Dict[str, Any]]] = field(default_factory=list)
+
+    def add(self, keyword: str, record: Dict[str, Any]) -> None:
+        if record["total_volume"] > 0:
+            self.with_data += 1
+        else:
+            self.no_data += 1
+        entry = (record["total_volume"], -(self.with_data + self.no_data), keyword, record)
+        if len(self.top) < SUMMARY_SIZE:
+            heapq.heappush(self.top, entry)
+        elif entry[0] > self.top[0][0]:
+            heapq.heapreplace(self.top, entry)
+    
+    def top_keywords(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(keyword, record) by descending total volume, first seen first on ties."""
+        return [(keyword, record) for _, _, keyword, record in sorted(self.top, reverse=True)]
+
+
+async def _run_stages(*stages) -> None:
+    """Run pipeline stages together; if one fails, cancel the others and re-raise."""
+    tasks = [asyncio.ensure_future(stage) for stage in stages]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _write_json(output_path: Path, records: asyncio.Queue) -> None:
+    """
+    File sink: stream (item, record) pairs into a JSON object keyed by keyword.
+    
+    The layout matches json.dump(..., indent=2) of the whole mapping. The
+    file is written alongside and only replaces output_path once complete.
+    """
+    output_path.parent.mkdir(exist_ok=True)
+    partial = output_path.with_name(output_path.name + ".partial")
+    count = 0
+    with open(partial, 'w') as f:
+        f.write("{")
+        while True:
+            entry = await records.get()
+            if entry is None:
+                break
+            item, record = entry
+            # One "  key: value" member of an indent=2 object
+            member = json.dumps({item.keyword: record}, indent=2)[2:-2]
+            f.write((",\n" if count else "\n") + member)
+            count += 1
+        f.write("\n}" if count else "}")
+    partial.replace(output_path)
+    logger.info(f"Saved {count} search volume records to {output_path}")
+
+
 class FirestoreKeywordUpdater:
     """Handles fetching keywords from Firestore and updating their search volumes."""
     
-    def __init__(self):
-        """Initialize Firestore client."""
-        self.db = self._initialize_firebase()
+    def __init__(self, db: Optional[firestore_async.AsyncClient] = None):
+        """
+        Initialize Firestore client.
+        
+        Args:
+            db: Existing client to use, sync or async (e.g. an InMemoryFirestore
+                for benchmarks); by default Firebase Admin is initialized from the
+                service account and an AsyncClient is used
+        """
+        self.db = db if db is not None else self._initialize_firebase()
+        # Keyword -> document reference per collection, filled by the keyword scan
+        self.document_indexes: Dict[str, KeywordDocumentIndex] = {}
         # Keep track of original to cleaned keyword mapping
         self.keyword_mapping = {}
-        # Track keywords that were modified
+        # Track keywords that were modified (the first few, and how many)
         self.modified_keywords = []
+        self.modified_count = 0
         
-    def _initialize_firebase(self) -> firestore.Client:
-        """Initialize Firebase Admin SDK."""
+    def _initialize_firebase(self) -> firestore_async.AsyncClient:
+        """Initialize Firebase Admin SDK and return an async Firestore client."""
         try:
             # Check if already initialized
             try:
@@ -114,7 +215,9 @@ class FirestoreKeywordUpdater:
                 firebase_admin.initialize_app(cred)
                 logger.info(f"Firebase initialized with: {service_account_path}")
             
-            return firestore.client()
+            # Async client, so Firestore RPCs never block the event loop the
+            # DataForSEO batches and write workers share
+            return firestore_async.client()
             
         except Exception as e:
             logger.error(f"Failed to initialize Firebase: {e}")
@@ -156,11 +259,20 @@ class FirestoreKeywordUpdater:
         
         if was_modified:
             logger.info(f"Cleaned keyword: '{original}' -> '{keyword}'")
-            self.modified_keywords.append((original, keyword))
+            self.modified_count += 1
+            if len(self.modified_keywords) < SUMMARY_SIZE:
+                self.modified_keywords.append((original, keyword))
         
         return keyword, was_modified
     
-    def fetch_keywords_from_firestore(self, collection_name: str = "dataforseo_keywords") -> List[str]:
+    @staticmethod
+    def _document_keyword(doc: Any) -> Optional[str]:
+        """Keyword a keyword document stands for."""
+        data = doc.to_dict()
+        # Handle different possible field names
+        return data.get('keyword') or data.get('name') or doc.id
+    
+    async def fetch_keywords_from_firestore(self, collection_name: str = "dataforseo_keywords") -> List[str]:
         """
         Fetch all keywords from Firestore collection.
         
@@ -172,15 +284,25 @@ class FirestoreKeywordUpdater:
         """
         try:
             keywords = []
-            docs = self.db.collection(collection_name).stream()
+            index = KeywordDocumentIndex(collection_name)
+            # Only the keyword fields, in pages read from several id ranges at once
+            docs = scan_collection(
+                self.db,
+                collection_name,
+                field_paths=KEYWORD_FIELDS,
+                page_size=Config.FIRESTORE_READ_PAGE_SIZE,
+                partitions=Config.FIRESTORE_READ_PARTITIONS
+            )
             
-            for doc in docs:
-                data = doc.to_dict()
-                # Handle different possible field names
-                keyword = data.get('keyword') or data.get('name') or doc.id
+            async for doc in docs:
+                keyword = self._document_keyword(doc)
                 if keyword:
                     keywords.append(keyword)
+                    # Remember where each keyword lives so updates need no reads
+                    index.add_snapshot(doc, keyword)
                     
+            self.document_indexes[collection_name] = index
+            
             logger.info(f"Fetched {len(keywords)} keywords from Firestore collection: {collection_name}")
             return keywords
             
@@ -188,6 +310,44 @@ class FirestoreKeywordUpdater:
             logger.error(f"Error fetching keywords from Firestore: {e}")
             raise
     
+    def _dataforseo_client(self) -> DataForSEOClient:
+        """DataForSEO client configured from Config."""
+        return DataForSEOClient.from_config(Config, max_batch_size=Config.MAX_KEYWORDS_PER_BATCH)
+    
+    def _firestore_writer(self) -> ParallelBatchWriter:
+        """Write stage configured from Config."""
+        return ParallelBatchWriter(
+            self.db,
+            max_in_flight=Config.FIRESTORE_WRITE_CONCURRENCY,
+            initial_ops_per_second=Config.FIRESTORE_INITIAL_WRITE_RATE or None
+        )
+    
+    @staticmethod
+    def _volume_record(result: SearchVolumeResult, original_keyword: str) -> Dict[str, Any]:
+        """Search volume record for one keyword as saved to JSON."""
+        return {
+            # Simple month-year format: "June 2025"
+            "search_volume": result.monthly_series.as_dict(LONG),  # Store monthly data directly as search_volume
+            "total_volume": result.search_volume or 0,  # Keep total for reference
+            "last_updated": datetime.now().isoformat(),
+            "cleaned_keyword": result.keyword if result.keyword != original_keyword else None
+        }
+    
+    @staticmethod
+    def _update_data(volume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Firestore fields for a search volume record."""
+        # Prepare the update data with the search_volume field containing monthly data
+        update_data = {
+            'search_volume': volume_data['search_volume'],  # This now contains the monthly breakdown
+            'search_volume_updated': volume_data['last_updated'],
+            'total_search_volume': volume_data['total_volume']  # Store total separately if needed
+        }
+        
+        # If we had to clean the keyword, store that info too
+        if volume_data.get('cleaned_keyword'):
+            update_data['search_volume_cleaned_keyword'] = volume_data['cleaned_keyword']
+        return update_data
+    
     async def get_monthly_search_volumes(
         self, 
         keywords: List[str],
@@ -217,78 +377,43 @@ class FirestoreKeywordUpdater:
             # Store mapping from cleaned to original
             self.keyword_mapping[cleaned] = keyword
         
-        async with DataForSEOClient(
-            login=Config.DATAFORSEO_LOGIN_DECODED,
-            password=Config.DATAFORSEO_PASSWORD_DECODED,
-            rate_limit=Config.DATAFORSEO_RATE_LIMIT
-        ) as client:
+        async with self._dataforseo_client() as client:
             
-            # Process in batches
-            batch_size = min(700, Config.MAX_KEYWORDS_PER_BATCH)  # DataForSEO recommends 700 max
+            # Batches run concurrently under the client's rate limiter, sized
+            # by observed latency; batches that time out are split and retried
+            processed = 0
             
-            for i in range(0, len(cleaned_keywords), batch_size):
-                batch = cleaned_keywords[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1}/{(len(cleaned_keywords) + batch_size - 1)//batch_size}")
-                
-                try:
-                    search_results = await client.get_search_volume(
-                        keywords=batch,
-                        location_name=location_name,
-                        language_name=language_name,
-                        use_clickstream=True,
-                        tag=f"firestore_update_batch_{i//batch_size + 1}"
-                    )
-                    
-                    for result in search_results:
-                        # Skip keywords with no search volume data
-                        if result.search_volume is None:
-                            logger.warning(f"No search volume data for keyword: {result.keyword}")
-                            continue
-                        
-                        # Get the original keyword from our mapping
-                        original_keyword = self.keyword_mapping.get(result.keyword, result.keyword)
-                            
-                        # Format monthly data with simple month-year format
-                        monthly_data = {}
-                        month_names = {
-                            1: "January", 2: "February", 3: "March", 4: "April",
-                            5: "May", 6: "June", 7: "July", 8: "August",
-                            9: "September", 10: "October", 11: "November", 12: "December"
-                        }
-                        
-                        if result.monthly_searches:  # Check if monthly_searches exists
-                            for month_data in result.monthly_searches:
-                                year = month_data.get('year')
-                                month_num = month_data.get('month')
-                                volume = month_data.get('search_volume', 0)
-                                
-                                if year and month_num and month_num in month_names:
-                                    # Simple format: "June 2025"
-                                    month_key = f"{month_names[month_num]} {year}"
-                                    monthly_data[month_key] = volume
-                        
-                        results[original_keyword] = {
-                            "search_volume": monthly_data,  # Store monthly data directly as search_volume
-                            "total_volume": result.search_volume or 0,  # Keep total for reference
-                            "last_updated": datetime.now().isoformat(),
-                            "cleaned_keyword": result.keyword if result.keyword != original_keyword else None
-                        }
-                        
-                except DataForSEOError as e:
-                    logger.error(f"API error processing batch {i//batch_size + 1}: {e}")
-                    # Continue with next batch instead of failing
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error processing batch {i//batch_size + 1}: {e}")
+            async for batch in client.get_search_volume_many(
+                keywords=cleaned_keywords,
+                location_name=location_name,
+                language_name=language_name,
+                use_clickstream=True,
+                tag_prefix="firestore_update_batch"
+            ):
+                processed += len(batch.keywords)
+                if batch.error:
+                    logger.error(f"API error processing batch {batch.batch_number}: {batch.error}")
+                    # Continue with other batches instead of failing
                     continue
+                    
+                logger.info(
+                    f"Finished batch {batch.batch_number} ({len(batch.keywords)} keywords, "
+                    f"{processed}/{len(cleaned_keywords)} processed)"
+                )
                 
-                # Add delay between batches to respect rate limits
-                if i + batch_size < len(cleaned_keywords):
-                    await asyncio.sleep(5)  # 5 second delay between batches
+                for result in batch.results:
+                    # Skip keywords with no search volume data
+                    if result.search_volume is None:
+                        logger.warning(f"No search volume data for keyword: {result.keyword}")
+                        continue
+                    
+                    # Get the original keyword from our mapping
+                    original_keyword = self.keyword_mapping.get(result.keyword, result.keyword)
+                    results[original_keyword] = self._volume_record(result, original_keyword)
         
         return results
     
-    def update_firestore_with_volumes(
+    async def update_firestore_with_volumes(
         self, 
         search_volumes: Dict[str, Dict[str, Any]], 
         collection_name: str = "dataforseo_keywords"
@@ -296,70 +421,218 @@ class FirestoreKeywordUpdater:
         """
         Update Firestore documents with search volume data in main document fields.
         
+        Writes are committed concurrently by a ParallelBatchWriter (ramping up
+        from FIRESTORE_INITIAL_WRITE_RATE writes/s, retrying contended
+        documents individually); queuing waits while its queue is full.
+        
         Args:
             search_volumes: Dictionary of search volume data
             collection_name: Firestore collection to update
         """
         try:
-            batch = self.db.batch()
-            batch_size = 0
-            max_batch_size = 500  # Firestore batch limit
-            updated_count = 0
+            # Resolve every document up front: indexed by the keyword scan, the
+            # rest in chunked get_all/'in' lookups rather than reads per keyword
+            index = self.document_indexes.get(collection_name) or KeywordDocumentIndex(collection_name)
+            self.document_indexes[collection_name] = index
+            doc_refs = await index.resolve(self.db, search_volumes.keys())
+            
+            writer = self._firestore_writer()
             skipped_count = 0
             
-            for keyword, volume_data in search_volumes.items():
-                # Prepare the update data with the search_volume field containing monthly data
-                update_data = {
-                    'search_volume': volume_data['search_volume'],  # This now contains the monthly breakdown
-                    'search_volume_updated': volume_data['last_updated'],
-                    'total_search_volume': volume_data['total_volume']  # Store total separately if needed
-                }
-                
-                # If we had to clean the keyword, store that info too
-                if volume_data.get('cleaned_keyword'):
-                    update_data['search_volume_cleaned_keyword'] = volume_data['cleaned_keyword']
-                
-                # Since dataforseo_keywords collection uses document ID as the keyword,
-                # we can directly reference the document
-                doc_ref = self.db.collection(collection_name).document(keyword)
-                
-                # Check if document exists
-                doc = doc_ref.get()
-                if doc.exists:
-                    batch.update(doc_ref, update_data)
-                    batch_size += 1
-                    updated_count += 1
-                else:
-                    # If document doesn't exist by ID, try to find by keyword field
-                    query = self.db.collection(collection_name).where('keyword', '==', keyword).limit(1)
-                    docs = list(query.stream())
-                    
-                    if docs:
-                        doc_ref = docs[0].reference
-                        batch.update(doc_ref, update_data)
-                        batch_size += 1
-                        updated_count += 1
+            async with writer:
+                for keyword, volume_data in search_volumes.items():
+                    doc_ref = doc_refs.get(keyword)
+                    if doc_ref is not None:
+                        await writer.update(doc_ref, self._update_data(volume_data))
                     else:
                         logger.warning(f"No document found for keyword: {keyword}")
                         skipped_count += 1
-                    
-                if batch_size >= max_batch_size:
-                    batch.commit()
-                    logger.info(f"Committed batch of {batch_size} updates")
-                    batch = self.db.batch()
-                    batch_size = 0
-            
-            # Commit remaining updates
-            if batch_size > 0:
-                batch.commit()
-                logger.info(f"Committed final batch of {batch_size} updates")
             
-            logger.info(f"Firestore update complete: {updated_count} documents updated, {skipped_count} skipped")
+            stats = writer.stats
+            logger.info(
+                f"Firestore update complete: {stats.written} documents updated, {skipped_count} skipped, "
+                f"{stats.failed} failed ({stats.commits} commits, {stats.retried} retries, {stats.seconds:.1f}s)"
+            )
                 
         except Exception as e:
             logger.error(f"Error updating Firestore: {e}")
             raise
 
+    async def run_pipeline(
+        self,
+        output_path: Path,
+        collection_name: str = "dataforseo_keywords",
+        location_name: str = "United States",
+        language_name: str = "English",
+        queue_size: int = PIPELINE_QUEUE_SIZE
+    ) -> PipelineSummary:
+        """
+        Stream keywords from Firestore through DataForSEO back into Firestore.
+        
+        The stages - Firestore source, normalizer, API fetcher, formatter,
+        writer and file sink - run concurrently and hand items over through
+        queues of ``queue_size``, so a slow stage holds back the ones before
+        it instead of work piling up in memory. Writes begin as soon as the
+        first API batch returns, and memory stays flat whatever the size of
+        the collection.
+        
+        Args:
+            output_path: JSON file the results are streamed into
+            collection_name: Firestore collection containing keywords
+            location_name: Target location
+            language_name: Target language
+            queue_size: Items a queue holds before its producer waits
+            
+        Returns:
+            PipelineSummary of the run
+        """
+        Config.validate()
+        
+        summary = PipelineSummary(output_path=output_path)
+        keywords: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        cleaned: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        updates: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        records: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        
+        writer = self._firestore_writer()
+        async with self._dataforseo_client() as client, writer:
+            await _run_stages(
+                self._read_keywords(collection_name, keywords, summary),
+                self._clean_keywords(keywords, cleaned),
+                self._fetch_volumes(client, cleaned, fetched, summary, location_name, language_name),
+                self._format_volumes(fetched, (updates, records), summary),
+                self._write_volumes(writer, updates),
+                _write_json(output_path, records)
+            )
+        
+        stats = summary.write_stats = writer.stats
+        logger.info(
+            f"Pipeline complete: {summary.keywords} keywords read, {stats.written} documents updated, "
+            f"{summary.missing} without data, {summary.failed + stats.failed} failed "
+            f"({stats.commits} commits, {stats.retried} retries)"
+        )
+        return summary
+    
+    async def _read_keywords(self, collection_name: str, out: asyncio.Queue, summary: PipelineSummary) -> None:
+        """Source stage: keywords and their document references from Firestore."""
+        docs = scan_collection(
+            self.db,
+            collection_name,
+            field_paths=KEYWORD_FIELDS,
+            page_size=Config.FIRESTORE_READ_PAGE_SIZE,
+            partitions=Config.FIRESTORE_READ_PARTITIONS
+        )
+        async for doc in docs:
+            keyword = self._document_keyword(doc)
+            if keyword:
+                summary.keywords += 1
+                await out.put(KeywordItem(keyword, doc.reference))
+        
+        logger.info(f"Read {summary.keywords} keywords from Firestore collection: {collection_name}")
+        await out.put(None)
+    
+    async def _clean_keywords(self, inp: asyncio.Queue, out: asyncio.Queue) -> None:
+        """Normalizer stage: cleans each keyword for the API."""
+        while True:
+            item = await inp.get()
+            if item is None:
+                break
+            item.cleaned, _ = self.clean_keyword_for_api(item.keyword)
+            await out.put(item)
+        await out.put(None)
+    
+    async def _fetch_volumes(
+        self,
+        client: DataForSEOClient,
+        inp: asyncio.Queue,
+        out: asyncio.Queue,
+        summary: PipelineSummary,
+        location_name: str,
+        language_name: str
+    ) -> None:
+        """API fetcher stage: (item, result) pairs, result None when the API had none."""
+        # Items by cleaned keyword while its batch is in flight; bounded by
+        # the client's concurrency times the batch size
+        pending: Dict[str, List[KeywordItem]] = {}
+        
+        async def cleaned_keywords():
+            while True:
+                item = await inp.get()
+                if item is None:
+                    return
+                # Keywords that clean to the same text share one lookup
+                if item.cleaned in pending:
+                    pending[item.cleaned].append(item)
+                    continue
+                pending[item.cleaned] = [item]
+                yield item.cleaned
+        
+        processed = 0
+        async for batch in client.get_search_volume_many(
+            keywords=cleaned_keywords(),
+            location_name=location_name,
+            language_name=language_name,
+            use_clickstream=True,
+            tag_prefix="firestore_update_batch"
+        ):
+            processed += len(batch.keywords)
+            if batch.error:
+                logger.error(f"API error processing batch {batch.batch_number}: {batch.error}")
+                # Continue with other batches instead of failing
+                for keyword in batch.keywords:
+                    summary.failed += len(pending.pop(keyword, []))
+                continue
+            
+            logger.info(
+                f"Finished batch {batch.batch_number} ({len(batch.keywords)} keywords, "
+                f"{processed} processed)"
+            )
+            
+            for result in batch.results:
+                for item in pending.pop(result.keyword, []):
+                    await out.put((item, result))
+            for keyword in batch.keywords:
+                for item in pending.pop(keyword, []):
+                    await out.put((item, None))
+        
+        await out.put(None)
+    
+    async def _format_volumes(
+        self,
+        inp: asyncio.Queue,
+        outs: Tuple[asyncio.Queue, ...],
+        summary: PipelineSummary
+    ) -> None:
+        """Formatter stage: search volume records, handed to the writer and the file sink."""
+        while True:
+            entry = await inp.get()
+            if entry is None:
+                break
+            item, result = entry
+            # Skip keywords with no search volume data
+            if result is None or result.search_volume is None:
+                logger.warning(f"No search volume data for keyword: {item.cleaned}")
+                summary.missing += 1
+                continue
+            
+            record = self._volume_record(result, item.keyword)
+            summary.add(item.keyword, record)
+            for out in outs:
+                await out.put((item, record))
+        
+        for out in outs:
+            await out.put(None)
+    
+    async def _write_volumes(self, writer: ParallelBatchWriter, inp: asyncio.Queue) -> None:
+        """Writer stage: queues each record's update on the batch writer."""
+        while True:
+            entry = await inp.get()
+            if entry is None:
+                return
+            item, record = entry
+            await writer.update(item.reference, self._update_data(record))
+
 
 async def main():
     """Main function to orchestrate the keyword search volume update."""
@@ -368,61 +641,40 @@ async def main():
         # Initialize updater
         updater = FirestoreKeywordUpdater()
         
-        # Fetch keywords from Firestore
-        logger.info("Fetching keywords from Firestore...")
-        keywords = updater.fetch_keywords_from_firestore()
-        
-        if not keywords:
-            logger.warning("No keywords found in Firestore")
-            return
-        
-        logger.info(f"Found {len(keywords)} keywords to process")
-        
-        # Get monthly search volumes
-        logger.info("Fetching search volume data from DataForSEO...")
-        search_volumes = await updater.get_monthly_search_volumes(keywords)
-        
-        # Save results to JSON file
         output_path = Path(__file__).parent.parent.parent / "data" / "firestore_search_volumes.json"
-        output_path.parent.mkdir(exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(search_volumes, f, indent=2)
+        # Stream keywords from Firestore through DataForSEO back into Firestore
+        logger.info("Updating search volumes: Firestore -> DataForSEO -> Firestore...")
+        summary = await updater.run_pipeline(output_path)
         
-        logger.info(f"Saved search volume data to {output_path}")
+        if not summary.keywords:
+            logger.warning("No keywords found in Firestore")
+            return
         
         # Print summary
         logger.info(f"\nSummary:")
-        logger.info(f"- Keywords processed: {len(search_volumes)}")
-        logger.info(f"- Keywords with data: {len([k for k, v in search_volumes.items() if v['total_volume'] > 0])}")
-        logger.info(f"- Keywords with no data: {len([k for k, v in search_volumes.items() if v['total_volume'] == 0])}")
-        logger.info(f"- Keywords modified for API: {len(updater.modified_keywords)}")
+        logger.info(f"- Keywords read: {summary.keywords}")
+        logger.info(f"- Keywords processed: {summary.with_data + summary.no_data}")
+        logger.info(f"- Keywords with data: {summary.with_data}")
+        logger.info(f"- Keywords with no data: {summary.no_data + summary.missing}")
+        logger.info(f"- Keywords failed: {summary.failed + summary.write_stats.failed}")
+        logger.info(f"- Keywords modified for API: {updater.modified_count}")
         
         if updater.modified_keywords:
             print("\n" + "="*60)
             print("KEYWORDS MODIFIED FOR API COMPATIBILITY")
             print("="*60)
-            for original, cleaned in updater.modified_keywords[:10]:
+            for original, cleaned in updater.modified_keywords:
                 print(f"{original} -> {cleaned}")
-            if len(updater.modified_keywords) > 10:
-                print(f"... and {len(updater.modified_keywords) - 10} more")
-        
-        # Automatically update Firestore
-        logger.info("\nUpdating Firestore with new search volume data...")
-        updater.update_firestore_with_volumes(search_volumes)
+            if updater.modified_count > len(updater.modified_keywords):
+                print(f"... and {updater.modified_count - len(updater.modified_keywords)} more")
         
         # Print sample of results
         print("\n" + "="*60)
         print("TOP 10 KEYWORDS BY SEARCH VOLUME")
         print("="*60)
         
-        sorted_results = sorted(
-            search_volumes.items(), 
-            key=lambda x: x[1]['total_volume'], 
-            reverse=True
-        )[:10]
-        
-        for i, (keyword, data) in enumerate(sorted_results, 1):
+        for i, (keyword, data) in enumerate(summary.top_keywords(), 1):
             print(f"\n{i}. {keyword}")
             print(f"   Total volume: {data['total_volume']:,}")
             if data.get('cleaned_keyword'):
@@ -435,7 +687,7 @@ async def main():
                 print(f"     {month_key}: {volume:,}")
         
         print("\n" + "="*60)
-        print(f"Process complete! Updated {len(search_volumes)} keywords in Firestore.")
+        print(f"Process complete! Updated {summary.write_stats.written} keywords in Firestore.")
         print(f"Data also saved to: {output_path}")
         print("="*60)
         
@@ -19,13 +19,17 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore_async
 
 # Add parent path to sys.path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.dataforseo_client import DataForSEOClient, SearchVolumeResult, DataForSEOError
+from utils.monthly_series import LONG
+from utils.async_firestore import scan_collection
+from utils.keyword_documents import KeywordDocumentIndex, KEYWORD_FIELDS
+from utils.firestore_writer import ParallelBatchWriter
 from config.config import Config
 
 
@@ -80,11 +84,13 @@ class FirestoreKeywordUpdater:
     def __init__(self):
         """Initialize Firestore client."""
         self.db = self._initialize_firebase()
+        # Keyword -> document reference per collection, filled by the keyword scan
+        self.document_indexes: Dict[str, KeywordDocumentIndex] = {}
         # Keep track of original to cleaned keyword mapping
         self.keyword_mapping = {}
         
-    def _initialize_firebase(self) -> firestore.Client:
-        """Initialize Firebase Admin SDK."""
+    def _initialize_firebase(self) -> firestore_async.AsyncClient:
+        """Initialize Firebase Admin SDK and return an async Firestore client."""
         try:
             # Check if already initialized
             try:
@@ -111,7 +117,9 @@ class FirestoreKeywordUpdater:
                 firebase_admin.initialize_app(cred)
                 logger.info(f"Firebase initialized with: {service_account_path}")
             
-            return firestore.client()
+            # Async client, so Firestore RPCs never block the event loop the
+            # DataForSEO batches and write workers share
+            return firestore_async.client()
             
         except Exception as e:
             logger.error(f"Failed to initialize Firebase: {e}")
@@ -138,7 +146,7 @@ class FirestoreKeywordUpdater:
         
         return keyword
     
-    def fetch_keywords_from_firestore(self, collection_name: str = "dataforseo_keywords") -> List[str]:
+    async def fetch_keywords_from_firestore(self, collection_name: str = "dataforseo_keywords") -> List[str]:
         """
         Fetch all keywords from Firestore collection.
         
@@ -150,15 +158,27 @@ class FirestoreKeywordUpdater:
         """
         try:
             keywords = []
-            docs = self.db.collection(collection_name).stream()
+            index = KeywordDocumentIndex(collection_name)
+            # Only the keyword fields, in pages read from several id ranges at once
+            docs = scan_collection(
+                self.db,
+                collection_name,
+                field_paths=KEYWORD_FIELDS,
+                page_size=Config.FIRESTORE_READ_PAGE_SIZE,
+                partitions=Config.FIRESTORE_READ_PARTITIONS
+            )
             
-            for doc in docs:
+            async for doc in docs:
                 data = doc.to_dict()
                 # Handle different possible field names
                 keyword = data.get('keyword') or data.get('name') or doc.id
                 if keyword:
                     keywords.append(keyword)
+                    # Remember where each keyword lives so updates need no reads
+                    index.add_snapshot(doc, keyword)
                     
+            self.document_indexes[collection_name] = index
+            
             logger.info(f"Fetched {len(keywords)} keywords from Firestore collection: {collection_name}")
             return keywords
             
@@ -195,83 +215,59 @@ class FirestoreKeywordUpdater:
             # Store mapping from cleaned to original
             self.keyword_mapping[cleaned] = keyword
         
-        async with DataForSEOClient(
-            login=Config.DATAFORSEO_LOGIN_DECODED,
-            password=Config.DATAFORSEO_PASSWORD_DECODED,
-            rate_limit=Config.DATAFORSEO_RATE_LIMIT
+        async with DataForSEOClient.from_config(
+            Config, max_batch_size=Config.MAX_KEYWORDS_PER_BATCH
         ) as client:
             
-            # Process in batches
-            batch_size = min(700, Config.MAX_KEYWORDS_PER_BATCH)  # DataForSEO recommends 700 max
+            # Batches run concurrently under the client's rate limiter, sized
+            # by observed latency; batches that time out are split and retried
+            processed = 0
             
-            for i in range(0, len(cleaned_keywords), batch_size):
-                batch = cleaned_keywords[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1}/{(len(cleaned_keywords) + batch_size - 1)//batch_size}")
+            async for batch in client.get_search_volume_many(
+                keywords=cleaned_keywords,
+                location_name=location_name,
+                language_name=language_name,
+                use_clickstream=True,
+                tag_prefix="firestore_update_batch"
+            ):
+                processed += len(batch.keywords)
+                if batch.error:
+                    logger.error(f"API error processing batch {batch.batch_number}: {batch.error}")
+                    # Continue with other batches instead of failing
+                    continue
+                    
+                logger.info(
+                    f"Finished batch {batch.batch_number} ({len(batch.keywords)} keywords, "
+                    f"{processed}/{len(cleaned_keywords)} processed)"
+                )
                 
-                try:
-                    search_results = await client.get_search_volume(
-                        keywords=batch,
-                        location_name=location_name,
-                        language_name=language_name,
-                        use_clickstream=True,
-                        tag=f"firestore_update_batch_{i//batch_size + 1}"
-                    )
+                for result in batch.results:
+                    # Skip keywords with no search volume data
+                    if result.search_volume is None:
+                        logger.warning(f"No search volume data for keyword: {result.keyword}")
+                        continue
                     
-                    for result in search_results:
-                        # Skip keywords with no search volume data
-                        if result.search_volume is None:
-                            logger.warning(f"No search volume data for keyword: {result.keyword}")
-                            continue
-                        
-                        # Get the original keyword from our mapping
-                        original_keyword = self.keyword_mapping.get(result.keyword, result.keyword)
-                        
-                        # If the result keyword is quoted, try to find the original
-                        if result.keyword.startswith('"') and result.keyword.endswith('"'):
-                            unquoted = result.keyword[1:-1]
-                            if unquoted in keywords:
-                                original_keyword = unquoted
-                            
-                        # Format monthly data with simple month-year format
-                        monthly_data = {}
-                        month_names = {
-                            1: "January", 2: "February", 3: "March", 4: "April",
-                            5: "May", 6: "June", 7: "July", 8: "August",
-                            9: "September", 10: "October", 11: "November", 12: "December"
-                        }
-                        
-                        if result.monthly_searches:  # Check if monthly_searches exists
-                            for month_data in result.monthly_searches:
-                                year = month_data.get('year')
-                                month_num = month_data.get('month')
-                                volume = month_data.get('search_volume', 0)
-                                
-                                if year and month_num and month_num in month_names:
-                                    # Simple format: "June 2025"
-                                    month_key = f"{month_names[month_num]} {year}"
-                                    monthly_data[month_key] = volume
-                        
-                        results[original_keyword] = {
-                            "search_volume": monthly_data,  # Store monthly data directly as search_volume
-                            "total_volume": result.search_volume or 0,  # Keep total for reference
-                            "last_updated": datetime.now().isoformat()
-                        }
+                    # Get the original keyword from our mapping
+                    original_keyword = self.keyword_mapping.get(result.keyword, result.keyword)
+                    
+                    # If the result keyword is quoted, try to find the original
+                    if result.keyword.startswith('"') and result.keyword.endswith('"'):
+                        unquoted = result.keyword[1:-1]
+                        if unquoted in keywords:
+                            original_keyword = unquoted
                         
-                except DataForSEOError as e:
-                    logger.error(f"API error processing batch {i//batch_size + 1}: {e}")
-                    # Continue with next batch instead of failing
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error processing batch {i//batch_size + 1}: {e}")
-                    continue
-                
-                # Add delay between batches to respect rate limits
-                if i + batch_size < len(cleaned_keywords):
-                    await asyncio.sleep(5)  # 5 second delay between batches
+                    # Simple month-year format: "June 2025" (labels are shared across the batch)
+                    monthly_data = result.monthly_series.as_dict(LONG)
+                    
+                    results[original_keyword] = {
+                        "search_volume": monthly_data,  # Store monthly data directly as search_volume
+                        "total_volume": result.search_volume or 0,  # Keep total for reference
+                        "last_updated": datetime.now().isoformat()
+                    }
         
         return results
     
-    def update_firestore_with_volumes(
+    async def update_firestore_with_volumes(
         self, 
         search_volumes: Dict[str, Dict[str, Any]], 
         collection_name: str = "dataforseo_keywords"
@@ -279,61 +275,49 @@ class FirestoreKeywordUpdater:
         """
         Update Firestore documents with search volume data in main document fields.
         
+        Writes are committed concurrently by a ParallelBatchWriter (ramping up
+        from FIRESTORE_INITIAL_WRITE_RATE writes/s, retrying contended
+        documents individually); queuing waits while its queue is full.
+        
         Args:
             search_volumes: Dictionary of search volume data
             collection_name: Firestore collection to update
         """
         try:
-            batch = self.db.batch()
-            batch_size = 0
-            max_batch_size = 500  # Firestore batch limit
-            updated_count = 0
+            # Resolve every document up front: indexed by the keyword scan, the
+            # rest in chunked get_all/'in' lookups rather than reads per keyword
+            index = self.document_indexes.get(collection_name) or KeywordDocumentIndex(collection_name)
+            self.document_indexes[collection_name] = index
+            doc_refs = await index.resolve(self.db, search_volumes.keys())
+            
+            writer = ParallelBatchWriter(
+                self.db,
+                max_in_flight=Config.FIRESTORE_WRITE_CONCURRENCY,
+                initial_ops_per_second=Config.FIRESTORE_INITIAL_WRITE_RATE or None
+            )
             skipped_count = 0
             
-            for keyword, volume_data in search_volumes.items():
-                # Prepare the update data with the search_volume field containing monthly data
-                update_data = {
-                    'search_volume': volume_data['search_volume'],  # This now contains the monthly breakdown
-                    'search_volume_updated': volume_data['last_updated'],
-                    'total_search_volume': volume_data['total_volume']  # Store total separately if needed
-                }
-                
-                # Since dataforseo_keywords collection uses document ID as the keyword,
-                # we can directly reference the document
-                doc_ref = self.db.collection(collection_name).document(keyword)
-                
-                # Check if document exists
-                doc = doc_ref.get()
-                if doc.exists:
-                    batch.update(doc_ref, update_data)
-                    batch_size += 1
-                    updated_count += 1
-                else:
-                    # If document doesn't exist by ID, try to find by keyword field
-                    query = self.db.collection(collection_name).where('keyword', '==', keyword).limit(1)
-                    docs = list(query.stream())
+            async with writer:
+                for keyword, volume_data in search_volumes.items():
+                    # Prepare the update data with the search_volume field containing monthly data
+                    update_data = {
+                        'search_volume': volume_data['search_volume'],  # This now contains the monthly breakdown
+                        'search_volume_updated': volume_data['last_updated'],
+                        'total_search_volume': volume_data['total_volume']  # Store total separately if needed
+                    }
                     
-                    if docs:
-                        doc_ref = docs[0].reference
-                        batch.update(doc_ref, update_data)
-                        batch_size += 1
-                        updated_count += 1
+                    doc_ref = doc_refs.get(keyword)
+                    if doc_ref is not None:
+                        await writer.update(doc_ref, update_data)
                     else:
                         logger.warning(f"No document found for keyword: {keyword}")
                         skipped_count += 1
-                    
-                if batch_size >= max_batch_size:
-                    batch.commit()
-                    logger.info(f"Committed batch of {batch_size} updates")
-                    batch = self.db.batch()
-                    batch_size = 0
-            
-            # Commit remaining updates
-            if batch_size > 0:
-                batch.commit()
-                logger.info(f"Committed final batch of {batch_size} updates")
             
-            logger.info(f"Firestore update complete: {updated_count} documents updated, {skipped_count} skipped")
+            stats = writer.stats
+            logger.info(
+                f"Firestore update complete: {stats.written} documents updated, {skipped_count} skipped, "
+                f"{stats.failed} failed ({stats.commits} commits, {stats.retried} retries, {stats.seconds:.1f}s)"
+            )
                 
         except Exception as e:
             logger.error(f"Error updating Firestore: {e}")
@@ -349,7 +333,7 @@ async def main():
         
         # Fetch keywords from Firestore
         logger.info("Fetching keywords from Firestore...")
-        keywords = updater.fetch_keywords_from_firestore()
+        keywords = await updater.fetch_keywords_from_firestore()
         
         if not keywords:
             logger.warning("No keywords found in Firestore")
@@ -387,7 +371,7 @@ async def main():
         
         # Automatically update Firestore
         logger.info("\nUpdating Firestore with new search volume data...")
-        updater.update_firestore_with_volumes(search_volumes)
+        await updater.update_firestore_with_volumes(search_volumes)
         
         # Print sample of results
         print("\n" + "="*60)
@@ -0,0 +1,178 @@
+import asyncio
+import inspect
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+
+# Snapshots pulled from a synchronous stream per worker-thread hop
+STREAM_CHUNK_SIZE = 300
+
+# Documents per page of a paginated scan
+DEFAULT_PAGE_SIZE = 1000
+
+# Document-id ranges a scan reads in parallel
+DEFAULT_PARTITIONS = 8
+
+
+def is_async_client(db: Any) -> bool:
+    """
+    True for ``google.cloud.firestore.AsyncClient`` (and the async fake),
+    whose ``get_all`` is an async generator; False for the sync Client.
+    """
+    return inspect.isasyncgenfunction(getattr(type(db), "get_all", None))
+
+
+def _take(iterator: Iterator[Any], count: int) -> List[Any]:
+    return list(islice(iterator, count))
+
+
+async def stream_query(db: Any, query: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[Any]:
+    """
+    Iterate a query's snapshots without blocking the event loop.
+
+    AsyncClient queries are streamed natively. With the sync client the
+    stream is opened and drained in a worker thread, ``chunk_size``
+    snapshots per hop, so at most one chunk is held at a time.
+
+    Args:
+        db: Firestore client the query belongs to (sync or async)
+        query: Query or collection reference
+        chunk_size: Snapshots fetched per thread hop (sync client only)
+    """
+    if is_async_client(db):
+        async for snapshot in query.stream():
+            yield snapshot
+        return
+
+    iterator = await asyncio.to_thread(lambda: iter(query.stream()))
+    while True:
+        chunk = await asyncio.to_thread(_take, iterator, chunk_size)
+        for snapshot in chunk:
+            yield snapshot
+        if len(chunk) < chunk_size:
+            return
+
+
+async def get_all(
+    db: Any,
+    references: Iterable[Any],
+    field_paths: Optional[Iterable[str]] = None
+) -> List[Any]:
+    """Snapshots for ``references`` in one batched read, on either client."""
+    references = list(references)
+    if is_async_client(db):
+        return [snapshot async for snapshot in db.get_all(references, field_paths=field_paths)]
+    return await asyncio.to_thread(lambda: list(db.get_all(references, field_paths=field_paths)))
+
+
+async def commit_batch(batch: Any) -> Any:
+    """Commit a WriteBatch: awaited for AsyncClient, in a worker thread otherwise."""
+    if inspect.iscoroutinefunction(batch.commit):
+        return await batch.commit()
+    return await asyncio.to_thread(batch.commit)
+
+
+async def run_query(db: Any, query: Any) -> List[Any]:
+    """All snapshots of a bounded query (e.g. one page), on either client."""
+    if is_async_client(db):
+        return [snapshot async for snapshot in query.stream()]
+    return await asyncio.to_thread(lambda: list(query.stream()))
+
+
+async def paginate(db: Any, query: Any, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[List[Any]]:
+    """
+    Pages of a query ordered by document id, each resuming after the last
+    document of the previous one.
+
+    Every page is its own short request, so a long scan is never one
+    stream the server can time out, and it can be stopped after any page.
+    """
+    cursor = None
+    while True:
+        page_query = query.limit(page_size)
+        if cursor is not None:
+            page_query = page_query.start_after(cursor)
+        page = await run_query(db, page_query)
+        if page:
+            yield page
+        if len(page) < page_size:
+            return
+        cursor = page[-1]
+
+
+async def partition_queries(db: Any, collection_id: str, partitions: int) -> List[Any]:
+    """
+    Queries splitting ``collection_id`` into up to ``partitions`` document-id
+    ranges, from a partition query on its collection group. The server may
+    return fewer ranges (a single one for small collections).
+    """
+    group = db.collection_group(collection_id)
+    if is_async_client(db):
+        return [partition.query() async for partition in group.get_partitions(partitions)]
+    return await asyncio.to_thread(lambda: [partition.query() for partition in group.get_partitions(partitions)])
+
+
+def _top_level(snapshot: Any) -> bool:
+    # Collection group queries also match subcollections with the same id
+    return snapshot.reference.path.count("/") == 1
+
+
+async def scan_collection(
+    db: Any,
+    collection_id: str,
+    field_paths: Optional[Iterable[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    partitions: int = DEFAULT_PARTITIONS
+) -> AsyncIterator[Any]:
+    """
+    Every document of a top-level collection, read in parallel pages.
+
+    The collection is split into document-id ranges with a partition query
+    and each range is paginated concurrently; ``field_paths`` is applied as
+    a projection so only those fields are transferred. Documents arrive in
+    no particular order, and at most one page per range is held while the
+    caller catches up.
+
+    Args:
+        db: Firestore client (sync or async)
+        collection_id: Top-level collection to read
+        field_paths: Fields to fetch (None: whole documents; []: ids only)
+        page_size: Documents per request
+        partitions: Ranges to read in parallel (1: one paginated scan)
+    """
+    if partitions > 1:
+        queries = await partition_queries(db, collection_id, partitions)
+    else:
+        queries = [db.collection(collection_id).order_by("__name__")]
+    if field_paths is not None:
+        queries = [query.select(list(field_paths)) for query in queries]
+
+    # Pages from all ranges; None marks a finished range, an exception a failed one
+    pages: asyncio.Queue = asyncio.Queue(maxsize=len(queries))
+
+    async def read(query: Any) -> None:
+        try:
+            async for page in paginate(db, query, page_size):
+                await pages.put(page)
+        except Exception as e:
+            await pages.put(e)
+            return
+        await pages.put(None)
+
+    tasks = [asyncio.ensure_future(read(query)) for query in queries]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            page = await pages.get()
+            if page is None:
+                remaining -= 1
+                continue
+            if isinstance(page, Exception):
+                # Fail the scan rather than return part of the collection
+                raise page
+            for snapshot in page:
+                if partitions <= 1 or _top_level(snapshot):
+                    yield snapshot
+    finally:
+        for task in tasks:
+            task.cancel()
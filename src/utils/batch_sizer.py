@@ -0,0 +1,159 @@
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Search volume endpoints accept up to 1000 keywords per task; 700 is
+# DataForSEO's recommended size for reliable live responses
+MAX_BATCH_SIZE = 1000
+DEFAULT_INITIAL_BATCH_SIZE = 700
+
+# Seconds a request may take before batches stop growing; well inside the
+# default 120 s read timeout
+DEFAULT_TARGET_LATENCY = 60.0
+
+
+@dataclass
+class EndpointBatchState:
+    """Controller state for one endpoint"""
+    size: int
+    # Smallest size seen to time out; growth stays below it
+    unsafe: Optional[int] = None
+    # Recent (keywords, seconds) observations
+    samples: Deque[Tuple[int, float]] = field(default_factory=lambda: deque(maxlen=20))
+    # Requests within target since the last timeout, for relaxing ``unsafe``
+    streak: int = 0
+
+
+class AdaptiveBatchSizer:
+    """
+    Keywords-per-task controller, kept per endpoint.
+
+    The client reports every completed request with its keyword count,
+    summed over the tasks packed into it, and its latency. The controller fits latency as a linear
+    function of batch size over recent requests and grows the batch, at most
+    ``growth`` times per step, toward the largest size predicted to finish
+    within ``target_latency``. A slow request shrinks it in proportion to the
+    overshoot. A timeout halves it and marks that size unsafe, so growth
+    stops short of it; the mark is relaxed by 10% after ``relax_after``
+    requests in a row come back within target.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = DEFAULT_INITIAL_BATCH_SIZE,
+        min_size: int = 10,
+        max_size: int = MAX_BATCH_SIZE,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+        growth: float = 1.25,
+        relax_after: int = 50
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            initial_size: Keywords per task before anything has been observed
+            min_size: Never shrink below this
+            max_size: Never grow above this (the endpoint's limit)
+            target_latency: Seconds a request should take at most
+            growth: Largest growth factor per observation
+            relax_after: Requests within target before an unsafe mark is relaxed
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError("min_size must be between 1 and max_size")
+        if target_latency <= 0:
+            raise ValueError("target_latency must be positive")
+        if growth <= 1:
+            raise ValueError("growth must be greater than 1")
+
+        self.initial_size = max(min_size, min(initial_size, max_size))
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.growth = growth
+        self.relax_after = relax_after
+        self.endpoints: Dict[str, EndpointBatchState] = {}
+
+    def _state(self, endpoint: str) -> EndpointBatchState:
+        state = self.endpoints.get(endpoint)
+        if state is None:
+            state = self.endpoints[endpoint] = EndpointBatchState(self.initial_size)
+        return state
+
+    def size(self, endpoint: str) -> int:
+        """Keywords per task to use for the next batch on ``endpoint``."""
+        return self._state(endpoint).size
+
+    def record(self, endpoint: str, keywords: int, seconds: float) -> None:
+        """Record a request that completed with ``keywords`` across its tasks."""
+        if keywords <= 0:
+            return
+        state = self._state(endpoint)
+        state.samples.append((keywords, seconds))
+
+        if seconds > self.target_latency:
+            state.streak = 0
+            if keywords >= state.size:
+                self._resize(endpoint, state, int(keywords * self.target_latency / seconds))
+            return
+
+        state.streak += 1
+        if state.unsafe is not None and state.streak >= self.relax_after:
+            state.unsafe = int(state.unsafe * 1.1) + 1
+            state.streak = 0
+            if state.unsafe > self.max_size:
+                state.unsafe = None
+
+        # Only a full-size batch says anything about growing; a short
+        # remainder batch finishing quickly does not
+        if keywords >= state.size:
+            target = int(state.size * self.growth)
+            predicted = self._predict(state)
+            if predicted is not None:
+                target = min(target, max(state.size, predicted))
+            self._resize(endpoint, state, target)
+
+    def record_timeout(self, endpoint: str, keywords: int) -> None:
+        """Record a request that timed out with ``keywords`` across its tasks."""
+        if keywords <= 0:
+            return
+        state = self._state(endpoint)
+        state.streak = 0
+        state.unsafe = keywords if state.unsafe is None else min(state.unsafe, keywords)
+        self._resize(endpoint, state, min(state.size, keywords // 2))
+
+    def _predict(self, state: EndpointBatchState) -> Optional[int]:
+        """Largest size the latency fit expects to finish within target."""
+        sizes = {keywords for keywords, _ in state.samples}
+        if len(sizes) < 2:
+            return None
+        n = len(state.samples)
+        mean_x = sum(keywords for keywords, _ in state.samples) / n
+        mean_y = sum(seconds for _, seconds in state.samples) / n
+        var = sum((keywords - mean_x) ** 2 for keywords, _ in state.samples)
+        cov = sum((keywords - mean_x) * (seconds - mean_y) for keywords, seconds in state.samples)
+        slope = cov / var
+        if slope <= 0:
+            # Latency doesn't grow with size over this range
+            return None
+        intercept = mean_y - slope * mean_x
+        return int((self.target_latency - intercept) / slope)
+
+    def _resize(self, endpoint: str, state: EndpointBatchState, size: int) -> None:
+        ceiling = self.max_size
+        if state.unsafe is not None:
+            ceiling = min(ceiling, int(state.unsafe * 0.9))
+        size = max(self.min_size, min(size, ceiling))
+        if size != state.size:
+            logger.debug(f"Batch size for {endpoint}: {state.size} -> {size}")
+            state.size = size
+
+    def to_dict(self) -> Dict[str, Dict[str, Optional[int]]]:
+        """Current size and unsafe mark per endpoint, for the metrics summary."""
+        return {
+            endpoint: {"size": state.size, "unsafe": state.unsafe}
+            for endpoint, state in sorted(self.endpoints.items())
+        }
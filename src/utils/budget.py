@@ -0,0 +1,150 @@
+import json
+import math
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+MODE_LIVE = "live"
+MODE_QUEUED = "queued"
+
+# Search volume is billed per task, whatever its keyword count, so bigger
+# tasks are cheaper per keyword. Live tasks are capped at DataForSEO's
+# recommended 700 keywords for reliable responses; queued tasks take the
+# full 1000.
+MAX_BATCH_SIZES = {MODE_LIVE: 700, MODE_QUEUED: 1000}
+
+# USD per search volume task until real costs have been observed
+DEFAULT_TASK_PRICES = {MODE_LIVE: 0.075, MODE_QUEUED: 0.05}
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Spending limits in USD; None means unlimited"""
+    per_run: Optional[float] = None
+    per_day: Optional[float] = None
+
+    def remaining(self, run_spent: float = 0.0, day_spent: float = 0.0) -> float:
+        """Dollars still available given what this run and today have spent."""
+        limits = []
+        if self.per_run is not None:
+            limits.append(self.per_run - run_spent)
+        if self.per_day is not None:
+            limits.append(self.per_day - day_spent)
+        return max(0.0, min(limits)) if limits else math.inf
+
+
+class CostLedger:
+    """
+    Daily API spend persisted across runs, for per-day budgets.
+
+    Stored as JSON: ``{"2025-06-01": {"keywords_data/...": 1.23}}``.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._days: Dict[str, Dict[str, float]] = {}
+        if self.path.exists():
+            try:
+                self._days = json.loads(self.path.read_text())
+            except ValueError:
+                logger.error(f"Ignoring unreadable cost ledger {self.path}")
+
+    def spent(self, day: Optional[date] = None) -> float:
+        """Total recorded for ``day`` (default today)."""
+        key = (day or date.today()).isoformat()
+        return sum(self._days.get(key, {}).values())
+
+    def record(self, costs: Dict[str, float], day: Optional[date] = None) -> None:
+        """Add per-endpoint costs to ``day`` and save."""
+        costs = {endpoint: cost for endpoint, cost in costs.items() if cost}
+        if not costs:
+            return
+        totals = self._days.setdefault((day or date.today()).isoformat(), {})
+        for endpoint, cost in costs.items():
+            totals[endpoint] = round(totals.get(endpoint, 0.0) + cost, 6)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._days, indent=2, sort_keys=True))
+        tmp.replace(self.path)
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    """How to spend a budget on a search volume refresh"""
+    mode: str
+    batch_size: int
+    tasks: int
+    keywords: int
+    skipped: int
+    estimated_cost: float
+    budget: float
+
+    def __str__(self) -> str:
+        budget = "unlimited" if math.isinf(self.budget) else f"${self.budget:.2f}"
+        return (
+            f"{self.mode} mode, {self.tasks} tasks of up to {self.batch_size} keywords, "
+            f"{self.keywords} keywords (skipping {self.skipped}), "
+            f"est. ${self.estimated_cost:.2f} of {budget}"
+        )
+
+
+def plan_schedule(
+    num_keywords: int,
+    budget: float,
+    allow_queued: bool = True,
+    prices: Optional[Dict[str, float]] = None,
+    prefer_queued: bool = False
+) -> SchedulePlan:
+    """
+    Choose the mode and batch size that refresh the most keywords within ``budget``.
+
+    Each mode fills as few tasks as possible, up to its batch limit, and
+    spreads the keywords evenly over them. Live mode is used whenever it
+    covers every keyword; the standard queue is only considered when a
+    budget is set and live cannot cover them all, in which case the mode
+    covering the most keywords wins (live on a tie). With ``prefer_queued``
+    the cheaper mode among those covering the most keywords wins.
+
+    Args:
+        num_keywords: Keywords wanting a refresh, in priority order
+        budget: Dollars available (math.inf for no limit)
+        allow_queued: Consider the standard queue (results take minutes)
+        prices: USD per task by mode (default: DEFAULT_TASK_PRICES)
+        prefer_queued: Pick the queue whenever it is cheaper, not only to fit the budget
+
+    Returns:
+        SchedulePlan; ``keywords`` is how many of the first keywords fit
+    """
+    prices = {**DEFAULT_TASK_PRICES, **(prices or {})}
+    modes = [MODE_LIVE, MODE_QUEUED] if allow_queued else [MODE_LIVE]
+
+    plans = []
+    for mode in modes:
+        price, max_batch = prices[mode], MAX_BATCH_SIZES[mode]
+        needed = math.ceil(num_keywords / max_batch)
+        affordable = needed if price <= 0 or math.isinf(budget) else int(budget / price + 1e-9)
+        tasks = min(needed, affordable)
+        covered = min(num_keywords, tasks * max_batch)
+        batch_size = math.ceil(covered / tasks) if tasks else 0
+        plans.append(SchedulePlan(
+            mode=mode,
+            batch_size=batch_size,
+            tasks=tasks,
+            keywords=covered,
+            skipped=num_keywords - covered,
+            estimated_cost=round(tasks * price, 6),
+            budget=budget
+        ))
+
+    live = plans[0]
+    if len(plans) == 1 or (not prefer_queued and not live.skipped):
+        return live
+    if prefer_queued:
+        return min(plans, key=lambda plan: (-plan.keywords, plan.estimated_cost, plan.mode != MODE_LIVE))
+    return min(plans, key=lambda plan: (-plan.keywords, plan.mode != MODE_LIVE))
@@ -1,23 +1,140 @@
 import asyncio
 import aiohttp
-import base64
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Callable, Deque, Dict, List, Optional, Any, Union
+import dataclasses
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
+import msgspec
+
+from .decoding import ItemsResult, decode_response, decode_rows
+from .monthly_series import MonthlySeries
+from .volume_matrix import VolumeMatrix
+from .errors import (
+    DataForSEOError,
+    DataForSEORateLimitError,
+    DataForSEOTimeoutError
+)
+from .rate_limiter import (
+    RateLimiter,
+    EndpointLimit,
+    GENERAL_REQUESTS_PER_MINUTE,
+    MAX_SIMULTANEOUS_REQUESTS
+)
+from .task_packer import TaskPacker, MAX_TASKS_PER_REQUEST, DEFAULT_PACK_WINDOW
+from .task_queue import QueuedTaskRunner, PingbackReceiver
+from .response_cache import ResponseCache, normalize_keyword
+from .metrics import ClientMetrics, metric_endpoint
+from .batch_sizer import AdaptiveBatchSizer, MAX_BATCH_SIZE
+from .streaming import ResultStreamParser
+from .budget import (
+    Budget,
+    CostLedger,
+    SchedulePlan,
+    DEFAULT_TASK_PRICES,
+    MODE_LIVE,
+    MODE_QUEUED,
+    plan_schedule
+)
+from .http_session import (
+    TimeoutPolicy,
+    ConnectionPolicy,
+    auth_headers,
+    create_session,
+    encode_json_body
+)
+from .retry import RetryPolicy, CircuitBreaker, RETRYABLE_HTTP_STATUSES, is_retryable, is_throttled
+
+# Production API; point ``base_url`` elsewhere (e.g. a MockDataForSEOServer) to run offline
+DEFAULT_BASE_URL = "https://api.dataforseo.com/v3"
+
+# Keyword limits for the search volume endpoints
+MAX_KEYWORDS_PER_REQUEST = 1000
+
+# Streaming mode: bytes read per chunk, and rows written to the cache at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_CACHE_FLUSH = 100
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class SearchVolumeResult:
-    """Represents search volume data for a keyword"""
+    """
+    Represents search volume data for a keyword.
+    
+    The monthly breakdown is kept as a MonthlySeries (start month plus an
+    int64 array) rather than a dict per month; use ``monthly_series`` views
+    such as ``as_dict()`` for Firestore-style keys, or ``monthly_searches``
+    for the API's list-of-dicts form.
+    """
+    
+    __slots__ = (
+        "keyword", "search_volume", "monthly_series",
+        "location_code", "language_code", "use_clickstream"
+    )
+    
+    def __init__(
+        self,
+        keyword: str,
+        search_volume: Optional[int],
+        monthly_searches: Optional[List[Dict[str, Optional[int]]]] = None,
+        location_code: Optional[int] = None,
+        language_code: Optional[str] = None,
+        use_clickstream: bool = True,
+        monthly_series: Optional[MonthlySeries] = None
+    ):
+        self.keyword = keyword
+        self.search_volume = search_volume
+        self.monthly_series = monthly_series or MonthlySeries.from_api(monthly_searches)
+        self.location_code = location_code
+        self.language_code = language_code
+        self.use_clickstream = use_clickstream
+        
+    @classmethod
+    def from_row(cls, row: "SearchVolumeRow") -> "SearchVolumeResult":
+        return cls(
+            keyword=row.keyword,
+            search_volume=row.search_volume,
+            location_code=row.location_code,
+            language_code=row.language_code,
+            use_clickstream=row.use_clickstream,
+            monthly_series=MonthlySeries.from_api(row.monthly_searches)
+        )
+        
+    @property
+    def monthly_searches(self) -> List[Dict[str, Optional[int]]]:
+        """Monthly rows as returned by the API, newest first."""
+        return self.monthly_series.to_list()
+        
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SearchVolumeResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+        
+    def __repr__(self) -> str:
+        return (
+            f"SearchVolumeResult(keyword={self.keyword!r}, search_volume={self.search_volume!r}, "
+            f"monthly_series={self.monthly_series!r}, location_code={self.location_code!r})"
+        )
+
+
+class MonthRow(msgspec.Struct):
+    """One entry of a keyword's ``monthly_searches`` as sent by the API"""
+    year: Optional[int] = None
+    month: Optional[int] = None
+    search_volume: Optional[int] = None
+
+
+class SearchVolumeRow(msgspec.Struct):
+    """Keyword row as decoded (and cached) before conversion to SearchVolumeResult"""
     keyword: str
-    search_volume: int
-    monthly_searches: List[Dict[str, int]]
+    search_volume: Optional[int] = None
+    monthly_searches: Optional[List[MonthRow]] = None
     location_code: Optional[int] = None
     language_code: Optional[str] = None
     use_clickstream: bool = True
@@ -27,13 +144,81 @@ class SearchVolumeResult:
 class GlobalSearchVolumeResult:
     """Represents global search volume with country distribution"""
     keyword: str
-    search_volume: int
-    country_distribution: List[Dict[str, Any]]
+    search_volume: Optional[int]
+    country_distribution: Optional[List[Dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass
+class SearchVolumeBatch:
+    """Outcome of one shard of a bulk search volume request"""
+    batch_number: int
+    keywords: List[str]
+    results: List[SearchVolumeResult] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _group_spellings(keywords: List[str]) -> Dict[str, List[str]]:
+    """Group keywords by the API's normalization, keeping first-seen order."""
+    groups: Dict[str, List[str]] = {}
+    for keyword in keywords:
+        groups.setdefault(normalize_keyword(keyword), []).append(keyword)
+    return groups
+
 
+def _with_keyword(row: Any, keyword: str) -> Any:
+    """Copy of a result row under another spelling of its keyword."""
+    if isinstance(row, msgspec.Struct):
+        return msgspec.structs.replace(row, keyword=keyword)
+    return dataclasses.replace(row, keyword=keyword)
 
-class DataForSEOError(Exception):
-    """Custom exception for DataForSEO API errors"""
-    pass
+
+def _fan_out(row: Any, spellings: List[str]) -> List[Any]:
+    """One row per original spelling."""
+    return [row if keyword == row.keyword else _with_keyword(row, keyword) for keyword in spellings]
+
+
+def _raise_unexpected(outcomes: List[Any]) -> List[DataForSEOError]:
+    """API errors among ``gather(..., return_exceptions=True)`` outcomes; anything else is re-raised."""
+    errors = []
+    for outcome in outcomes:
+        if isinstance(outcome, DataForSEOError):
+            errors.append(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+    return errors
+
+
+def _search_volume_rows(task: Dict[str, Any]) -> List[SearchVolumeRow]:
+    """Rows of a search_volume task (directly in result, not in items)."""
+    return decode_rows(task.get("result"), SearchVolumeRow, "search_volume")
+
+
+def _clickstream_location_rows(task: Dict[str, Any]) -> List[SearchVolumeRow]:
+    """Items of a clickstream by-location task, tagged with their result's location."""
+    rows = []
+    for result in decode_rows(task.get("result"), ItemsResult[SearchVolumeRow], "clickstream"):
+        for row in result.items or []:
+            row.location_code = result.location_code
+            rows.append(row)
+    return rows
+
+
+def _clickstream_global_rows(task: Dict[str, Any]) -> List[GlobalSearchVolumeResult]:
+    """Items of a clickstream normalized (global) task."""
+    rows = []
+    for result in decode_rows(task.get("result"), ItemsResult[GlobalSearchVolumeResult], "clickstream"):
+        rows.extend(result.items or [])
+    return rows
 
 
 class DataForSEOClient:
@@ -45,103 +230,632 @@ class DataForSEOClient:
     - Proper error handling and logging
     - Rate limiting for external APIs
     - Async I/O for scalability
+    
+    Search volume calls made concurrently (several keyword groups, or the
+    same keywords across location/language combinations) are packed into a
+    single multi-task POST per endpoint, up to 100 tasks, and each caller
+    receives only its own task's results.
+    
+    Request counts, latency, bytes, keywords returned and cost are collected
+    per endpoint in ``metrics`` and logged as one summary when the client
+    closes; individual requests and keywords are only logged at DEBUG.
     """
     
-    def __init__(self, login: str, password: str, rate_limit: int = 12):
+    def __init__(
+        self,
+        login: str,
+        password: str,
+        rate_limit: int = 12,
+        trends_rate_limit: int = GENERAL_REQUESTS_PER_MINUTE,
+        endpoint_limits: Optional[Dict[str, EndpointLimit]] = None,
+        max_tasks_per_request: int = MAX_TASKS_PER_REQUEST,
+        pack_window: float = DEFAULT_PACK_WINDOW,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[ResponseCache] = None,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        connection_policy: Optional[ConnectionPolicy] = None,
+        compress_requests: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+        batch_sizer: Optional[AdaptiveBatchSizer] = None,
+        base_url: str = DEFAULT_BASE_URL
+    ):
         """
         Initialize DataForSEO client.
         
         Args:
             login: DataForSEO login email
             password: DataForSEO API password
-            rate_limit: Requests per minute (default: 12 for clickstream)
+            rate_limit: Requests per minute for clickstream and Google Ads search volume (default: 12)
+            trends_rate_limit: Requests per minute for Google Trends explore (default: 2000)
+            endpoint_limits: Optional budgets keyed by endpoint prefix, overriding the defaults
+            max_tasks_per_request: Tasks packed into one POST (default: 100, 1 disables packing)
+            pack_window: Seconds a task waits for others to share its POST (default: 0.05)
+            retry_policy: Retry/backoff settings (default: 4 attempts, 1-60s backoff)
+            circuit_breaker: Breaker shared by all requests (default: opens after 5 failures)
+            cache: Optional on-disk response cache; keywords found there are not re-requested
+            timeout_policy: Connect/read/total timeouts (default: 10s/120s/180s)
+            connection_policy: Keep-alive pool, per-host limit and DNS cache settings
+            compress_requests: Gzip large POST bodies (keyword lists) before sending
+            session: Existing session to share (e.g. from ``create_session``); it
+                is left open on exit. By default the client opens its own.
+            batch_sizer: Keywords-per-task controller fed by request latency and
+                timeouts (default: starts at 700, targets 60s per request)
+            base_url: API root including the version (default: production v3)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.headers = auth_headers(login, password)
+        self.timeout_policy = timeout_policy or TimeoutPolicy()
+        self.connection_policy = connection_policy or ConnectionPolicy()
+        self.compress_requests = compress_requests
+        self.rate_limiter = RateLimiter.for_account(
+            rate_limit,
+            trends_rate_limit=trends_rate_limit,
+            overrides=endpoint_limits
+        )
+        self.task_packer = TaskPacker(
+            self._post_tasks,
+            max_tasks=max_tasks_per_request,
+            pack_window=pack_window
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.cache = cache
+        self.metrics = ClientMetrics()
+        self.batch_sizer = batch_sizer or AdaptiveBatchSizer()
+        # In-flight keyword lookups by cache key, shared by identical requests
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        # Set by from_config, which opens the cache itself
+        self._owns_cache = False
+        
+    @classmethod
+    def from_config(
+        cls,
+        config: Any,
+        max_batch_size: Optional[int] = None,
+        **kwargs: Any
+    ) -> "DataForSEOClient":
+        """
+        Build a client from the app's ``Config``.
+        
+        Credentials, rate limits, base URL, timeouts, request compression and
+        the batch sizer's target latency are read from ``config``. Unless a
+        ``cache`` is passed, the response cache is opened at
+        ``DATAFORSEO_CACHE_PATH`` (none if that is empty) and closed when the
+        client exits.
+        
+        Args:
+            config: The ``Config`` class, passed in since scripts import it
+                as either ``config.config`` or ``src.config.config``
+            max_batch_size: Cap on keywords per task below the API maximum
+            **kwargs: Other constructor arguments, overriding the config
+            
+        Returns:
+            Unopened client, for use as an async context manager
         """
-        self.base_url = "https://api.dataforseo.com/v3"
-        self.auth = base64.b64encode(f"{login}:{password}".encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {self.auth}",
-            "Content-Type": "application/json"
+        settings: Dict[str, Any] = {
+            "rate_limit": config.DATAFORSEO_RATE_LIMIT,
+            "trends_rate_limit": config.DATAFORSEO_TRENDS_RATE_LIMIT,
+            "base_url": config.DATAFORSEO_BASE_URL,
+            "timeout_policy": TimeoutPolicy(
+                total=config.DATAFORSEO_TIMEOUT,
+                connect=config.DATAFORSEO_CONNECT_TIMEOUT,
+                sock_read=config.DATAFORSEO_READ_TIMEOUT
+            ),
+            "compress_requests": config.DATAFORSEO_COMPRESS_REQUESTS,
+            "batch_sizer": AdaptiveBatchSizer(
+                max_size=min(MAX_BATCH_SIZE, max_batch_size or MAX_BATCH_SIZE),
+                target_latency=config.DATAFORSEO_BATCH_TARGET_LATENCY
+            ),
+            **kwargs
         }
-        self.rate_limiter = asyncio.Semaphore(rate_limit)
-        self.session: Optional[aiohttp.ClientSession] = None
+        owns_cache = "cache" not in settings and bool(config.DATAFORSEO_CACHE_PATH)
+        if owns_cache:
+            # Re-runs and overlapping keyword lists are served from the on-disk cache
+            settings["cache"] = ResponseCache(
+                config.DATAFORSEO_CACHE_PATH,
+                max_bytes=config.DATAFORSEO_CACHE_MAX_MB * 1024 * 1024
+            )
+            
+        client = cls(config.DATAFORSEO_LOGIN_DECODED, config.DATAFORSEO_PASSWORD_DECODED, **settings)
+        client._owns_cache = owns_cache
+        return client
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers=self.headers
-        )
+        if self._owns_session:
+            self.session = create_session(
+                timeout=self.timeout_policy,
+                connection=self.connection_policy
+            )
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+        extra = {"batch_sizes": self.batch_sizer.to_dict()}
+        if self.cache:
+            extra["cache"] = self.cache.stats()
+        self.metrics.log_summary("run", extra=extra)
+        if self.cache and self._owns_cache:
+            self.cache.close()
             
     async def _make_request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Any] = None
+        data: Optional[Any] = None,
+        lazy_results: bool = False,
+        split_on_timeout: bool = False
     ) -> Dict[str, Any]:
         """
-        Make HTTP request with proper error handling and rate limiting.
+        Make HTTP request with proper error handling, rate limiting and retries.
+        
+        Network errors, timeouts, 5xx responses and DataForSEO 5xxxx codes are
+        retried with exponential backoff and jitter, honouring Retry-After.
+        With ``split_on_timeout``, a timeout of a request whose task has more
+        than one keyword is raised at once as DataForSEOTimeoutError instead,
+        so the caller can retry the keywords in smaller batches. Throttling
+        responses slow the endpoint's rate bucket instead. Other API errors
+        are raised immediately.
         
         Args:
             method: HTTP method (GET, POST)
             endpoint: API endpoint path
             data: Request payload
+            lazy_results: Leave each task's ``result`` undecoded for ``decode_rows``
+            split_on_timeout: Don't retry a timed-out multi-keyword task
             
         Returns:
             Response data as dictionary
             
         Raises:
             DataForSEOError: If API returns an error
+            DataForSEORateLimitError: If the API is still throttling after backing off
+            DataForSEOTimeoutError: If every attempt timed out, or the first one did with ``split_on_timeout``
+            DataForSEOCircuitOpenError: If the circuit breaker is open
         """
         if not self.session:
             raise DataForSEOError("Client not initialized. Use async context manager.")
             
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        start_time = time.time()
+        request_kwargs: Dict[str, Any] = {"headers": self.headers}
+        request_bytes = 0
+        if method == "POST":
+            body, body_headers = encode_json_body(data, self.compress_requests)
+            request_kwargs = {"data": body, "headers": {**self.headers, **body_headers}}
+            request_bytes = len(body)
+        keyword_counts = [
+            len(task.get("keywords") or ()) for task in data if isinstance(task, dict)
+        ] if method == "POST" and isinstance(data, list) else []
+        # Largest task decides whether a timeout can be split; the batch sizer
+        # gets every keyword in the POST, which is what the latency was spent on
+        task_keywords = max(keyword_counts, default=0)
+        sent_keywords = sum(keyword_counts)
+        timed_out = False
         
-        async with self.rate_limiter:
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            self.circuit_breaker.before_request()
+            start_time = time.time()
+            retry_after = None
+            response_bytes = 0
+            cost = 0.0
+            timed_out = False
+            
             try:
-                logger.info(f"{method} {url}")
-                
-                if method == "POST":
-                    async with self.session.post(url, json=data) as response:
-                        duration = time.time() - start_time
-                        logger.info(f"{method} {url} - {response.status} - {duration:.2f}s")
-                        
-                        response_data = await response.json()
+                async with self.rate_limiter.limit(endpoint):
+                    # Latency excludes time spent waiting on the rate limiter
+                    start_time = time.time()
+                    async with self.session.request(method, url, **request_kwargs) as response:
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                         
-                        # Check for API errors
-                        if response_data.get("status_code") != 20000:
+                        if response.status in RETRYABLE_HTTP_STATUSES or (
+                            response.status >= 400 and response.content_type != "application/json"
+                        ):
+                            status_code, error_msg = response.status, response.reason
+                        else:
+                            raw = await response.read()
+                            response_bytes = len(raw)
+                            response_data = decode_response(raw, lazy_results)
+                            status_code = response_data.get("status_code")
                             error_msg = response_data.get("status_message", "Unknown error")
-                            raise DataForSEOError(f"API error {response_data.get('status_code')}: {error_msg}")
+                            cost = response_data.get("cost") or 0.0
                             
-                        return response_data
-                else:
-                    async with self.session.get(url) as response:
                         duration = time.time() - start_time
-                        logger.info(f"{method} {url} - {response.status} - {duration:.2f}s")
-                        
-                        response_data = await response.json()
+                        logger.debug(f"{method} {url} - {response.status}/{status_code} - {duration:.2f}s")
+                        self.metrics.record_request(
+                            endpoint,
+                            duration,
+                            request_bytes=request_bytes,
+                            response_bytes=response_bytes,
+                            cost=cost,
+                            failed=status_code != 20000,
+                            throttled=is_throttled(status_code)
+                        )
                         
-                        if response_data.get("status_code") != 20000:
-                            error_msg = response_data.get("status_message", "Unknown error")
-                            raise DataForSEOError(f"API error {response_data.get('status_code')}: {error_msg}")
-                            
-                        return response_data
+                        if response.status == 504:
+                            timed_out = True
+                            self.batch_sizer.record_timeout(metric_endpoint(endpoint), sent_keywords)
                         
-            except aiohttp.ClientError as e:
+                        if status_code == 20000:
+                            self.batch_sizer.record(metric_endpoint(endpoint), sent_keywords, duration)
+                            self.circuit_breaker.record_success()
+                            self.rate_limiter.record_success(endpoint)
+                            for task in response_data.get("tasks") or []:
+                                self.metrics.record_task(endpoint, task)
+                            return response_data
+                                
+            except (aiohttp.ClientError, asyncio.TimeoutError, msgspec.DecodeError) as e:
                 duration = time.time() - start_time
-                logger.error(f"{method} {url} - FAILED - {duration:.2f}s - {e}")
-                raise DataForSEOError(f"Request failed: {e}")
-            except Exception as e:
-                duration = time.time() - start_time
-                logger.error(f"{method} {url} - ERROR - {duration:.2f}s - {e}")
+                logger.error(f"{method} {url} - FAILED - {duration:.2f}s - {e!r}")
+                self.metrics.record_request(
+                    endpoint, duration, request_bytes=request_bytes, response_bytes=response_bytes, failed=True
+                )
+                status_code, error_msg = None, f"Request failed: {e!r}"
+                if isinstance(e, asyncio.TimeoutError):
+                    timed_out = True
+                    self.batch_sizer.record_timeout(metric_endpoint(endpoint), sent_keywords)
+                
+            if split_on_timeout and timed_out and task_keywords > 1:
+                # The same batch would likely time out again; let the caller split it now
+                self.circuit_breaker.record_failure()
+                raise DataForSEOTimeoutError(
+                    f"API error {status_code}: {error_msg} (timed out with {task_keywords} keywords in a task)"
+                )
+                
+            await self._before_retry(method, url, endpoint, attempt, status_code, error_msg, retry_after)
+                
+        self._give_up(status_code, error_msg, retry_after, timed_out)
+        
+    async def _before_retry(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        attempt: int,
+        status_code: Optional[int],
+        error_msg: str,
+        retry_after: Optional[float]
+    ) -> None:
+        """
+        Classify a failed attempt and wait before the next one.
+        
+        Raises:
+            DataForSEOError: If the failure is not worth retrying
+        """
+        delay = 0.0
+        if is_throttled(status_code):
+            # Not a sign of degradation; the limiter's pause does the waiting
+            self.rate_limiter.throttle(endpoint, retry_after)
+        elif is_retryable(status_code):
+            self.circuit_breaker.record_failure()
+            delay = self.retry_policy.backoff(attempt, retry_after)
+        else:
+            # The API answered; retrying the same request would fail again
+            self.circuit_breaker.record_success()
+            raise DataForSEOError(f"API error {status_code}: {error_msg}")
+            
+        if attempt < self.retry_policy.max_attempts:
+            logger.warning(
+                f"{method} {url} - attempt {attempt}/{self.retry_policy.max_attempts} "
+                f"failed ({status_code}: {error_msg}), retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            
+    def _give_up(
+        self,
+        status_code: Optional[int],
+        error_msg: str,
+        retry_after: Optional[float],
+        timed_out: bool = False
+    ) -> None:
+        """Raise the error for a request that failed every attempt."""
+        message = (
+            f"API error {status_code}: {error_msg} "
+            f"(gave up after {self.retry_policy.max_attempts} attempts)"
+        )
+        if is_throttled(status_code):
+            raise DataForSEORateLimitError(message, retry_after=retry_after)
+        if timed_out:
+            raise DataForSEOTimeoutError(message)
+        raise DataForSEOError(message)
+        
+    async def _post_tasks(
+        self,
+        endpoint: str,
+        tasks: List[Dict[str, Any]],
+        split_on_timeout: bool = False
+    ) -> Dict[str, Any]:
+        """POST a packed task array; used by the task packer."""
+        return await self._make_request(
+            "POST", endpoint, tasks, lazy_results=True, split_on_timeout=split_on_timeout
+        )
+        
+    async def request(self, method: str, endpoint: str, data: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Send one request with the client's retries, rate limiting and circuit breaker.
+        
+        For endpoints without a dedicated method (the standard task queue's
+        task_post, tasks_ready and task_get).
+        
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint path
+            data: Request payload
+            
+        Returns:
+            Response data as dictionary
+            
+        Raises:
+            DataForSEOError: If the API returns an error
+        """
+        return await self._make_request(method, endpoint, data)
+        
+    async def post_live_task(self, endpoint: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a single task and return its entry from the response.
+        
+        For live endpoints that take one task per request (Google Trends
+        explore); the task's ``result`` is left as undecoded JSON for
+        ``decode_rows``.
+        
+        Raises:
+            DataForSEOError: If the API returns an error or no task
+        """
+        response = await self._make_request("POST", endpoint, [task], lazy_results=True)
+        tasks = response.get("tasks") or []
+        if not tasks:
+            raise DataForSEOError(f"No task in response from {endpoint}")
+        return tasks[0]
+        
+    async def _submit_keyword_task(
+        self,
+        endpoint: str,
+        task_data: Dict[str, Any],
+        extract: Callable[[Dict[str, Any]], List[Any]],
+        row_type: type,
+        split_on_timeout: bool = False
+    ) -> List[Any]:
+        """
+        Submit a keyword task, sending each distinct keyword at most once.
+        
+        Keywords are deduplicated on the API's own normalization (case and
+        whitespace), then served from the cache or from an identical request
+        already in flight (single-flight); only the rest are sent. Returned
+        rows are cached per keyword and fanned back out to every original
+        spelling.
+        
+        Args:
+            endpoint: API endpoint path
+            task_data: Task object with a ``keywords`` list
+            extract: Decodes the per-keyword rows of a response task
+            row_type: Row class, used to decode cached entries
+            split_on_timeout: Raise a timeout of a multi-keyword task without retrying
+            
+        Returns:
+            Per-keyword rows in input order, one per original spelling
+        """
+        spellings = _group_spellings(task_data["keywords"])
+        keys = {norm: ResponseCache.key(endpoint, task_data, norm) for norm in spellings}
+        rows: Dict[str, Any] = {}
+        
+        if self.cache:
+            cached = self.cache.get_many(endpoint, keys.values(), row_type)
+            rows.update((norm, cached[key]) for norm, key in keys.items() if key in cached)
+            
+        # Join identical requests already in flight; own the rest
+        joined: Dict[str, asyncio.Future] = {}
+        owned: Dict[str, asyncio.Future] = {}
+        loop = asyncio.get_running_loop()
+        for norm, key in keys.items():
+            if norm in rows:
+                continue
+            if key in self._inflight:
+                joined[norm] = self._inflight[key]
+            else:
+                owned[norm] = self._inflight[key] = loop.create_future()
+                
+        unmatched: List[Any] = []
+        if owned:
+            task_data = {**task_data, "keywords": [spellings[norm][0] for norm in owned]}
+            try:
+                for row in await self._fetch_keyword_rows(endpoint, task_data, extract, split_on_timeout):
+                    norm = normalize_keyword(row.keyword)
+                    if norm in owned and norm not in rows:
+                        rows[norm] = row
+                    else:
+                        unmatched.append(row)
+                for norm, future in owned.items():
+                    future.set_result(rows.get(norm))
+            except BaseException as e:
+                error = e if isinstance(e, Exception) else DataForSEOError("Coalesced request was cancelled")
+                for future in owned.values():
+                    if not future.done():
+                        future.set_exception(error)
+                        # Waiters see it when they await; don't warn if there were none
+                        future.exception()
                 raise
+            finally:
+                for norm in owned:
+                    self._inflight.pop(keys[norm], None)
+                    
+        if joined:
+            # Shielded: a cancelled waiter must not cancel the owner's future
+            results = await asyncio.gather(*(asyncio.shield(future) for future in joined.values()))
+            rows.update((norm, row) for norm, row in zip(joined, results) if row is not None)
+            
+        fanned = []
+        for norm, originals in spellings.items():
+            row = rows.get(norm)
+            if row is not None:
+                fanned.extend(_fan_out(row, originals))
+        return fanned + unmatched
+        
+    async def _fetch_keyword_rows(
+        self,
+        endpoint: str,
+        task_data: Dict[str, Any],
+        extract: Callable[[Dict[str, Any]], List[Any]],
+        split_on_timeout: bool = False
+    ) -> List[Any]:
+        """Send one keyword task through the packer and cache the rows it returns."""
+        task = await self.task_packer.submit(endpoint, task_data, split_on_timeout=split_on_timeout)
+        if task.get("status_code") != 20000:
+            logger.error(f"Task error: {task.get('status_message')}")
+            logger.error(f"Task data: {task.get('data')}")
+            return []
+            
+        fetched = extract(task)
+        self.metrics.record_keywords(endpoint, len(fetched))
+        if self.cache:
+            self.cache.put_many(endpoint, {
+                ResponseCache.key(endpoint, task_data, row.keyword): row
+                for row in fetched
+            })
+        return fetched
+        
+    async def _stream_rows(
+        self,
+        endpoint: str,
+        task_data: Dict[str, Any],
+        row_type: type
+    ) -> AsyncIterator[Any]:
+        """
+        POST one task and decode its result rows while the body is still arriving.
+        
+        Rows are yielded as soon as each one is complete, so only the current
+        row and the response envelope are held in memory. Failures before the
+        first row are retried like ``_make_request``; once rows have been
+        yielded a failure is raised instead, since a retry would repeat them.
+        
+        Raises:
+            DataForSEOError: If the request fails or is interrupted mid-stream
+        """
+        if not self.session:
+            raise DataForSEOError("Client not initialized. Use async context manager.")
+            
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        body, body_headers = encode_json_body([task_data], self.compress_requests)
+        headers = {**self.headers, **body_headers}
+        decoder = msgspec.json.Decoder(row_type)
+        
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            self.circuit_breaker.before_request()
+            start_time = time.time()
+            retry_after = None
+            response_bytes = 0
+            cost = 0.0
+            yielded = 0
+            
+            try:
+                async with self.rate_limiter.limit(endpoint):
+                    start_time = time.time()
+                    async with self.session.post(url, data=body, headers=headers) as response:
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                        
+                        if response.status != 200 or response.content_type != "application/json":
+                            status_code, error_msg = response.status, response.reason
+                        else:
+                            parser = ResultStreamParser()
+                            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                                response_bytes += len(chunk)
+                                for raw in parser.feed(chunk):
+                                    try:
+                                        row = decoder.decode(raw)
+                                    except msgspec.ValidationError as e:
+                                        raise DataForSEOError(f"Malformed result from {endpoint}: {e}")
+                                    yielded += 1
+                                    yield row
+                                    
+                            envelope = decode_response(parser.close())
+                            status_code = envelope.get("status_code")
+                            error_msg = envelope.get("status_message", "Unknown error")
+                            cost = envelope.get("cost") or 0.0
+                            for task in envelope.get("tasks") or []:
+                                self.metrics.record_task(endpoint, task)
+                                if task.get("status_code") != 20000:
+                                    logger.error(f"Task error: {task.get('status_message')}")
+                                    logger.error(f"Task data: {task.get('data')}")
+                                    
+                        duration = time.time() - start_time
+                        self.metrics.record_request(
+                            endpoint,
+                            duration,
+                            request_bytes=len(body),
+                            response_bytes=response_bytes,
+                            cost=cost,
+                            failed=status_code != 20000,
+                            throttled=is_throttled(status_code)
+                        )
+                        self.metrics.record_keywords(endpoint, yielded)
+                        
+                        if status_code == 20000:
+                            self.circuit_breaker.record_success()
+                            self.rate_limiter.record_success(endpoint)
+                            return
+                            
+            except (aiohttp.ClientError, asyncio.TimeoutError, msgspec.DecodeError, ValueError) as e:
+                duration = time.time() - start_time
+                logger.error(f"POST {url} - FAILED - {duration:.2f}s - {e!r}")
+                self.metrics.record_request(
+                    endpoint, duration, request_bytes=len(body), response_bytes=response_bytes, failed=True
+                )
+                self.metrics.record_keywords(endpoint, yielded)
+                status_code, error_msg = None, f"Request failed: {e!r}"
+                
+            if yielded:
+                self.circuit_breaker.record_failure()
+                raise DataForSEOError(
+                    f"Stream from {endpoint} interrupted after {yielded} rows ({status_code}: {error_msg})"
+                )
+            await self._before_retry("POST", url, endpoint, attempt, status_code, error_msg, retry_after)
+            
+        self._give_up(status_code, error_msg, retry_after)
+        
+    async def _stream_keyword_task(
+        self,
+        endpoint: str,
+        task_data: Dict[str, Any],
+        row_type: type
+    ) -> AsyncIterator[Any]:
+        """
+        Streaming counterpart of ``_submit_keyword_task``.
+        
+        Keywords are deduplicated the same way. Cached keywords are yielded
+        first; the rest are streamed from the API and written to the cache in
+        small groups as they arrive.
+        """
+        spellings = _group_spellings(task_data["keywords"])
+        missing = list(spellings)
+        if self.cache:
+            keys = {norm: ResponseCache.key(endpoint, task_data, norm) for norm in spellings}
+            cached = self.cache.get_many(endpoint, keys.values(), row_type)
+            missing = [norm for norm, key in keys.items() if key not in cached]
+            for norm, key in keys.items():
+                if key in cached:
+                    for row in _fan_out(cached.pop(key), spellings[norm]):
+                        yield row
+            if not missing:
+                return
+        task_data = {**task_data, "keywords": [spellings[norm][0] for norm in missing]}
+            
+        pending = {}
+        try:
+            async for row in self._stream_rows(endpoint, task_data, row_type):
+                if self.cache:
+                    pending[ResponseCache.key(endpoint, task_data, row.keyword)] = row
+                    if len(pending) >= STREAM_CACHE_FLUSH:
+                        self.cache.put_many(endpoint, pending)
+                        pending = {}
+                for fanned in _fan_out(row, spellings.get(normalize_keyword(row.keyword), [row.keyword])):
+                    yield fanned
+        finally:
+            if self.cache and pending:
+                self.cache.put_many(endpoint, pending)
                 
     async def get_locations_and_languages(self) -> Dict[str, Any]:
         """
@@ -151,7 +865,16 @@ class DataForSEOClient:
             Dictionary with locations and languages data
         """
         endpoint = "keywords_data/clickstream_data/locations_and_languages"
-        return await self._make_request("GET", endpoint)
+        if self.cache:
+            key = ResponseCache.key(endpoint, {})
+            cached = self.cache.get_many(endpoint, [key])
+            if key in cached:
+                return cached[key]
+                
+        response = await self._make_request("GET", endpoint)
+        if self.cache:
+            self.cache.put_many(endpoint, {key: response})
+        return response
         
     async def get_search_volume(
         self,
@@ -161,7 +884,8 @@ class DataForSEOClient:
         language_name: Optional[str] = None,
         language_code: Optional[str] = None,
         use_clickstream: bool = True,
-        tag: Optional[str] = None
+        tag: Optional[str] = None,
+        split_on_timeout: bool = False
     ) -> List[SearchVolumeResult]:
         """
         Get search volume data for keywords with location/language settings.
@@ -174,6 +898,8 @@ class DataForSEOClient:
             language_code: Language code (e.g., "en")
             use_clickstream: Use clickstream data (default: True)
             tag: Optional task identifier
+            split_on_timeout: Raise a timeout at once rather than retrying, so the
+                caller can resend the keywords in smaller batches
             
         Returns:
             List of SearchVolumeResult objects
@@ -182,11 +908,83 @@ class DataForSEOClient:
             ValueError: If required parameters are missing
             DataForSEOError: If API returns an error
         """
+        task_data = self._build_search_volume_task(
+            keywords,
+            location_name=location_name,
+            location_code=location_code,
+            language_name=language_name,
+            language_code=language_code,
+            use_clickstream=use_clickstream,
+            tag=tag
+        )
+        
+        endpoint = "keywords_data/google/search_volume/live"
+        rows = await self._submit_keyword_task(
+            endpoint, task_data, _search_volume_rows, SearchVolumeRow, split_on_timeout
+        )
+        return [self._to_search_volume_result(row) for row in rows]
+        
+    async def stream_search_volume(
+        self,
+        keywords: List[str],
+        location_name: Optional[str] = None,
+        location_code: Optional[int] = None,
+        language_name: Optional[str] = None,
+        language_code: Optional[str] = None,
+        use_clickstream: bool = True,
+        tag: Optional[str] = None
+    ) -> AsyncIterator[SearchVolumeResult]:
+        """
+        Get search volume, yielding each keyword's result as the response streams in.
+        
+        Same parameters and results as ``get_search_volume``, but rows are
+        decoded incrementally from the response body, so memory stays flat
+        regardless of batch size and callers can start writing results
+        before the whole response has arrived. Streamed tasks are sent on
+        their own rather than packed with concurrent calls.
+        
+        Yields:
+            SearchVolumeResult objects, cached keywords first
+            
+        Raises:
+            ValueError: If required parameters are missing
+            DataForSEOError: If the request fails or is interrupted mid-stream
+        """
+        task_data = self._build_search_volume_task(
+            keywords,
+            location_name=location_name,
+            location_code=location_code,
+            language_name=language_name,
+            language_code=language_code,
+            use_clickstream=use_clickstream,
+            tag=tag
+        )
+        
+        endpoint = "keywords_data/google/search_volume/live"
+        async for row in self._stream_keyword_task(endpoint, task_data, SearchVolumeRow):
+            yield self._to_search_volume_result(row)
+            
+    def _build_search_volume_task(
+        self,
+        keywords: List[str],
+        location_name: Optional[str] = None,
+        location_code: Optional[int] = None,
+        language_name: Optional[str] = None,
+        language_code: Optional[str] = None,
+        use_clickstream: bool = True,
+        tag: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate parameters and build one search volume task object.
+        
+        Raises:
+            ValueError: If required parameters are missing
+        """
         if not keywords:
             raise ValueError("Keywords list cannot be empty")
             
-        if len(keywords) > 1000:
-            raise ValueError("Maximum 1000 keywords allowed per request")
+        if len(keywords) > MAX_KEYWORDS_PER_REQUEST:
+            raise ValueError(f"Maximum {MAX_KEYWORDS_PER_REQUEST} keywords allowed per request")
             
         if not (location_name or location_code):
             raise ValueError("Either location_name or location_code is required")
@@ -194,53 +992,372 @@ class DataForSEOClient:
         if not (language_name or language_code):
             raise ValueError("Either language_name or language_code is required")
             
-        # Build payload
-        payload = [{
+        # Build task
+        task_data = {
             "keywords": keywords,
             "use_clickstream": use_clickstream
-        }]
+        }
         
         if location_name:
-            payload[0]["location_name"] = location_name
+            task_data["location_name"] = location_name
         elif location_code:
-            payload[0]["location_code"] = location_code
+            task_data["location_code"] = location_code
             
         if language_name:
-            payload[0]["language_name"] = language_name
+            task_data["language_name"] = language_name
         elif language_code:
-            payload[0]["language_code"] = language_code
+            task_data["language_code"] = language_code
             
         if tag:
-            payload[0]["tag"] = tag
+            task_data["tag"] = tag
+            
+        return task_data
+        
+    def _parse_search_volume_task(self, task: Dict[str, Any]) -> List[SearchVolumeResult]:
+        """Convert one search volume task from a response into result objects."""
+        if task.get("status_code") != 20000:
+            logger.error(f"Task error: {task.get('status_message')}")
+            logger.error(f"Task data: {task.get('data')}")
+            return []
+            
+        rows = _search_volume_rows(task)
+        self.metrics.record_keywords("keywords_data/google/search_volume/task_get", len(rows))
+        return [self._to_search_volume_result(row) for row in rows]
+        
+    def _to_search_volume_result(self, row: SearchVolumeRow) -> SearchVolumeResult:
+        """Convert one decoded keyword row of a search volume result."""
+        logger.debug(f"Processed keyword: {row.keyword} - Volume: {row.search_volume}")
+        return SearchVolumeResult.from_row(row)
+        
+    async def get_search_volume_many(
+        self,
+        keywords: Union[List[str], AsyncIterable[str]],
+        location_name: Optional[str] = None,
+        location_code: Optional[int] = None,
+        language_name: Optional[str] = None,
+        language_code: Optional[str] = None,
+        use_clickstream: bool = True,
+        batch_size: Optional[int] = None,
+        tag_prefix: Optional[str] = None,
+        max_concurrency: int = MAX_SIMULTANEOUS_REQUESTS
+    ) -> AsyncIterator[SearchVolumeBatch]:
+        """
+        Get search volume for any number of keywords.
+        
+        Keywords are cut into batches as request slots free up and run
+        concurrently under the client's rate limiter. Unless ``batch_size``
+        is given, each batch takes the size ``batch_sizer`` currently
+        recommends for the endpoint, so batches grow while requests stay fast
+        and shrink after slow ones. A batch that times out is split in half
+        and both halves are retried instead of dropping it.
+        
+        ``keywords`` may be an async iterable (e.g. fed from a queue), which
+        is consumed only as batches are dispatched, so at most
+        ``max_concurrency`` batches of keywords are held at a time.
+        
+        Batches are yielded in completion order, not submission order, and
+        numbered in dispatch order. A failed batch is yielded with ``error``
+        set so the caller decides whether to retry or report it; other
+        batches keep going.
+        
+        Args:
+            keywords: Keywords to look up (any number), as a list or async iterable
+            location_name: Full location name (e.g., "United States")
+            location_code: Location code (e.g., 2840)
+            language_name: Full language name (e.g., "English")
+            language_code: Language code (e.g., "en")
+            use_clickstream: Use clickstream data (default: True)
+            batch_size: Fixed keywords per request (max 1000); adaptive if None
+            tag_prefix: Optional prefix; batches are tagged "{tag_prefix}_{n}"
+            max_concurrency: Maximum batches in flight at once
+            
+        Yields:
+            SearchVolumeBatch objects as each batch finishes
+            
+        Raises:
+            ValueError: If required parameters are missing
+        """
+        source = keywords.__aiter__() if hasattr(keywords, "__aiter__") else None
+        if source is None and not keywords:
+            raise ValueError("Keywords list cannot be empty")
+            
+        if batch_size is not None and not 1 <= batch_size <= MAX_KEYWORDS_PER_REQUEST:
+            raise ValueError(f"batch_size must be between 1 and {MAX_KEYWORDS_PER_REQUEST}")
+            
+        if not (location_name or location_code):
+            raise ValueError("Either location_name or location_code is required")
+            
+        if not (language_name or language_code):
+            raise ValueError("Either language_name or language_code is required")
             
-        # Make request
         endpoint = "keywords_data/google/search_volume/live"
-        response = await self._make_request("POST", endpoint, payload)
+        # Halves of timed-out batches, sent before any new keywords
+        splits: Deque[List[str]] = deque()
+        offset = 0
+        dispatched = 0
+        exhausted = False
         
-        # Parse results
-        results = []
-        for task in response.get("tasks", []):
-            if task.get("status_code") != 20000:
-                logger.error(f"Task error: {task.get('status_message')}")
-                logger.error(f"Task data: {task.get('data')}")
-                continue
+        async def next_batch() -> Optional[List[str]]:
+            nonlocal offset, exhausted
+            if splits:
+                return splits.popleft()
+            size = batch_size or self.batch_sizer.size(endpoint)
+            if source is None:
+                if offset >= len(keywords):
+                    return None
+                batch = keywords[offset:offset + size]
+                offset += len(batch)
+                return batch
+            batch = []
+            while not exhausted and len(batch) < size:
+                try:
+                    batch.append(await source.__anext__())
+                except StopAsyncIteration:
+                    exhausted = True
+            return batch or None
+            
+        async def run_batch(batch_number: int, batch: List[str]) -> Optional[SearchVolumeBatch]:
+            try:
+                results = await self.get_search_volume(
+                    keywords=batch,
+                    location_name=location_name,
+                    location_code=location_code,
+                    language_name=language_name,
+                    language_code=language_code,
+                    use_clickstream=use_clickstream,
+                    tag=f"{tag_prefix}_{batch_number}" if tag_prefix else None,
+                    split_on_timeout=len(batch) > 1
+                )
+                return SearchVolumeBatch(batch_number, batch, results)
+            except DataForSEOTimeoutError as e:
+                if len(batch) > 1:
+                    half = (len(batch) + 1) // 2
+                    logger.warning(
+                        f"Batch {batch_number} ({len(batch)} keywords) timed out, "
+                        f"retrying as {half} + {len(batch) - half}"
+                    )
+                    splits.extendleft([batch[half:], batch[:half]])
+                    return None
+                logger.error(f"Batch {batch_number} failed: {e}")
+                return SearchVolumeBatch(batch_number, batch, error=e)
+            except DataForSEOError as e:
+                logger.error(f"Batch {batch_number} failed: {e}")
+                return SearchVolumeBatch(batch_number, batch, error=e)
                 
-            # Results are directly in the result array, not in items
-            for result in task.get("result", []):
-                # Each result is a keyword data object
-                if "keyword" in result and "search_volume" in result:
-                    results.append(SearchVolumeResult(
-                        keyword=result["keyword"],
-                        search_volume=result["search_volume"],
-                        monthly_searches=result.get("monthly_searches", []),
-                        location_code=result.get("location_code"),
-                        language_code=result.get("language_code"),
-                        use_clickstream=result.get("use_clickstream", True)
-                    ))
-                    logger.info(f"Processed keyword: {result['keyword']} - Volume: {result['search_volume']}")
+        in_flight = set()
+        try:
+            while True:
+                while len(in_flight) < max_concurrency:
+                    batch = await next_batch()
+                    if batch is None:
+                        break
+                    dispatched += 1
+                    in_flight.add(asyncio.ensure_future(run_batch(dispatched, batch)))
+                if not in_flight:
+                    break
                     
-        return results
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        yield result
+        finally:
+            # Caller stopped early or failed: don't leave orphaned requests running
+            for task in in_flight:
+                task.cancel()
+                
+    async def get_search_volume_queued(
+        self,
+        keywords: List[str],
+        location_name: Optional[str] = None,
+        location_code: Optional[int] = None,
+        language_name: Optional[str] = None,
+        language_code: Optional[str] = None,
+        use_clickstream: bool = True,
+        batch_size: int = MAX_KEYWORDS_PER_REQUEST,
+        tag_prefix: str = "sv",
+        receiver: Optional[PingbackReceiver] = None,
+        poll_interval: float = 5.0,
+        timeout: float = 3600.0
+    ) -> AsyncIterator[SearchVolumeBatch]:
+        """
+        Get search volume through the standard (queued) task mode.
+        
+        Cheaper than the live endpoint but results take minutes rather than
+        seconds, which suits scheduled refreshes. All batches are posted up
+        front with task_post, then collected as they finish.
         
+        Args:
+            keywords: Keywords to look up (any number)
+            location_name: Full location name (e.g., "United States")
+            location_code: Location code (e.g., 2840)
+            language_name: Full language name (e.g., "English")
+            language_code: Language code (e.g., "en")
+            use_clickstream: Use clickstream data (default: True)
+            batch_size: Keywords per task (max 1000)
+            tag_prefix: Prefix for the unique tag given to each task
+            receiver: Optional pingback/postback receiver to avoid waiting on polls
+            poll_interval: Initial seconds between tasks_ready polls
+            timeout: Seconds to wait for all tasks
+            
+        Yields:
+            SearchVolumeBatch objects as each task is collected
+            
+        Raises:
+            ValueError: If required parameters are missing
+            DataForSEOError: If posting fails or tasks time out
+        """
+        if not keywords:
+            raise ValueError("Keywords list cannot be empty")
+            
+        if not 1 <= batch_size <= MAX_KEYWORDS_PER_REQUEST:
+            raise ValueError(f"batch_size must be between 1 and {MAX_KEYWORDS_PER_REQUEST}")
+            
+        run_id = datetime.now().strftime("%Y%m%d%H%M%S")
+        batches: Dict[str, SearchVolumeBatch] = {}
+        tasks = []
+        for number, i in enumerate(range(0, len(keywords), batch_size), 1):
+            batch = keywords[i:i + batch_size]
+            tag = f"{tag_prefix}_{run_id}_{number}"
+            tasks.append(self._build_search_volume_task(
+                batch,
+                location_name=location_name,
+                location_code=location_code,
+                language_name=language_name,
+                language_code=language_code,
+                use_clickstream=use_clickstream,
+                tag=tag
+            ))
+            batches[tag] = SearchVolumeBatch(number, batch)
+            
+        runner = QueuedTaskRunner(
+            self,
+            "keywords_data/google/search_volume",
+            poll_interval=poll_interval,
+            timeout=timeout,
+            receiver=receiver
+        )
+        async for task in runner.run(tasks):
+            tag = (task.get("data") or {}).get("tag")
+            batch = batches.pop(tag, None)
+            if batch is None:
+                logger.warning(f"Ignoring queued task with unknown tag: {tag}")
+                continue
+                
+            if task.get("status_code") != 20000:
+                batch.error = DataForSEOError(
+                    f"Task error {task.get('status_code')}: {task.get('status_message')}"
+                )
+            else:
+                batch.results = self._parse_search_volume_task(task)
+            yield batch
+            
+    def task_prices(self) -> Dict[str, float]:
+        """USD per search volume task by mode, observed this run where possible."""
+        prices = dict(DEFAULT_TASK_PRICES)
+        observed = {
+            MODE_LIVE: self.metrics.cost_per_task("keywords_data/google/search_volume/live"),
+            MODE_QUEUED: self.metrics.cost_per_task("keywords_data/google/search_volume/task_post"),
+        }
+        prices.update({mode: price for mode, price in observed.items() if price})
+        return prices
+        
+    def plan_search_volume(
+        self,
+        num_keywords: int,
+        budget: Budget,
+        ledger: Optional[CostLedger] = None,
+        allow_queued: bool = True,
+        prefer_queued: bool = False
+    ) -> SchedulePlan:
+        """
+        Plan a search volume refresh that fits the remaining budget.
+        
+        Args:
+            num_keywords: Keywords wanting a refresh, in priority order
+            budget: Per-run and/or per-day limits
+            ledger: Daily spend record, required for a per-day limit to count earlier runs
+            allow_queued: Allow the cheaper standard queue (results take minutes)
+            prefer_queued: Use the queue whenever it is cheaper; otherwise only when the budget requires it
+            
+        Returns:
+            SchedulePlan for ``get_search_volume_planned``
+        """
+        available = budget.remaining(
+            run_spent=self.metrics.total_cost,
+            day_spent=ledger.spent() if ledger else 0.0
+        )
+        plan = plan_schedule(
+            num_keywords,
+            available,
+            allow_queued=allow_queued,
+            prices=self.task_prices(),
+            prefer_queued=prefer_queued
+        )
+        logger.info(f"Search volume plan: {plan}")
+        if plan.skipped:
+            logger.warning(f"Budget covers {plan.keywords} of {num_keywords} keywords; skipping the rest")
+        return plan
+        
+    async def get_search_volume_planned(
+        self,
+        keywords: List[str],
+        plan: SchedulePlan,
+        location_name: Optional[str] = None,
+        location_code: Optional[int] = None,
+        language_name: Optional[str] = None,
+        language_code: Optional[str] = None,
+        use_clickstream: bool = True,
+        tag_prefix: Optional[str] = None,
+        ledger: Optional[CostLedger] = None
+    ) -> AsyncIterator[SearchVolumeBatch]:
+        """
+        Run a plan from ``plan_search_volume``.
+        
+        The first ``plan.keywords`` keywords are fetched in the plan's mode
+        and batch size; the rest are left for a later run. What the run
+        actually cost, per endpoint, is added to ``ledger``.
+        
+        Yields:
+            SearchVolumeBatch objects as batches finish
+        """
+        selected = keywords[:plan.keywords]
+        if not selected:
+            return
+            
+        before = self.metrics.cost_by_endpoint()
+        try:
+            if plan.mode == MODE_QUEUED:
+                batches = self.get_search_volume_queued(
+                    selected,
+                    location_name=location_name,
+                    location_code=location_code,
+                    language_name=language_name,
+                    language_code=language_code,
+                    use_clickstream=use_clickstream,
+                    batch_size=plan.batch_size,
+                    tag_prefix=tag_prefix or "sv"
+                )
+            else:
+                batches = self.get_search_volume_many(
+                    selected,
+                    location_name=location_name,
+                    location_code=location_code,
+                    language_name=language_name,
+                    language_code=language_code,
+                    use_clickstream=use_clickstream,
+                    batch_size=plan.batch_size,
+                    tag_prefix=tag_prefix
+                )
+            async for batch in batches:
+                yield batch
+        finally:
+            if ledger:
+                ledger.record({
+                    endpoint: cost - before.get(endpoint, 0.0)
+                    for endpoint, cost in self.metrics.cost_by_endpoint().items()
+                })
+                
     async def get_global_search_volume(
         self,
         keywords: List[str],
@@ -259,41 +1376,25 @@ class DataForSEOClient:
         if not keywords:
             raise ValueError("Keywords list cannot be empty")
             
-        if len(keywords) > 1000:
-            raise ValueError("Maximum 1000 keywords allowed per request")
+        if len(keywords) > MAX_KEYWORDS_PER_REQUEST:
+            raise ValueError(f"Maximum {MAX_KEYWORDS_PER_REQUEST} keywords allowed per request")
             
         for keyword in keywords:
             if len(keyword) < 3:
                 raise ValueError(f"Keyword '{keyword}' must be at least 3 characters")
                 
-        # Build payload
-        payload = [{
+        # Build task
+        task_data = {
             "keywords": keywords
-        }]
+        }
         
         if tag:
-            payload[0]["tag"] = tag
+            task_data["tag"] = tag
             
-        # Make request
         endpoint = "keywords_data/clickstream_data/search_volume_normalized/live"
-        response = await self._make_request("POST", endpoint, payload)
-        
-        # Parse results
-        results = []
-        for task in response.get("tasks", []):
-            if task.get("status_code") != 20000:
-                logger.error(f"Task error: {task.get('status_message')}")
-                continue
-                
-            for result in task.get("result", []):
-                for item in result.get("items", []):
-                    results.append(GlobalSearchVolumeResult(
-                        keyword=item["keyword"],
-                        search_volume=item["search_volume"],
-                        country_distribution=item.get("country_distribution", [])
-                    ))
-                    
-        return results
+        return await self._submit_keyword_task(
+            endpoint, task_data, _clickstream_global_rows, GlobalSearchVolumeResult
+        )
         
     async def get_search_volume_by_location(
         self,
@@ -320,37 +1421,150 @@ class DataForSEOClient:
         if not (location_name or location_code):
             raise ValueError("Either location_name or location_code is required")
             
-        # Build payload
-        payload = [{
+        # Build task
+        task_data = {
             "keywords": keywords
-        }]
+        }
         
         if location_name:
-            payload[0]["location_name"] = location_name
+            task_data["location_name"] = location_name
         elif location_code:
-            payload[0]["location_code"] = location_code
+            task_data["location_code"] = location_code
             
         if tag:
-            payload[0]["tag"] = tag
+            task_data["tag"] = tag
             
-        # Make request
         endpoint = "keywords_data/clickstream_data/search_volume_by_location/live"
-        response = await self._make_request("POST", endpoint, payload)
+        rows = await self._submit_keyword_task(
+            endpoint, task_data, _clickstream_location_rows, SearchVolumeRow
+        )
+        return [SearchVolumeResult.from_row(row) for row in rows]
         
-        # Parse results
-        results = []
-        for task in response.get("tasks", []):
-            if task.get("status_code") != 20000:
-                logger.error(f"Task error: {task.get('status_message')}")
+    async def get_search_volume_matrix(
+        self,
+        keywords: List[str],
+        location_codes: List[int],
+        tag_prefix: Optional[str] = None
+    ) -> VolumeMatrix:
+        """
+        Get clickstream search volume for every keyword in every location.
+        
+        One by-location task is made per location and group of up to 1000
+        keywords. All of them run concurrently under the rate limiter and are
+        packed into multi-task POSTs. A failed task is logged and leaves its
+        cells missing.
+        
+        Args:
+            keywords: Keywords (matrix rows)
+            location_codes: Location codes (matrix columns), e.g. [2840, 2826]
+            tag_prefix: Optional prefix; tasks are tagged "{tag_prefix}_{n}"
+            
+        Returns:
+            VolumeMatrix with location codes as columns
+            
+        Raises:
+            DataForSEOError: If every task failed
+        """
+        if not keywords:
+            raise ValueError("Keywords list cannot be empty")
+            
+        if not location_codes:
+            raise ValueError("At least one location code is required")
+            
+        matrix = VolumeMatrix(keywords, location_codes)
+        endpoint = "keywords_data/clickstream_data/search_volume_by_location/live"
+        
+        def task_data(number: int, location_code: int, chunk: List[str]) -> Dict[str, Any]:
+            data = {"keywords": chunk, "location_code": location_code}
+            if tag_prefix:
+                data["tag"] = f"{tag_prefix}_{number}"
+            return data
+            
+        jobs = [
+            (location_code, matrix.keywords[i:i + MAX_KEYWORDS_PER_REQUEST])
+            for location_code in matrix.locations
+            for i in range(0, len(matrix.keywords), MAX_KEYWORDS_PER_REQUEST)
+        ]
+        outcomes = await asyncio.gather(*(
+            self._submit_keyword_task(
+                endpoint, task_data(number, location_code, chunk), _clickstream_location_rows, SearchVolumeRow
+            )
+            for number, (location_code, chunk) in enumerate(jobs, 1)
+        ), return_exceptions=True)
+        
+        errors = _raise_unexpected(outcomes)
+        for (location_code, _), rows in zip(jobs, outcomes):
+            if isinstance(rows, DataForSEOError):
+                logger.error(f"Location {location_code} failed: {rows}")
                 continue
-                
-            for result in task.get("result", []):
-                for item in result.get("items", []):
-                    results.append(SearchVolumeResult(
-                        keyword=item["keyword"],
-                        search_volume=item["search_volume"],
-                        monthly_searches=item.get("monthly_searches", []),
-                        location_code=result.get("location_code")
-                    ))
+            for row in rows:
+                if row.search_volume is not None and row.keyword in matrix.keyword_index:
+                    matrix.set(row.keyword, location_code, row.search_volume)
                     
-        return results
\ No newline at end of file
+        if len(errors) == len(jobs):
+            raise errors[0]
+        return matrix
+        
+    async def get_global_search_volume_matrix(
+        self,
+        keywords: List[str],
+        countries: Optional[List[str]] = None,
+        tag_prefix: Optional[str] = None
+    ) -> VolumeMatrix:
+        """
+        Get each keyword's global search volume split by country, as a matrix.
+        
+        The normalized endpoint returns every country in one call, so the
+        fan-out is over groups of up to 1000 keywords, run concurrently. A
+        failed group is logged and leaves its rows missing.
+        
+        Args:
+            keywords: Keywords (min 3 chars each; matrix rows)
+            countries: Country ISO codes to keep as columns, in order
+                (default: every country returned, sorted)
+            tag_prefix: Optional prefix; tasks are tagged "{tag_prefix}_{n}"
+            
+        Returns:
+            VolumeMatrix with country ISO codes as columns
+            
+        Raises:
+            DataForSEOError: If every task failed
+        """
+        if not keywords:
+            raise ValueError("Keywords list cannot be empty")
+            
+        unique = list(dict.fromkeys(keywords))
+        chunks = [unique[i:i + MAX_KEYWORDS_PER_REQUEST] for i in range(0, len(unique), MAX_KEYWORDS_PER_REQUEST)]
+        outcomes = await asyncio.gather(*(
+            self.get_global_search_volume(chunk, tag=f"{tag_prefix}_{number}" if tag_prefix else None)
+            for number, chunk in enumerate(chunks, 1)
+        ), return_exceptions=True)
+        
+        errors = _raise_unexpected(outcomes)
+        for error in errors:
+            logger.error(f"Global search volume task failed: {error}")
+        if len(errors) == len(chunks):
+            raise errors[0]
+            
+        results = [
+            result
+            for outcome in outcomes if not isinstance(outcome, DataForSEOError)
+            for result in outcome
+        ]
+        if countries is None:
+            countries = sorted({
+                country["country_iso_code"]
+                for result in results
+                for country in result.country_distribution or ()
+                if country.get("country_iso_code")
+            })
+            
+        matrix = VolumeMatrix(unique, countries)
+        for result in results:
+            if result.keyword not in matrix.keyword_index:
+                continue
+            for country in result.country_distribution or ():
+                code = country.get("country_iso_code")
+                if code in matrix.location_index and country.get("search_volume") is not None:
+                    matrix.set(result.keyword, code, country["search_volume"])
+        return matrix
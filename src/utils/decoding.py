@@ -0,0 +1,113 @@
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+import logging
+
+import msgspec
+
+from .errors import DataForSEOError
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+class ApiTask(msgspec.Struct):
+    """One entry of a response's ``tasks`` array with ``result`` left undecoded"""
+    id: Optional[str] = None
+    status_code: int = 0
+    status_message: str = ""
+    time: Optional[str] = None
+    cost: float = 0.0
+    result_count: int = 0
+    path: Optional[List[str]] = None
+    data: Optional[Dict[str, Any]] = None
+    # Raw cannot sit in a union; a missing result is an empty Raw, null is b"null"
+    result: msgspec.Raw = msgspec.Raw()
+
+
+class ApiResponse(msgspec.Struct):
+    """Response envelope shared by every DataForSEO v3 endpoint"""
+    version: Optional[str] = None
+    status_code: int = 0
+    status_message: str = ""
+    time: Optional[str] = None
+    cost: float = 0.0
+    tasks_count: int = 0
+    tasks_error: int = 0
+    tasks: List[ApiTask] = []
+
+
+class ItemsResult(msgspec.Struct, Generic[T]):
+    """Result object of endpoints that nest their rows under ``items``"""
+    location_code: Optional[int] = None
+    language_code: Optional[str] = None
+    items: Optional[List[T]] = None
+
+
+_generic_decoder = msgspec.json.Decoder()
+_envelope_decoder = msgspec.json.Decoder(ApiResponse)
+_row_decoders: Dict[Any, msgspec.json.Decoder] = {}
+
+
+def decode_response(body: bytes, lazy_results: bool = False) -> Dict[str, Any]:
+    """
+    Decode a response body.
+
+    Args:
+        body: Raw response bytes
+        lazy_results: Keep each task's ``result`` as undecoded JSON
+            (``msgspec.Raw``) so it can be decoded straight into typed rows
+            with ``decode_rows`` instead of a dict tree
+
+    Returns:
+        Response dictionary
+
+    Raises:
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    if not lazy_results:
+        return _generic_decoder.decode(body)
+
+    envelope = _envelope_decoder.decode(body)
+    response = msgspec.structs.asdict(envelope)
+    response["tasks"] = [msgspec.structs.asdict(task) for task in envelope.tasks]
+    return response
+
+
+def decode_rows(result: Any, row_type: Type[T], endpoint: str = "") -> List[T]:
+    """
+    Decode a task's ``result`` array into typed rows.
+
+    Accepts either undecoded JSON from ``decode_response(lazy_results=True)``
+    or an already-decoded list (task_get, postback), so queued and live
+    results share one validation path.
+
+    Raises:
+        DataForSEOError: If the result does not match ``row_type``
+    """
+    if result is None:
+        return []
+
+    try:
+        if isinstance(result, msgspec.Raw):
+            if bytes(result) in (b"", b"null"):
+                return []
+            decoder = _row_decoders.get(row_type)
+            if decoder is None:
+                decoder = _row_decoders[row_type] = msgspec.json.Decoder(List[row_type])
+            return decoder.decode(result)
+        return msgspec.convert(result, List[row_type])
+    except msgspec.ValidationError as e:
+        raise DataForSEOError(f"Malformed result from {endpoint or 'API'}: {e}")
+
+
+def encode(value: Any) -> bytes:
+    """Encode dicts, lists, dataclasses or Structs as JSON bytes."""
+    return msgspec.json.encode(value)
+
+
+def decode(body: bytes, value_type: Optional[Type[T]] = None) -> Any:
+    """Decode JSON bytes, optionally into ``value_type``."""
+    if value_type is None:
+        return _generic_decoder.decode(body)
+    return msgspec.json.decode(body, type=value_type)
@@ -0,0 +1,27 @@
+from typing import Optional
+
+
+class DataForSEOError(Exception):
+    """Custom exception for DataForSEO API errors"""
+    pass
+
+
+class DataForSEORateLimitError(DataForSEOError):
+    """Raised when the API keeps throttling a request after backing off"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DataForSEOCircuitOpenError(DataForSEOError):
+    """Raised without sending a request while the circuit breaker is open"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DataForSEOTimeoutError(DataForSEOError):
+    """Raised when a request keeps timing out; a smaller batch may succeed"""
+    pass
@@ -0,0 +1,484 @@
+import asyncio
+import bisect
+import threading
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import msgspec
+
+
+# Firestore's limit on writes per batch commit
+MAX_BATCH_WRITES = 500
+
+
+class NotFound(Exception):
+    """Raised like google.api_core.exceptions.NotFound for updates to missing documents"""
+
+
+class FakeDocumentSnapshot:
+    """Read-only view of a document at the time it was read"""
+
+    def __init__(self, reference: "FakeDocumentReference", data: Optional[Dict[str, Any]]):
+        self.reference = reference
+        self._data = data
+
+    @property
+    def id(self) -> str:
+        return self.reference.id
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return dict(self._data) if self._data is not None else None
+
+    def get(self, field: str) -> Any:
+        return (self._data or {}).get(field)
+
+
+class FakeDocumentReference:
+    def __init__(self, db: "InMemoryFirestore", collection: str, document_id: str):
+        self._db = db
+        self.collection_name = collection
+        self.id = document_id
+
+    @property
+    def path(self) -> str:
+        return f"{self.collection_name}/{self.id}"
+
+    # The client decides whether these block or return coroutines
+    def get(self, field_paths: Optional[Iterable[str]] = None):
+        return self._db._get_document(self, field_paths)
+
+    def set(self, data: Dict[str, Any], merge: bool = False):
+        return self._db._write_document(self, data, merge=merge, must_exist=False)
+
+    def update(self, data: Dict[str, Any]):
+        return self._db._write_document(self, data, merge=True, must_exist=True)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeDocumentReference) and self.path == other.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+
+class FakeQuery:
+    """Equality/``in`` filters, ordering, cursors, limits and projections over one collection"""
+
+    def __init__(
+        self,
+        db: "InMemoryFirestore",
+        collection: str,
+        filters: Tuple[Tuple[str, str, Any], ...] = (),
+        order: Optional[str] = None,
+        start_after_value: Any = None,
+        limit_count: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ):
+        self._db = db
+        self._collection = collection
+        self._filters = filters
+        self._order = order
+        self._start_after = start_after_value
+        self._limit = limit_count
+        self._fields = fields
+
+    def _copy(self, **changes: Any) -> "FakeQuery":
+        state = {
+            "filters": self._filters,
+            "order": self._order,
+            "start_after_value": self._start_after,
+            "limit_count": self._limit,
+            "fields": self._fields,
+        }
+        state.update(changes)
+        return FakeQuery(self._db, self._collection, **state)
+
+    def where(self, field: str, op: str, value: Any) -> "FakeQuery":
+        if op not in ("==", "in", ">=", "<"):
+            raise ValueError(f"Unsupported operator in fake: {op}")
+        return self._copy(filters=self._filters + ((field, op, value),))
+
+    def order_by(self, field: str) -> "FakeQuery":
+        return self._copy(order=field)
+
+    def start_after(self, value: Any) -> "FakeQuery":
+        """Cursor after a snapshot or a field value of the ordered field."""
+        if isinstance(value, FakeDocumentSnapshot):
+            value = value.id if self._order in (None, "__name__") else value.get(self._order)
+        elif isinstance(value, dict):
+            value = value.get(self._order or "__name__")
+        return self._copy(start_after_value=value)
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._copy(limit_count=count)
+
+    def select(self, field_paths: Iterable[str]) -> "FakeQuery":
+        return self._copy(fields=tuple(field_paths))
+
+    def stream(self):
+        """Iterator of snapshots (async iterator on the async fake)."""
+        return self._db._stream(self)
+
+    def get(self):
+        """List of snapshots (a coroutine on the async fake)."""
+        return self._db._get_query(self)
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, db: "InMemoryFirestore", name: str):
+        super().__init__(db, name)
+        self.id = name
+
+    def document(self, document_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self._db, self._collection, document_id)
+
+
+class FakeQueryPartition:
+    """One document-id range of a collection group, as returned by get_partitions"""
+
+    def __init__(
+        self,
+        group: "FakeCollectionGroup",
+        start_at: Optional[FakeDocumentReference],
+        end_at: Optional[FakeDocumentReference]
+    ):
+        self._group = group
+        self.start_at = start_at
+        self.end_at = end_at
+
+    def query(self) -> FakeQuery:
+        query = self._group.order_by("__name__")
+        if self.start_at is not None:
+            query = query.where("__name__", ">=", self.start_at.id)
+        if self.end_at is not None:
+            query = query.where("__name__", "<", self.end_at.id)
+        return query
+
+
+class FakeCollectionGroup(FakeQuery):
+    """Collection group over one collection (the fake has no subcollections)"""
+
+    def get_partitions(self, partition_count: int):
+        """Partitions splitting the group into up to ``partition_count`` id ranges."""
+        return self._db._get_partitions(self, partition_count)
+
+
+class FakeWriteBatch:
+    def __init__(self, db: "InMemoryFirestore"):
+        self._db = db
+        self._writes: List[Tuple[FakeDocumentReference, Dict[str, Any], bool, bool]] = []
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+    def set(self, reference: FakeDocumentReference, data: Dict[str, Any], merge: bool = False) -> None:
+        self._writes.append((reference, data, merge, False))
+
+    def update(self, reference: FakeDocumentReference, data: Dict[str, Any]) -> None:
+        self._writes.append((reference, data, True, True))
+
+    def commit(self) -> List[Any]:
+        self._check_size()
+        self._db._rpc("commit", writes=len(self._writes))
+        return self._apply()
+
+    def _check_size(self) -> None:
+        if len(self._writes) > MAX_BATCH_WRITES:
+            raise ValueError(f"A batch can contain at most {MAX_BATCH_WRITES} writes")
+
+    def _apply(self) -> List[Any]:
+        # All or nothing, like a server-side commit
+        with self._db._lock:
+            for reference, _, _, must_exist in self._writes:
+                if must_exist and reference.path not in self._db._documents.get(reference.collection_name, {}):
+                    raise NotFound(f"No document to update: {reference.path}")
+            for reference, data, merge, must_exist in self._writes:
+                self._db._write(reference, data, merge=merge, must_exist=must_exist)
+        results = [None] * len(self._writes)
+        self._writes = []
+        return results
+
+
+class AsyncFakeWriteBatch(FakeWriteBatch):
+    async def commit(self) -> List[Any]:
+        self._check_size()
+        await self._db._rpc_async("commit", writes=len(self._writes))
+        return self._apply()
+
+
+class InMemoryFirestore:
+    """
+    In-memory stand-in for the synchronous ``google.cloud.firestore.Client``.
+
+    Covers what the updater scripts use - collections, document get/set/
+    update, ``get_all``, simple queries, partition queries and write batches -
+    and counts RPCs, document reads and writes, and the JSON size of the
+    data read (``bytes_read``) in ``stats``. ``rpc_latency`` seconds are
+    slept per round trip so benchmarks see the cost of chatty access
+    patterns (one read per document, small batches) that a purely
+    in-memory store would hide. Thread-safe, so parallel writers can be
+    measured too.
+    """
+
+    def __init__(self, rpc_latency: float = 0.0, write_latency: float = 0.0):
+        """
+        Initialize fake.
+
+        Args:
+            rpc_latency: Seconds each RPC (get, query, get_all, commit) takes
+            write_latency: Extra seconds per document written in a commit
+        """
+        self.rpc_latency = rpc_latency
+        self.write_latency = write_latency
+        self.stats: Counter = Counter()
+        self._documents: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Sorted document ids per collection, rebuilt after documents are added
+        self._ids: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+
+    def collection(self, name: str) -> FakeCollectionReference:
+        return FakeCollectionReference(self, name)
+
+    def collection_group(self, collection_id: str) -> FakeCollectionGroup:
+        return FakeCollectionGroup(self, collection_id)
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def get_all(
+        self,
+        references: Iterable[FakeDocumentReference],
+        field_paths: Optional[Iterable[str]] = None
+    ) -> Iterator[FakeDocumentSnapshot]:
+        references = list(references)
+        self._rpc("get_all", reads=len(references))
+        return iter([self._snapshot(reference, field_paths) for reference in references])
+
+    def seed(self, collection: str, documents: Dict[str, Dict[str, Any]]) -> None:
+        """Load documents by id without counting them as writes."""
+        with self._lock:
+            stored = self._documents.setdefault(collection, {})
+            for document_id, data in documents.items():
+                stored[f"{collection}/{document_id}"] = dict(data)
+            self._ids.pop(collection, None)
+
+    def documents(self, collection: str) -> Dict[str, Dict[str, Any]]:
+        """Current contents of a collection by document id."""
+        with self._lock:
+            return {
+                path.split("/", 1)[1]: dict(data)
+                for path, data in self._documents.get(collection, {}).items()
+            }
+
+    def _count_rpc(self, kind: str, reads: int = 0, writes: int = 0) -> float:
+        """Record an RPC and return how long it should take."""
+        with self._lock:
+            self.stats["rpcs"] += 1
+            self.stats[f"rpcs_{kind}"] += 1
+            self.stats["reads"] += reads
+            self.stats["writes"] += writes
+        return self.rpc_latency + writes * self.write_latency
+
+    def _count_bytes(self, data: Optional[Dict[str, Any]]) -> None:
+        if data is not None:
+            size = len(msgspec.json.encode(data))
+            with self._lock:
+                self.stats["bytes_read"] += size
+
+    def _rpc(self, kind: str, reads: int = 0, writes: int = 0) -> None:
+        delay = self._count_rpc(kind, reads=reads, writes=writes)
+        if delay:
+            time.sleep(delay)
+
+    def _get_document(self, reference: FakeDocumentReference, field_paths: Optional[Iterable[str]]) -> FakeDocumentSnapshot:
+        self._rpc("get", reads=1)
+        return self._snapshot(reference, field_paths)
+
+    def _write_document(self, reference: FakeDocumentReference, data: Dict[str, Any], merge: bool, must_exist: bool) -> None:
+        self._rpc("commit", writes=1)
+        self._write(reference, data, merge=merge, must_exist=must_exist)
+
+    def _stream(self, query: FakeQuery) -> Iterator[FakeDocumentSnapshot]:
+        document_ids = self._query(query)
+        # One RPC per page of results, like the server's streamed responses
+        self._rpc("query", reads=max(1, len(document_ids)))
+        return self._snapshots(query, document_ids)
+
+    def _get_query(self, query: FakeQuery) -> List[FakeDocumentSnapshot]:
+        return list(self._stream(query))
+
+    def _partition_points(self, group: FakeCollectionGroup, partition_count: int) -> List[FakeDocumentReference]:
+        """Evenly spaced split points, as references to the first document of each later range."""
+        with self._lock:
+            prefix = len(group._collection) + 1
+            document_ids = sorted(path[prefix:] for path in self._documents.get(group._collection, {}))
+        # Collections too small to split come back as one range, like the server
+        step = len(document_ids) // max(1, partition_count)
+        if not step:
+            return []
+        return [
+            FakeDocumentReference(self, group._collection, document_ids[i * step])
+            for i in range(1, partition_count)
+        ]
+
+    def _partitions(self, group: FakeCollectionGroup, points: List[FakeDocumentReference]) -> List[FakeQueryPartition]:
+        bounds = [None, *points, None]
+        return [FakeQueryPartition(group, bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+    def _get_partitions(self, group: FakeCollectionGroup, partition_count: int) -> Iterator[FakeQueryPartition]:
+        points = self._partition_points(group, partition_count)
+        self._rpc("partition_query", reads=max(1, len(points)))
+        return iter(self._partitions(group, points))
+
+    def _snapshot(
+        self,
+        reference: FakeDocumentReference,
+        field_paths: Optional[Iterable[str]] = None
+    ) -> FakeDocumentSnapshot:
+        with self._lock:
+            data = self._documents.get(reference.collection_name, {}).get(reference.path)
+            data = dict(data) if data is not None else None
+        if data is not None and field_paths is not None:
+            data = {field: data[field] for field in field_paths if field in data}
+        self._count_bytes(data)
+        return FakeDocumentSnapshot(reference, data)
+
+    def _write(self, reference: FakeDocumentReference, data: Dict[str, Any], merge: bool, must_exist: bool) -> None:
+        with self._lock:
+            stored = self._documents.setdefault(reference.collection_name, {})
+            current = stored.get(reference.path)
+            if must_exist and current is None:
+                raise NotFound(f"No document to update: {reference.path}")
+            stored[reference.path] = {**(current or {}), **data} if merge else dict(data)
+            if current is None:
+                self._ids.pop(reference.collection_name, None)
+
+    def _sorted_ids(self, collection: str) -> List[str]:
+        with self._lock:
+            if collection not in self._ids:
+                prefix = len(collection) + 1
+                self._ids[collection] = sorted(path[prefix:] for path in self._documents.get(collection, {}))
+            return self._ids[collection]
+
+    def _id_range(self, query: FakeQuery) -> List[str]:
+        """Ids for a query on document id ranges alone, by bisection like an index scan."""
+        document_ids = self._sorted_ids(query._collection)
+        start, end = 0, len(document_ids)
+        for _, op, value in query._filters:
+            if op == ">=":
+                start = max(start, bisect.bisect_left(document_ids, value))
+            else:
+                end = min(end, bisect.bisect_left(document_ids, value))
+        if query._start_after is not None:
+            start = max(start, bisect.bisect_right(document_ids, query._start_after))
+        if query._limit is not None:
+            end = min(end, start + query._limit)
+        return document_ids[start:end]
+
+    def _query(self, query: FakeQuery) -> List[str]:
+        """Ids of matching documents, ordered and limited."""
+        if query._order in (None, "__name__") and all(
+            field == "__name__" and op in (">=", "<") for field, op, _ in query._filters
+        ):
+            return self._id_range(query)
+
+        with self._lock:
+            items = list(self._documents.get(query._collection, {}).items())
+        prefix = len(query._collection) + 1
+        rows = [(path[prefix:], data) for path, data in items]
+
+        for field, op, value in query._filters:
+            def matches(row, field=field, op=op, value=value):
+                current = row[0] if field == "__name__" else row[1].get(field)
+                if op == "==":
+                    return current == value
+                if op == "in":
+                    return current in value
+                if current is None:
+                    return False
+                return current >= value if op == ">=" else current < value
+            rows = [row for row in rows if matches(row)]
+
+        order = query._order or "__name__"
+        def sort_key(row):
+            value = row[0] if order == "__name__" else row[1].get(order)
+            return (value is None, value)
+        rows.sort(key=sort_key)
+
+        if query._start_after is not None:
+            rows = [row for row in rows if sort_key(row) > (False, query._start_after)]
+        if query._limit is not None:
+            rows = rows[:query._limit]
+        return [document_id for document_id, _ in rows]
+
+    def _snapshots(self, query: FakeQuery, document_ids: List[str]) -> Iterator[FakeDocumentSnapshot]:
+        # Built (and read) as they are consumed, so a long stream neither holds
+        # every snapshot nor keeps data alive that writes have since replaced
+        stored = self._documents.get(query._collection, {})
+        prefix = f"{query._collection}/"
+        for document_id in document_ids:
+            with self._lock:
+                data = stored.get(prefix + document_id)
+            if data is None:
+                continue
+            if query._fields is not None:
+                data = {field: data[field] for field in query._fields if field in data}
+            self._count_bytes(data)
+            reference = FakeDocumentReference(self, query._collection, document_id)
+            yield FakeDocumentSnapshot(reference, dict(data))
+
+
+class AsyncInMemoryFirestore(InMemoryFirestore):
+    """
+    In-memory stand-in for ``google.cloud.firestore.AsyncClient``.
+
+    Same data model and RPC accounting as InMemoryFirestore, but document
+    reads and writes, query ``get`` and batch commits are coroutines, and
+    ``stream``/``get_all`` are async iterators; latency is awaited, so
+    other tasks on the event loop run while an RPC is "in flight".
+    """
+
+    def batch(self) -> AsyncFakeWriteBatch:
+        return AsyncFakeWriteBatch(self)
+
+    async def get_all(
+        self,
+        references: Iterable[FakeDocumentReference],
+        field_paths: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[FakeDocumentSnapshot]:
+        references = list(references)
+        await self._rpc_async("get_all", reads=len(references))
+        for reference in references:
+            yield self._snapshot(reference, field_paths)
+
+    async def _rpc_async(self, kind: str, reads: int = 0, writes: int = 0) -> None:
+        delay = self._count_rpc(kind, reads=reads, writes=writes)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def _get_document(self, reference: FakeDocumentReference, field_paths: Optional[Iterable[str]]) -> FakeDocumentSnapshot:
+        await self._rpc_async("get", reads=1)
+        return self._snapshot(reference, field_paths)
+
+    async def _write_document(self, reference: FakeDocumentReference, data: Dict[str, Any], merge: bool, must_exist: bool) -> None:
+        await self._rpc_async("commit", writes=1)
+        self._write(reference, data, merge=merge, must_exist=must_exist)
+
+    async def _stream(self, query: FakeQuery) -> AsyncIterator[FakeDocumentSnapshot]:
+        document_ids = self._query(query)
+        await self._rpc_async("query", reads=max(1, len(document_ids)))
+        for snapshot in self._snapshots(query, document_ids):
+            yield snapshot
+
+    async def _get_query(self, query: FakeQuery) -> List[FakeDocumentSnapshot]:
+        return [snapshot async for snapshot in self._stream(query)]
+
+    async def _get_partitions(self, group: FakeCollectionGroup, partition_count: int) -> AsyncIterator[FakeQueryPartition]:
+        points = self._partition_points(group, partition_count)
+        await self._rpc_async("partition_query", reads=max(1, len(points)))
+        for partition in self._partitions(group, points):
+            yield partition
@@ -0,0 +1,245 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .async_firestore import commit_batch
+from .rate_limiter import EndpointLimit, TokenBucket
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+# Firestore's ramp-up guidance ("500/50/5"): start at 500 writes per second
+# and grow by at most 50% every 5 minutes
+RAMP_START_OPS_PER_SECOND = 500
+RAMP_GROWTH = 1.5
+RAMP_INTERVAL = 300.0
+
+# Like BulkWriter: small commits keep a contention retry cheap, and
+# several in flight hide commit latency
+DEFAULT_WRITE_BATCH_SIZE = 20
+DEFAULT_MAX_IN_FLIGHT = 10
+DEFAULT_QUEUE_SIZE = 2000
+
+# google.api_core exception names worth another attempt (contention,
+# overload, transient server errors); matched by name so the fake and
+# both client flavours classify the same way
+RETRYABLE_WRITE_ERRORS = {
+    "Aborted",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "ResourceExhausted",
+    "ServiceUnavailable",
+    "TooManyRequests",
+}
+
+_UPDATE = "update"
+_SET = "set"
+
+
+def is_retryable_write_error(error: BaseException) -> bool:
+    """True for Firestore errors where the same write may succeed later."""
+    return any(cls.__name__ in RETRYABLE_WRITE_ERRORS for cls in type(error).__mro__)
+
+
+@dataclass
+class WriteStats:
+    """Outcome of a ParallelBatchWriter run"""
+    queued: int = 0
+    written: int = 0
+    failed: int = 0
+    retried: int = 0
+    commits: int = 0
+    seconds: float = 0.0
+    # (document path, error) for writes that were given up on
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "failed": self.failed,
+            "retried": self.retried,
+            "commits": self.commits,
+            "seconds": round(self.seconds, 3),
+            "writes_per_second": round(self.written / self.seconds, 1) if self.seconds else None,
+        }
+
+
+class ParallelBatchWriter:
+    """
+    Concurrent Firestore write stage with backpressure.
+
+    Writes are queued with ``update``/``set`` (which wait while the queue
+    is full) and committed by ``max_in_flight`` workers in batches of up to
+    ``batch_size``, so throughput is bounded by the ramp-up limit rather
+    than by one commit's round trip. Throughput starts at
+    ``initial_ops_per_second`` and grows 50% every 5 minutes (Firestore's
+    500/50/5 guidance); None disables the ramp.
+
+    A failed batch is split and each document retried on its own with
+    exponential backoff while the error is retryable (contention,
+    overload), so one bad document fails alone. Works with the sync client
+    (commits run in threads) and with AsyncClient (commits are awaited).
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        initial_ops_per_second: Optional[float] = RAMP_START_OPS_PER_SECOND,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            db: Firestore client (sync or async)
+            batch_size: Writes per commit (max 500)
+            max_in_flight: Concurrent commits
+            queue_size: Writes that may wait for a worker before callers block
+            initial_ops_per_second: Starting write rate for the ramp-up (None: unlimited)
+            retry_policy: Backoff for per-document retries (default: 5 attempts, 0.5-30s)
+        """
+        if not 1 <= batch_size <= 500:
+            raise ValueError("batch_size must be between 1 and 500")
+        self.db = db
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.initial_ops_per_second = initial_ops_per_second
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=5, base_delay=0.5, max_delay=30.0)
+        self.stats = WriteStats()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._workers: List[asyncio.Task] = []
+        self._bucket: Optional[TokenBucket] = None
+        self._started = 0.0
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.close()
+        else:
+            self._cancel()
+
+    def start(self) -> None:
+        """Start the commit workers."""
+        self._started = time.monotonic()
+        if self.initial_ops_per_second:
+            self._bucket = TokenBucket(
+                "firestore_writes",
+                EndpointLimit(self.initial_ops_per_second * 60, burst=self.batch_size)
+            )
+        self._workers = [asyncio.ensure_future(self._work()) for _ in range(self.max_in_flight)]
+
+    async def update(self, reference: Any, data: Dict[str, Any]) -> None:
+        """Queue an update of an existing document."""
+        await self._put((_UPDATE, reference, data, False))
+
+    async def set(self, reference: Any, data: Dict[str, Any], merge: bool = False) -> None:
+        """Queue a set (create or overwrite, or merge) of a document."""
+        await self._put((_SET, reference, data, merge))
+
+    async def close(self) -> WriteStats:
+        """Commit everything queued and stop the workers."""
+        for _ in self._workers:
+            await self._queue.put(None)
+        await asyncio.gather(*self._workers)
+        self._workers = []
+        self.stats.seconds = time.monotonic() - self._started
+        return self.stats
+
+    async def _put(self, op: Tuple[str, Any, Dict[str, Any], bool]) -> None:
+        if not self._workers:
+            raise RuntimeError("Writer not started. Use async context manager.")
+        self.stats.queued += 1
+        await self._queue.put(op)
+
+    def _cancel(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    async def _work(self) -> None:
+        while True:
+            op = await self._queue.get()
+            if op is None:
+                return
+            ops = [op]
+            done = False
+            # Take whatever else is already waiting, up to a full batch
+            while len(ops) < self.batch_size and not self._queue.empty():
+                op = self._queue.get_nowait()
+                if op is None:
+                    done = True
+                    break
+                ops.append(op)
+            await self._write(ops)
+            if done:
+                return
+
+    async def _write(self, ops: List[Tuple[str, Any, Dict[str, Any], bool]]) -> None:
+        await self._throttle(len(ops))
+        try:
+            await self._commit(ops)
+            self.stats.written += len(ops)
+            return
+        except Exception as e:
+            if len(ops) == 1:
+                await self._retry(ops[0], e)
+                return
+            logger.debug(f"Batch of {len(ops)} writes failed ({e!r}); retrying documents individually")
+
+        for op in ops:
+            await self._retry(op, None)
+
+    async def _retry(self, op: Tuple[str, Any, Dict[str, Any], bool], error: Optional[Exception]) -> None:
+        """Write one document on its own until it succeeds or the error is fatal."""
+        attempt = 1 if error is not None else 0
+        while True:
+            if error is not None:
+                if not is_retryable_write_error(error) or attempt >= self.retry_policy.max_attempts:
+                    self.stats.failed += 1
+                    self.stats.failures.append((_path(op[1]), repr(error)))
+                    logger.error(f"Giving up on write to {_path(op[1])} after {attempt} attempts: {error!r}")
+                    return
+                self.stats.retried += 1
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                await self._throttle(1)
+            try:
+                await self._commit([op])
+                self.stats.written += 1
+                return
+            except Exception as e:
+                error = e
+                attempt += 1
+
+    async def _commit(self, ops: List[Tuple[str, Any, Dict[str, Any], bool]]) -> None:
+        batch = self.db.batch()
+        for kind, reference, data, merge in ops:
+            if kind == _UPDATE:
+                batch.update(reference, data)
+            else:
+                batch.set(reference, data, merge=merge)
+        self.stats.commits += 1
+        await commit_batch(batch)
+
+    async def _throttle(self, ops: int) -> None:
+        """Wait for ``ops`` writes' worth of the current ramp-up rate."""
+        if self._bucket is None:
+            return
+        steps = int((time.monotonic() - self._started) // RAMP_INTERVAL)
+        rate = self.initial_ops_per_second * RAMP_GROWTH ** steps
+        if rate != self._bucket.base_rate:
+            self._bucket.base_rate = self._bucket.rate = rate
+        await self._bucket.acquire(ops)
+
+
+def _path(reference: Any) -> str:
+    return getattr(reference, "path", None) or str(reference)
@@ -0,0 +1,102 @@
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from .async_firestore import get_all, stream_query
+
+logger = logging.getLogger(__name__)
+
+
+# Document references per get_all() call
+GET_ALL_CHUNK_SIZE = 100
+
+# Values per 'in' query (Firestore's limit for the operator)
+IN_QUERY_LIMIT = 30
+
+# Fields a keyword document may hold its keyword in (the id otherwise);
+# keyword scans fetch only these
+KEYWORD_FIELDS = ["keyword", "name"]
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class KeywordDocumentIndex:
+    """
+    Keyword -> DocumentReference for one collection.
+
+    Filled from the keyword scan (``add_snapshot``) so the write phase can
+    address documents without reading them first. Keywords the scan did
+    not see are resolved in bulk by ``resolve``: chunked ``get_all`` by
+    document id, then chunked ``in`` queries on the ``keyword`` field -
+    the same precedence as looking up the id first and the field second.
+    """
+
+    def __init__(self, collection_name: str):
+        self.collection_name = collection_name
+        self._by_id: Dict[str, Any] = {}
+        self._by_field: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id.keys() | self._by_field.keys())
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._by_id or keyword in self._by_field
+
+    def get(self, keyword: str) -> Optional[Any]:
+        """Reference for a keyword; a document whose id is the keyword wins."""
+        return self._by_id.get(keyword) or self._by_field.get(keyword)
+
+    def add_snapshot(self, snapshot: Any, keyword: Optional[str] = None) -> None:
+        """Index a scanned document under its id and its keyword (if different)."""
+        self._by_id[snapshot.id] = snapshot.reference
+        if keyword and keyword != snapshot.id:
+            self._by_field.setdefault(keyword, snapshot.reference)
+
+    async def resolve(self, db: Any, keywords: Iterable[str]) -> Dict[str, Any]:
+        """
+        References for ``keywords``, looking up only those not yet indexed.
+
+        Args:
+            db: Firestore client (sync or async)
+            keywords: Keywords to resolve
+
+        Returns:
+            Mapping of keyword to DocumentReference; keywords without a
+            document are left out
+        """
+        keywords = list(keywords)
+        missing = [keyword for keyword in dict.fromkeys(keywords) if keyword not in self]
+        if missing:
+            await self._lookup(db, missing)
+            logger.info(
+                f"Resolved {len(missing)} unindexed keywords in "
+                f"{-(-len(missing) // GET_ALL_CHUNK_SIZE)} get_all calls"
+            )
+        resolved = {}
+        for keyword in keywords:
+            reference = self.get(keyword)
+            if reference is not None:
+                resolved[keyword] = reference
+        return resolved
+
+    async def _lookup(self, db: Any, keywords: List[str]) -> None:
+        collection = db.collection(self.collection_name)
+        # A keyword with a slash cannot be a document id
+        not_by_id = [keyword for keyword in keywords if "/" in keyword]
+        by_id = [keyword for keyword in keywords if "/" not in keyword]
+        for chunk in _chunks(by_id, GET_ALL_CHUNK_SIZE):
+            # Only existence matters, so fetch no more than the keyword field
+            snapshots = await get_all(db, [collection.document(keyword) for keyword in chunk], field_paths=["keyword"])
+            found = {snapshot.id for snapshot in snapshots if snapshot.exists}
+            for keyword in chunk:
+                if keyword in found:
+                    self._by_id[keyword] = collection.document(keyword)
+                else:
+                    not_by_id.append(keyword)
+
+        for chunk in _chunks(not_by_id, IN_QUERY_LIMIT):
+            query = collection.where("keyword", "in", chunk).select(["keyword"])
+            async for snapshot in stream_query(db, query):
+                self._by_field.setdefault(snapshot.get("keyword"), snapshot.reference)
@@ -0,0 +1,221 @@
+import bisect
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds of the latency buckets in seconds; the last bucket is open-ended
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def metric_endpoint(endpoint: str) -> str:
+    """Endpoint name to aggregate under; drops the task id from task_get paths."""
+    path = endpoint.strip('/')
+    head, sep, _ = path.partition("/task_get/")
+    return f"{head}/task_get" if sep else path
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram"""
+    counts: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (capped at the max seen)."""
+        count = self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def __sub__(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        return LatencyHistogram(
+            counts=[a - b for a, b in zip(self.counts, other.counts)],
+            total=self.total - other.total,
+            # The max of an interval can't be recovered from two snapshots
+            max=self.max
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        count = self.count
+        return {
+            "count": count,
+            "mean_s": round(self.total / count, 3) if count else 0.0,
+            "p50_s": round(self.quantile(0.5), 3),
+            "p95_s": round(self.quantile(0.95), 3),
+            "max_s": round(self.max, 3),
+            "buckets": {
+                **{f"le_{bound:g}": n for bound, n in zip(LATENCY_BUCKETS, self.counts)},
+                "inf": self.counts[-1]
+            }
+        }
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters for one endpoint"""
+    requests: int = 0
+    failures: int = 0
+    throttled: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    keywords_returned: int = 0
+    cost: float = 0.0
+    tasks: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def copy(self) -> "EndpointMetrics":
+        return EndpointMetrics(
+            self.requests, self.failures, self.throttled, self.request_bytes,
+            self.response_bytes, self.keywords_returned, self.cost, self.tasks,
+            LatencyHistogram(list(self.latency.counts), self.latency.total, self.latency.max)
+        )
+
+    def __sub__(self, other: "EndpointMetrics") -> "EndpointMetrics":
+        return EndpointMetrics(
+            self.requests - other.requests,
+            self.failures - other.failures,
+            self.throttled - other.throttled,
+            self.request_bytes - other.request_bytes,
+            self.response_bytes - other.response_bytes,
+            self.keywords_returned - other.keywords_returned,
+            self.cost - other.cost,
+            self.tasks - other.tasks,
+            self.latency - other.latency
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "throttled": self.throttled,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "keywords_returned": self.keywords_returned,
+            "cost": round(self.cost, 6),
+            "tasks": self.tasks,
+            "latency": self.latency.to_dict()
+        }
+
+
+class ClientMetrics:
+    """
+    Request metrics for a DataForSEOClient, aggregated per endpoint.
+
+    Replaces per-request and per-keyword INFO logging: counters are updated
+    in place and reported as one structured log line per run (or per batch,
+    using ``snapshot()`` and ``log_summary(since=...)``).
+    """
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointMetrics] = defaultdict(EndpointMetrics)
+        self.cost_by_tag: Dict[str, float] = defaultdict(float)
+
+    def record_request(
+        self,
+        endpoint: str,
+        duration: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        cost: float = 0.0,
+        failed: bool = False,
+        throttled: bool = False
+    ) -> None:
+        """Record one HTTP attempt."""
+        metrics = self.endpoints[metric_endpoint(endpoint)]
+        metrics.requests += 1
+        metrics.failures += failed
+        metrics.throttled += throttled
+        metrics.request_bytes += request_bytes
+        metrics.response_bytes += response_bytes
+        metrics.cost += cost or 0.0
+        metrics.latency.observe(duration)
+
+    def record_keywords(self, endpoint: str, count: int) -> None:
+        """Record keyword rows returned by the API (cache hits not included)."""
+        self.endpoints[metric_endpoint(endpoint)].keywords_returned += count
+
+    def record_task(self, endpoint: str, task: Dict[str, Any]) -> None:
+        """
+        Record one billed task from a response.
+
+        The response-level cost is already counted by ``record_request``;
+        this attributes it to the task's tag and counts tasks for
+        ``cost_per_task``.
+        """
+        self.endpoints[metric_endpoint(endpoint)].tasks += 1
+        tag = (task.get("data") or {}).get("tag")
+        if tag:
+            self.cost_by_tag[tag] += task.get("cost") or 0.0
+
+    @property
+    def total_cost(self) -> float:
+        return sum(metrics.cost for metrics in self.endpoints.values())
+
+    def cost_by_endpoint(self) -> Dict[str, float]:
+        return {endpoint: metrics.cost for endpoint, metrics in self.endpoints.items() if metrics.cost}
+
+    def cost_per_task(self, endpoint: str) -> Optional[float]:
+        """Average observed cost of one task on ``endpoint``, if any were billed."""
+        metrics = self.endpoints.get(metric_endpoint(endpoint))
+        if not metrics or not metrics.tasks or not metrics.cost:
+            return None
+        return metrics.cost / metrics.tasks
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """Copy of the current counters, to diff against later."""
+        return {endpoint: metrics.copy() for endpoint, metrics in self.endpoints.items()}
+
+    def summary(self, since: Optional[Dict[str, EndpointMetrics]] = None) -> Dict[str, Any]:
+        """
+        Totals per endpoint, optionally only what happened after ``since``.
+
+        Returns:
+            Dictionary with ``endpoints``, ``requests``, ``keywords_returned``
+            and ``cost`` keys
+        """
+        since = since or {}
+        endpoints = {}
+        for endpoint, metrics in sorted(self.endpoints.items()):
+            delta = metrics - since[endpoint] if endpoint in since else metrics
+            if delta.requests or delta.keywords_returned:
+                endpoints[endpoint] = delta.to_dict()
+        return {
+            "requests": sum(m["requests"] for m in endpoints.values()),
+            "keywords_returned": sum(m["keywords_returned"] for m in endpoints.values()),
+            "cost": round(sum(m["cost"] for m in endpoints.values()), 6),
+            "endpoints": endpoints
+        }
+
+    def log_summary(
+        self,
+        label: str = "run",
+        since: Optional[Dict[str, EndpointMetrics]] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Log the summary as a single JSON line and return it."""
+        summary = {"label": label, **self.summary(since), **(extra or {})}
+        if since is None and self.cost_by_tag:
+            summary["cost_by_tag"] = {tag: round(cost, 6) for tag, cost in sorted(self.cost_by_tag.items())}
+        logger.info(f"DataForSEO metrics: {json.dumps(summary, sort_keys=True)}")
+        return summary
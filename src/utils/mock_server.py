@@ -0,0 +1,582 @@
+import asyncio
+import gzip
+import json
+import math
+import random
+import time
+import uuid
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import logging
+
+import aiohttp
+import msgspec
+from aiohttp import web
+
+from .rate_limiter import GENERAL_REQUESTS_PER_MINUTE, MAX_SIMULTANEOUS_REQUESTS
+from .task_queue import GZIP_MAGIC, TASK_CREATED, TASK_IN_QUEUE, TASK_OK
+
+logger = logging.getLogger(__name__)
+
+
+API_VERSION = "v3"
+
+SEARCH_VOLUME_PATH = "keywords_data/google/search_volume"
+ADS_SEARCH_VOLUME_PATH = "keywords_data/google_ads/search_volume"
+CLICKSTREAM_PATH = "keywords_data/clickstream_data"
+TRENDS_PATH = "keywords_data/google_trends/explore"
+
+# USD per task, roughly the published prices; override per endpoint family
+DEFAULT_MOCK_PRICES = {
+    f"{SEARCH_VOLUME_PATH}/live": 0.075,
+    f"{SEARCH_VOLUME_PATH}/task_post": 0.05,
+    f"{ADS_SEARCH_VOLUME_PATH}/live": 0.075,
+    f"{ADS_SEARCH_VOLUME_PATH}/task_post": 0.05,
+    f"{CLICKSTREAM_PATH}/search_volume_by_location/live": 0.1,
+    f"{CLICKSTREAM_PATH}/search_volume_normalized/live": 0.1,
+    f"{CLICKSTREAM_PATH}/global_search_volume/live": 0.1,
+    f"{TRENDS_PATH}/live": 0.009,
+}
+
+# A few locations for locations_and_languages and global distributions
+MOCK_LOCATIONS = [
+    (2840, "United States", "US", 0.32),
+    (2356, "India", "IN", 0.14),
+    (2076, "Brazil", "BR", 0.07),
+    (2826, "United Kingdom", "GB", 0.06),
+    (2276, "Germany", "DE", 0.05),
+    (2392, "Japan", "JP", 0.05),
+    (2250, "France", "FR", 0.04),
+    (2124, "Canada", "CA", 0.03),
+    (2484, "Mexico", "MX", 0.03),
+    (2036, "Australia", "AU", 0.02),
+]
+
+# Status codes the mock injects
+HTTP_ERROR_STATUS = 500
+HTTP_TIMEOUT_STATUS = 504
+RATE_LIMIT_CODE = 40202
+SIMULTANEOUS_LIMIT_CODE = 40209
+TASK_ERROR_CODE = 50000
+
+
+@dataclass
+class MockBehavior:
+    """
+    How the mock server misbehaves.
+
+    Latency is log-normal around ``latency`` seconds (``latency_sigma`` = 0
+    makes it constant) plus ``latency_per_keyword`` for the largest task in
+    the request. Rates are per request, except ``task_error_rate`` which is
+    per task.
+    """
+    latency: float = 0.05
+    latency_sigma: float = 0.3
+    latency_per_keyword: float = 0.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    throttle_rate: float = 0.0
+    task_error_rate: float = 0.0
+    requests_per_minute: Optional[int] = GENERAL_REQUESTS_PER_MINUTE
+    max_simultaneous: Optional[int] = MAX_SIMULTANEOUS_REQUESTS
+    # Seconds before a task_post task shows up in tasks_ready
+    queue_delay: float = 1.0
+    prices: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MOCK_PRICES))
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockStats:
+    """What the mock server has served"""
+    requests: int = 0
+    tasks: int = 0
+    keywords: int = 0
+    cost: float = 0.0
+    errors: int = 0
+    timeouts: int = 0
+    throttled: int = 0
+    task_errors: int = 0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "tasks": self.tasks,
+            "keywords": self.keywords,
+            "cost": round(self.cost, 6),
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "throttled": self.throttled,
+            "task_errors": self.task_errors,
+            "by_endpoint": dict(self.by_endpoint),
+        }
+
+
+@dataclass
+class _QueuedTask:
+    id: str
+    family: str
+    data: Dict[str, Any]
+    ready_at: float
+    collected: bool = False
+
+
+def _unit(*parts: Any) -> float:
+    """Deterministic value in [0, 1) for the given parts."""
+    return zlib.crc32("\x1f".join(map(str, parts)).encode()) / 2 ** 32
+
+
+def synthetic_volume(keyword: str, location_code: Optional[int] = None) -> int:
+    """Stable, log-uniform (10 to 10M) monthly volume for a keyword."""
+    volume = 10 ** (1 + 6 * _unit("volume", keyword.lower()))
+    share = next((s for code, _, _, s in MOCK_LOCATIONS if code == location_code), None)
+    if location_code is not None:
+        volume *= share if share is not None else 0.01
+    return int(volume)
+
+
+def synthetic_monthly_searches(keyword: str, volume: int, months: int = 12) -> List[Dict[str, int]]:
+    """Monthly breakdown around ``volume``, newest month first like the API."""
+    today = date.today()
+    year, month = today.year, today.month
+    phase = _unit("season", keyword.lower()) * 2 * math.pi
+    rows = []
+    for _ in range(months):
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+        seasonal = 1 + 0.25 * math.sin(2 * math.pi * month / 12 + phase)
+        noise = 0.9 + 0.2 * _unit("month", keyword.lower(), year, month)
+        rows.append({"year": year, "month": month, "search_volume": int(volume * seasonal * noise)})
+    return rows
+
+
+def synthetic_interest(keyword: str, moment: float) -> float:
+    """Unscaled Google Trends interest of a keyword at a Unix time."""
+    day = moment / 86400
+    weight = 10 ** (3 * _unit("trends", keyword.lower()))
+    phase = _unit("phase", keyword.lower()) * 2 * math.pi
+    weekly = 1 + 0.15 * math.sin(2 * math.pi * day / 7 + phase)
+    yearly = 1 + 0.3 * math.sin(2 * math.pi * day / 365 + phase)
+    noise = 0.9 + 0.2 * _unit("day", keyword.lower(), int(day))
+    return weight * weekly * yearly * noise
+
+
+class MockDataForSEOServer:
+    """
+    Local aiohttp stand-in for the DataForSEO endpoints this project uses.
+
+    Serves, under ``{url}`` (``http://host:port/v3``):
+    - ``keywords_data/google/search_volume/live`` (and ``google_ads``)
+    - ``keywords_data/clickstream_data/*/live`` and ``locations_and_languages``
+    - ``keywords_data/google_trends/explore/live``
+    - ``task_post`` / ``tasks_ready`` / ``task_get/{id}`` for every family,
+      with pingbacks and postbacks when a task asks for them
+
+    Payloads are synthetic but stable: a keyword always gets the same
+    volume and trend curve, so repeated or overlapping requests agree.
+    Recorded responses (see ``load_recordings``) replace the synthetic
+    payload for their endpoint. Latency, errors, throttling and prices are
+    set by ``MockBehavior``; ``stats`` counts what was served.
+
+    Point a client at it with ``DataForSEOClient(..., base_url=server.url)``
+    or ``DATAFORSEO_BASE_URL``. Credentials are not checked.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8787,
+        behavior: Optional[MockBehavior] = None,
+        recordings: Optional[Dict[str, Any]] = None,
+        compress: bool = False
+    ):
+        """
+        Initialize mock server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            behavior: Latency, failure and price settings
+            recordings: Response bodies keyed by endpoint path, served instead
+                of synthetic payloads
+            compress: Gzip responses when the client accepts it, like the real API
+        """
+        self.host = host
+        self.port = port
+        self.behavior = behavior or MockBehavior()
+        self.recordings = recordings or {}
+        self.compress = compress
+        self.stats = MockStats()
+        self._random = random.Random(self.behavior.seed)
+        self._recent: Deque[float] = deque()
+        self._active = 0
+        self._queue: Dict[str, _QueuedTask] = {}
+        self._callbacks: set = set()
+        self._runner: Optional[web.AppRunner] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._live: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            SEARCH_VOLUME_PATH: self._search_volume_result,
+            ADS_SEARCH_VOLUME_PATH: self._search_volume_result,
+            f"{CLICKSTREAM_PATH}/search_volume_by_location": self._by_location_result,
+            f"{CLICKSTREAM_PATH}/global_search_volume": self._global_result,
+            f"{CLICKSTREAM_PATH}/search_volume_normalized": self._global_result,
+            TRENDS_PATH: self._trends_result,
+        }
+
+    @property
+    def url(self) -> str:
+        """Base URL to give the client."""
+        return f"http://{self.host}:{self.port}/{API_VERSION}"
+
+    @staticmethod
+    def load_recordings(directory: str) -> Dict[str, Any]:
+        """
+        Read recorded responses from ``directory``.
+
+        Each ``*.json`` file is one full response body; its name is the
+        endpoint path with ``/`` replaced by ``__``, e.g.
+        ``keywords_data__google__search_volume__live.json``.
+        """
+        return {
+            path.stem.replace("__", "/"): json.loads(path.read_text())
+            for path in Path(directory).glob("*.json")
+        }
+
+    async def start(self) -> None:
+        """Start serving."""
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_route("*", f"/{API_VERSION}/{{path:.*}}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+        self._session = aiohttp.ClientSession()
+        logger.info(f"Mock DataForSEO server listening on {self.url}")
+
+    async def stop(self) -> None:
+        """Stop serving and cancel pending callbacks."""
+        for callback in list(self._callbacks):
+            callback.cancel()
+        if self._session:
+            await self._session.close()
+            self._session = None
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        path = request.match_info["path"].strip("/")
+        self.stats.requests += 1
+        self.stats.by_endpoint[path] = self.stats.by_endpoint.get(path, 0) + 1
+
+        tasks: List[Dict[str, Any]] = []
+        if request.method == "POST":
+            body = await request.read()
+            if body[:2] == GZIP_MAGIC:
+                body = gzip.decompress(body)
+            try:
+                tasks = msgspec.json.decode(body) if body else []
+            except msgspec.DecodeError:
+                return self._envelope(request, 40000, "Invalid JSON.", [])
+            if not isinstance(tasks, list):
+                tasks = [tasks]
+
+        throttled = self._throttle()
+        if throttled:
+            self.stats.throttled += 1
+            code, message = throttled
+            return self._envelope(request, code, message, [])
+
+        self._active += 1
+        try:
+            largest = max((len(task.get("keywords") or ()) for task in tasks), default=0)
+            await asyncio.sleep(self._latency(largest))
+            roll = self._random.random()
+            if roll < self.behavior.error_rate:
+                self.stats.errors += 1
+                return web.Response(status=HTTP_ERROR_STATUS, text="Internal Server Error")
+            if roll < self.behavior.error_rate + self.behavior.timeout_rate:
+                self.stats.timeouts += 1
+                return web.Response(status=HTTP_TIMEOUT_STATUS, text="Gateway Timeout")
+            return self._route(request, path, tasks)
+        finally:
+            self._active -= 1
+
+    def _throttle(self) -> Optional[Tuple[int, str]]:
+        """Status for a request over the account limits, if any."""
+        behavior = self.behavior
+        if behavior.max_simultaneous is not None and self._active >= behavior.max_simultaneous:
+            return SIMULTANEOUS_LIMIT_CODE, "Too many simultaneous requests."
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 60:
+            self._recent.popleft()
+        if behavior.requests_per_minute is not None and len(self._recent) >= behavior.requests_per_minute:
+            return RATE_LIMIT_CODE, "Rate limit per minute exceeded."
+        if self._random.random() < behavior.throttle_rate:
+            return RATE_LIMIT_CODE, "Rate limit per minute exceeded."
+        self._recent.append(now)
+        return None
+
+    def _latency(self, keywords: int) -> float:
+        behavior = self.behavior
+        base = behavior.latency
+        if behavior.latency_sigma > 0 and base > 0:
+            base = self._random.lognormvariate(math.log(base), behavior.latency_sigma)
+        return base + behavior.latency_per_keyword * keywords
+
+    def _route(self, request: web.Request, path: str, tasks: List[Dict[str, Any]]) -> web.StreamResponse:
+        if path in self.recordings:
+            return self._recorded(request, path, tasks)
+        if path == f"{CLICKSTREAM_PATH}/locations_and_languages":
+            return self._envelope(request, TASK_OK, "Ok.", [self._task(path, {}, self._locations())])
+
+        family, _, action = path.rpartition("/")
+        if action == "live" and family in self._live:
+            return self._envelope(request, TASK_OK, "Ok.", [self._run_task(path, family, task) for task in tasks])
+        if action == "task_post" and family in self._live:
+            return self._envelope(request, TASK_OK, "Ok.", [self._post(path, family, task) for task in tasks])
+        if action == "tasks_ready" and family in self._live:
+            return self._envelope(request, TASK_OK, "Ok.", [self._task(path, {}, self._ready(family))])
+        family, _, task_id = path.rpartition("/")
+        family, _, action = family.rpartition("/")
+        if action == "task_get" and family in self._live:
+            return self._envelope(request, TASK_OK, "Ok.", [self._collect(family, task_id)])
+        return self._envelope(request, 40400, "Not Found.", [])
+
+    def _run_task(self, endpoint: str, family: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        if self._random.random() < self.behavior.task_error_rate:
+            self.stats.task_errors += 1
+            return self._task(endpoint, task, None, TASK_ERROR_CODE, "Internal Error.")
+        self.stats.keywords += len(task.get("keywords") or ())
+        return self._task(endpoint, task, self._live[family](task), cost=self._price(endpoint))
+
+    def _post(self, endpoint: str, family: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        task_id = uuid.uuid4().hex
+        self._queue[task_id] = _QueuedTask(task_id, family, task, time.monotonic() + self.behavior.queue_delay)
+        if task.get("pingback_url") or task.get("postback_url"):
+            callback = asyncio.ensure_future(self._callback(task_id))
+            self._callbacks.add(callback)
+            callback.add_done_callback(self._callbacks.discard)
+        entry = self._task(endpoint, task, None, TASK_CREATED, "Task Created.", cost=self._price(endpoint))
+        entry["id"] = task_id
+        return entry
+
+    def _ready(self, family: str) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {"id": queued.id, "tag": queued.data.get("tag"), "endpoint_regular": f"/{API_VERSION}/{family}/task_get/{queued.id}"}
+            for queued in self._queue.values()
+            if queued.family == family and not queued.collected and queued.ready_at <= now
+        ]
+
+    def _collect(self, family: str, task_id: str) -> Dict[str, Any]:
+        queued = self._queue.get(task_id)
+        endpoint = f"{family}/task_get/{task_id}"
+        if queued is None or queued.family != family:
+            return self._task(endpoint, {}, None, 40403, "Task not found.")
+        if queued.ready_at > time.monotonic():
+            entry = self._task(endpoint, queued.data, None, TASK_IN_QUEUE, "Task In Queue.")
+        else:
+            queued.collected = True
+            entry = self._run_task(endpoint, family, queued.data)
+            entry["cost"] = 0.0
+        entry["id"] = task_id
+        return entry
+
+    async def _callback(self, task_id: str) -> None:
+        """Send a queued task's pingback or postback once it is ready."""
+        queued = self._queue[task_id]
+        await asyncio.sleep(max(0.0, queued.ready_at - time.monotonic()))
+        data = queued.data
+        try:
+            if data.get("postback_url"):
+                queued.collected = True
+                task = self._run_task(f"{queued.family}/task_post", queued.family, data)
+                task["id"] = task_id
+                body = gzip.compress(msgspec.json.encode({"status_code": TASK_OK, "tasks": [task]}))
+                await self._session.post(data["postback_url"], data=body)
+            else:
+                url = data["pingback_url"].replace("$id", task_id).replace("$tag", str(data.get("tag", "")))
+                await self._session.get(url)
+        except aiohttp.ClientError as e:
+            logger.warning(f"Mock callback for task {task_id} failed: {e!r}")
+
+    def _price(self, endpoint: str) -> float:
+        return self.behavior.prices.get(endpoint, 0.0)
+
+    def _task(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        result: Optional[List[Any]],
+        status_code: int = TASK_OK,
+        status_message: str = "Ok.",
+        cost: float = 0.0
+    ) -> Dict[str, Any]:
+        self.stats.tasks += 1
+        self.stats.cost += cost
+        return {
+            "id": uuid.uuid4().hex,
+            "status_code": status_code,
+            "status_message": status_message,
+            "time": "0.0000 sec.",
+            "cost": cost,
+            "result_count": len(result) if result else 0,
+            "path": endpoint.split("/"),
+            "data": data,
+            "result": result,
+        }
+
+    def _envelope(
+        self,
+        request: web.Request,
+        status_code: int,
+        status_message: str,
+        tasks: List[Dict[str, Any]]
+    ) -> web.StreamResponse:
+        body = {
+            "version": "0.1.mock",
+            "status_code": status_code,
+            "status_message": status_message,
+            "time": "0.0000 sec.",
+            "cost": round(sum(task["cost"] for task in tasks), 6),
+            "tasks_count": len(tasks),
+            "tasks_error": sum(1 for task in tasks if task["status_code"] not in (TASK_OK, TASK_CREATED)),
+            "tasks": tasks,
+        }
+        return self._json(request, body)
+
+    def _json(self, request: web.Request, body: Any) -> web.StreamResponse:
+        response = web.Response(body=msgspec.json.encode(body), content_type="application/json")
+        if self.compress and "gzip" in request.headers.get("Accept-Encoding", ""):
+            response.enable_compression()
+        return response
+
+    def _recorded(self, request: web.Request, path: str, tasks: List[Dict[str, Any]]) -> web.StreamResponse:
+        """A recorded response, with each task's data replaced by what was sent."""
+        body = json.loads(json.dumps(self.recordings[path]))
+        recorded = body.get("tasks") or []
+        if recorded and tasks:
+            body["tasks"] = [{**recorded[i % len(recorded)], "data": task} for i, task in enumerate(tasks)]
+        self.stats.cost += body.get("cost") or 0.0
+        return self._json(request, body)
+
+    # Synthetic payloads, shaped like the API's
+
+    def _search_volume_result(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        location_code = task.get("location_code", 2840)
+        language_code = task.get("language_code", "en")
+        rows = []
+        for keyword in task.get("keywords") or []:
+            volume = synthetic_volume(keyword)
+            rows.append({
+                "keyword": keyword,
+                "location_code": location_code,
+                "language_code": language_code,
+                "search_partners": False,
+                "competition": "LOW",
+                "competition_index": int(100 * _unit("competition", keyword)),
+                "search_volume": volume,
+                "low_top_of_page_bid": None,
+                "high_top_of_page_bid": None,
+                "cpc": round(5 * _unit("cpc", keyword), 2),
+                "monthly_searches": synthetic_monthly_searches(keyword, volume),
+            })
+        return rows
+
+    def _by_location_result(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        location_code = task.get("location_code", 2840)
+        items = []
+        for keyword in task.get("keywords") or []:
+            volume = synthetic_volume(keyword, location_code)
+            items.append({
+                "keyword": keyword,
+                "search_volume": volume,
+                "monthly_searches": synthetic_monthly_searches(keyword, volume),
+            })
+        return [{"location_code": location_code, "language_code": task.get("language_code"), "items_count": len(items), "items": items}]
+
+    def _global_result(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        items = []
+        for keyword in task.get("keywords") or []:
+            volume = synthetic_volume(keyword)
+            items.append({
+                "keyword": keyword,
+                "search_volume": volume,
+                "country_distribution": [
+                    {"country_iso_code": iso, "search_volume": int(volume * share), "percentage": share * 100}
+                    for _, _, iso, share in MOCK_LOCATIONS
+                ],
+            })
+        return [{"items_count": len(items), "items": items}]
+
+    def _trends_result(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        keywords = task.get("keywords") or []
+        end = date.fromisoformat(task["date_to"]) if task.get("date_to") else date.today()
+        start = date.fromisoformat(task["date_from"]) if task.get("date_from") else end - timedelta(days=30)
+        span = (end - start).days + 1
+        # Hourly up to a week, daily up to ~9 months, weekly beyond, like Google Trends
+        step = 3600 if span <= 7 else 86400 if span <= 269 else 7 * 86400
+        first = datetime(start.year, start.month, start.day, tzinfo=timezone.utc).timestamp()
+        moments = [first + i * step for i in range(int(span * 86400 // step))]
+
+        raw = [[synthetic_interest(keyword, moment) for keyword in keywords] for moment in moments]
+        peak = max((value for row in raw for value in row), default=0) or 1
+        data = []
+        for moment, row in zip(moments, raw):
+            day = datetime.fromtimestamp(moment, tz=timezone.utc)
+            data.append({
+                "date_from": day.date().isoformat(),
+                "date_to": (day + timedelta(seconds=step - 1)).date().isoformat(),
+                "timestamp": int(moment),
+                "missing_data": False,
+                "values": [round(100 * value / peak) for value in row],
+            })
+        averages = [
+            round(sum(point["values"][k] for point in data) / len(data)) if data else None
+            for k in range(len(keywords))
+        ]
+        graph = {
+            "position": 1,
+            "type": "google_trends_graph",
+            "title": "Interest over time",
+            "keywords": keywords,
+            "data": data,
+            "averages": averages,
+        }
+        return [{
+            "keywords": keywords,
+            "type": task.get("type", "web"),
+            "location_code": task.get("location_code"),
+            "language_code": task.get("language_code"),
+            "datetime": datetime.now(timezone.utc).isoformat(),
+            "items_count": 1,
+            "items": [graph],
+        }]
+
+    def _locations(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "location_code": code,
+                "location_name": name,
+                "location_code_parent": None,
+                "country_iso_code": iso,
+                "location_type": "Country",
+                "available_languages": [{"language_name": "English", "language_code": "en"}],
+            }
+            for code, name, iso, _ in MOCK_LOCATIONS
+        ]
@@ -0,0 +1,143 @@
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Label styles for month keys
+LONG = "long"   # "June 2025", as stored in Firestore
+ISO = "iso"     # "2025-06"
+
+# Stands in for a null search_volume inside the int64 array
+MISSING = -1
+
+
+def month_index(year: int, month: int) -> int:
+    """Months since year 0, so consecutive months differ by one."""
+    return year * 12 + month - 1
+
+
+@lru_cache(maxsize=256)
+def month_labels(start: int, count: int, style: str = LONG) -> Tuple[str, ...]:
+    """
+    Keys for ``count`` consecutive months starting at month index ``start``.
+
+    Every keyword of a batch shares the same months, so the labels are
+    formatted once and reused for all of them.
+    """
+    labels = []
+    for index in range(start, start + count):
+        year, month0 = divmod(index, 12)
+        if style == ISO:
+            labels.append(f"{year}-{month0 + 1:02d}")
+        else:
+            labels.append(f"{MONTH_NAMES[month0]} {year}")
+    return tuple(labels)
+
+
+class MonthlySeries:
+    """
+    Monthly search volumes as a start month plus a contiguous int64 array.
+
+    The API's list of ``{"year", "month", "search_volume"}`` dicts (newest
+    first) is stored oldest first; months it skipped or reported as null
+    hold MISSING and come back as None from the views.
+    """
+
+    __slots__ = ("start", "values")
+
+    def __init__(self, start: int = 0, values: Optional[array] = None):
+        """
+        Initialize series.
+
+        Args:
+            start: Month index (``month_index``) of the first value
+            values: array("q") of volumes, oldest first
+        """
+        self.start = start
+        self.values = values if values is not None else array("q")
+
+    @classmethod
+    def from_api(cls, months: Optional[Iterable[Any]]) -> "MonthlySeries":
+        """
+        Build from API monthly rows (dicts or objects with year/month/search_volume).
+
+        Rows without a valid year and month are skipped.
+        """
+        points = {}
+        for row in months or ():
+            if isinstance(row, dict):
+                year, month, volume = row.get("year"), row.get("month"), row.get("search_volume")
+            else:
+                year, month, volume = row.year, row.month, row.search_volume
+            if year and month and 1 <= month <= 12:
+                points[month_index(year, month)] = MISSING if volume is None else volume
+
+        if not points:
+            return cls()
+
+        start = min(points)
+        values = array("q", [MISSING]) * (max(points) - start + 1)
+        for index, volume in points.items():
+            values[index - start] = volume
+        return cls(start, values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __bool__(self) -> bool:
+        return bool(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MonthlySeries):
+            return NotImplemented
+        return self.start == other.start and self.values == other.values
+
+    def __repr__(self) -> str:
+        if not self.values:
+            return "MonthlySeries()"
+        labels = self.labels(ISO)
+        return f"MonthlySeries({labels[0]}..{labels[-1]}, {self.volumes()})"
+
+    def labels(self, style: str = LONG) -> Tuple[str, ...]:
+        """Month keys in chronological order."""
+        return month_labels(self.start, len(self.values), style)
+
+    def volumes(self) -> List[Optional[int]]:
+        """Volumes in chronological order, None where missing."""
+        return [None if value == MISSING else value for value in self.values]
+
+    def as_dict(self, style: str = LONG, skip_missing: bool = False) -> Dict[str, Optional[int]]:
+        """
+        Month key to volume, e.g. ``{"June 2025": 1200}`` or ``{"2025-06": 1200}``.
+
+        Args:
+            style: LONG ("June 2025") or ISO ("2025-06")
+            skip_missing: Leave out months without a volume
+        """
+        pairs = zip(self.labels(style), self.volumes())
+        if skip_missing:
+            return {label: volume for label, volume in pairs if volume is not None}
+        return dict(pairs)
+
+    def items(self) -> Iterator[Tuple[int, int, Optional[int]]]:
+        """(year, month, volume) tuples in chronological order."""
+        for offset, value in enumerate(self.values):
+            year, month0 = divmod(self.start + offset, 12)
+            yield year, month0 + 1, None if value == MISSING else value
+
+    def to_list(self) -> List[Dict[str, Optional[int]]]:
+        """The API's list-of-dicts form, newest month first."""
+        rows = [
+            {"year": year, "month": month, "search_volume": volume}
+            for year, month, volume in self.items()
+        ]
+        rows.reverse()
+        return rows
@@ -0,0 +1,230 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# DataForSEO status codes that mean "slow down" rather than "bad request"
+THROTTLE_STATUS_CODES = {
+    40202,  # Rate limit per minute exceeded
+    40209,  # Too many simultaneous requests
+}
+
+# Account-wide limits from the DataForSEO docs
+GENERAL_REQUESTS_PER_MINUTE = 2000
+MAX_SIMULTANEOUS_REQUESTS = 30
+
+# Never throttle a bucket below this fraction of its configured rate
+MIN_RATE_FRACTION = 0.125
+
+
+@dataclass(frozen=True)
+class EndpointLimit:
+    """Request budget for one family of endpoints"""
+    requests_per_minute: float
+    burst: int = 1
+
+
+class TokenBucket:
+    """
+    Token bucket that refills continuously at ``requests_per_minute``.
+
+    Up to ``burst`` requests may be sent back to back after an idle period.
+    When the API reports throttling the bucket halves its effective rate and
+    blocks until the server-suggested delay has passed; every successful
+    request then recovers a tenth of the configured rate until it is back
+    at full speed.
+    """
+
+    def __init__(self, name: str, limit: EndpointLimit):
+        if limit.requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if limit.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.name = name
+        self.limit = limit
+        self.capacity = float(limit.burst)
+        self.base_rate = limit.requests_per_minute / 60.0  # tokens per second
+        self.rate = self.base_rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until ``tokens`` are available and take them.
+
+        Waiters are served in FIFO order so a large burst cannot starve
+        earlier callers.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from bucket of size {self.capacity}")
+
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return now - start
+                    wait = (tokens - self._tokens) / self.rate
+
+                await asyncio.sleep(wait)
+
+    def throttle(self, retry_after: Optional[float] = None) -> float:
+        """
+        Back off after the API reported throttling.
+
+        Args:
+            retry_after: Server-suggested delay in seconds, if any
+
+        Returns:
+            Seconds the bucket will stay blocked
+        """
+        now = time.monotonic()
+        self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate / 2)
+        self._tokens = 0.0
+        self._updated = now
+
+        delay = retry_after if retry_after is not None else 1.0 / self.rate
+        self._blocked_until = max(self._blocked_until, now + delay)
+
+        logger.warning(
+            f"Throttled on {self.name}: rate now {self.rate * 60:.1f}/min, "
+            f"pausing {delay:.1f}s"
+        )
+        return delay
+
+    def record_success(self) -> None:
+        """Recover towards the configured rate after a successful request."""
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets plus the account-wide concurrency cap.
+
+    Endpoints are matched to budgets by longest path prefix, so
+    ``keywords_data/clickstream_data/search_volume_by_location/live`` and
+    ``keywords_data/clickstream_data/locations_and_languages`` draw from the
+    same clickstream bucket. Anything unmatched shares the general bucket.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, EndpointLimit],
+        default_limit: Optional[EndpointLimit] = None,
+        max_concurrent: int = MAX_SIMULTANEOUS_REQUESTS
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            limits: Mapping of endpoint path prefix to its budget
+            default_limit: Budget for endpoints matching no prefix
+            max_concurrent: Maximum simultaneous in-flight requests
+        """
+        self.default_limit = default_limit or EndpointLimit(
+            requests_per_minute=GENERAL_REQUESTS_PER_MINUTE,
+            burst=MAX_SIMULTANEOUS_REQUESTS
+        )
+        # Longest prefix first so the most specific budget wins
+        self._prefixes = sorted(
+            ((prefix.strip('/'), limit) for prefix, limit in limits.items()),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._concurrency = asyncio.Semaphore(max_concurrent)
+
+    @classmethod
+    def for_account(
+        cls,
+        rate_limit: float,
+        trends_rate_limit: float = GENERAL_REQUESTS_PER_MINUTE,
+        overrides: Optional[Dict[str, EndpointLimit]] = None
+    ) -> "RateLimiter":
+        """
+        Build the default DataForSEO budgets.
+
+        Args:
+            rate_limit: Requests per minute for clickstream and Google Ads search volume
+            trends_rate_limit: Requests per minute for Google Trends explore
+            overrides: Extra or replacement budgets keyed by endpoint prefix
+        """
+        restricted_burst = max(1, int(rate_limit))
+        general = EndpointLimit(GENERAL_REQUESTS_PER_MINUTE, MAX_SIMULTANEOUS_REQUESTS)
+        limits = {
+            "keywords_data/clickstream_data": EndpointLimit(rate_limit, restricted_burst),
+            "keywords_data/google/search_volume": EndpointLimit(rate_limit, restricted_burst),
+            # Collecting queued results is not subject to the per-endpoint limit
+            "keywords_data/google/search_volume/tasks_ready": general,
+            "keywords_data/google/search_volume/task_get": general,
+            "keywords_data/google_trends": EndpointLimit(
+                trends_rate_limit,
+                min(MAX_SIMULTANEOUS_REQUESTS, max(1, int(trends_rate_limit)))
+            ),
+        }
+        if overrides:
+            limits.update(overrides)
+        return cls(limits)
+
+    def _resolve(self, endpoint: str) -> Tuple[str, EndpointLimit]:
+        path = endpoint.strip('/')
+        for prefix, limit in self._prefixes:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "*", self.default_limit
+
+    def bucket_for(self, endpoint: str) -> TokenBucket:
+        """Return the bucket that governs ``endpoint``."""
+        key, limit = self._resolve(endpoint)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(key, limit)
+            self._buckets[key] = bucket
+        return bucket
+
+    @asynccontextmanager
+    async def limit(self, endpoint: str, tokens: float = 1.0) -> AsyncIterator[TokenBucket]:
+        """
+        Hold a request slot for ``endpoint``.
+
+        Takes a token from the endpoint's bucket, then one of the
+        simultaneous-request slots for the duration of the block.
+        """
+        bucket = self.bucket_for(endpoint)
+        waited = await bucket.acquire(tokens)
+        if waited > 0.5:
+            logger.debug(f"Waited {waited:.2f}s for {bucket.name} budget")
+        async with self._concurrency:
+            yield bucket
+
+    def throttle(self, endpoint: str, retry_after: Optional[float] = None) -> float:
+        """Slow down the bucket for ``endpoint``; returns the pause in seconds."""
+        return self.bucket_for(endpoint).throttle(retry_after)
+
+    def record_success(self, endpoint: str) -> None:
+        """Let the bucket for ``endpoint`` recover after a successful call."""
+        self.bucket_for(endpoint).record_success()
@@ -0,0 +1,246 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Type
+import logging
+
+from .decoding import decode, encode
+
+logger = logging.getLogger(__name__)
+
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Entry lifetimes by endpoint prefix; the longest matching prefix wins.
+# Monthly search volume only changes when DataForSEO publishes a new month,
+# while trends data moves daily.
+DEFAULT_TTLS = {
+    "keywords_data/google/search_volume": 7 * DAY,
+    "keywords_data/clickstream_data": 7 * DAY,
+    "keywords_data/clickstream_data/locations_and_languages": 30 * DAY,
+    "keywords_data/google_trends": 6 * HOUR,
+}
+DEFAULT_TTL = DAY
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Normalize a keyword the way the API does: lowercase, single spaces."""
+    return " ".join(keyword.lower().split())
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of API results, stored per keyword.
+
+    Entries are keyed on the endpoint, the task parameters other than
+    ``keywords`` and ``tag`` (location, language, ...) and one normalized
+    keyword, so batches that only partially overlap still hit for the
+    keywords they share. Entries expire after the endpoint's TTL and the
+    least recently used entries are evicted once the cache exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Initialize cache, creating the database if needed.
+
+        Args:
+            path: SQLite file path (":memory:" for a throwaway cache)
+            ttls: Seconds to keep entries, keyed by endpoint prefix
+            default_ttl: Seconds to keep entries for unmatched endpoints
+            max_bytes: Total stored value size before LRU eviction
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._ttls = sorted(
+            ((prefix.strip('/'), ttl) for prefix, ttl in (ttls or DEFAULT_TTLS).items()),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        self._conn.commit()
+        # Total stored value size, kept up to date by put_many and eviction
+        self._size: int = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Seconds an entry for ``endpoint`` stays valid."""
+        path = endpoint.strip('/')
+        for prefix, ttl in self._ttls:
+            if path.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(endpoint: str, params: Dict[str, Any], keyword: str = "") -> str:
+        """
+        Build the cache key for one keyword of a task.
+
+        Args:
+            endpoint: API endpoint path
+            params: Task parameters; ``keywords`` and ``tag`` are ignored
+            keyword: Keyword the entry is for (normalized here)
+        """
+        relevant = {k: v for k, v in params.items() if k not in ("keywords", "tag")}
+        raw = json.dumps(
+            [endpoint.strip('/'), relevant, normalize_keyword(keyword)],
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def get_many(
+        self,
+        endpoint: str,
+        keys: Iterable[str],
+        value_type: Optional[Type] = None
+    ) -> Dict[str, Any]:
+        """
+        Look up several entries at once.
+
+        Args:
+            endpoint: API endpoint path
+            keys: Keys from ``key()``
+            value_type: Decode values into this type (e.g. a result
+                dataclass) instead of plain dicts
+
+        Returns:
+            Mapping of key to cached value for every fresh hit
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        now = time.time()
+        found: Dict[str, Any] = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders}) AND expires_at > ?",
+                    (*chunk, now)
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = decode(value, value_type)
+
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+
+        self.hits[endpoint] += len(found)
+        self.misses[endpoint] += len(keys) - len(found)
+        return found
+
+    def put_many(self, endpoint: str, items: Dict[str, Any]) -> None:
+        """Store several entries for ``endpoint``, then evict if over size."""
+        if not items:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_for(endpoint)
+        rows = []
+        for key, value in items.items():
+            blob = encode(value)
+            rows.append((key, endpoint, blob, len(blob), expires_at, now))
+
+        keys = list(items)
+        with self._lock:
+            # Entries being replaced no longer count towards the total
+            replaced = 0
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                replaced += self._conn.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM entries WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, endpoint, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+            self._size += sum(row[3] for row in rows) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones until under max_bytes; holds the lock."""
+        now = time.time()
+        self._size -= self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries WHERE expires_at <= ?", (now,)
+        ).fetchone()[0]
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        if self._size > self.max_bytes:
+            excess = self._size - self.max_bytes
+            cursor = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at")
+            doomed = []
+            for key, size in cursor:
+                doomed.append((key,))
+                self._size -= size
+                excess -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            logger.info(f"Evicted {len(doomed)} cache entries to stay under {self.max_bytes} bytes")
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit and miss counts per endpoint since this cache was opened."""
+        endpoints = set(self.hits) | set(self.misses)
+        return {
+            endpoint: {"hits": self.hits[endpoint], "misses": self.misses[endpoint]}
+            for endpoint in sorted(endpoints)
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,156 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+import logging
+
+from .errors import DataForSEOCircuitOpenError
+from .rate_limiter import THROTTLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+
+# HTTP statuses worth another attempt
+RETRYABLE_HTTP_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# DataForSEO status codes worth another attempt besides throttling.
+# 5xxxx codes are server-side failures; 4xxxx codes (bad credentials,
+# insufficient funds, invalid fields) will fail the same way every time.
+RETRYABLE_API_STATUS_CODES = {
+    50000,  # Internal error
+    50301,  # Service temporarily unavailable
+}
+
+
+def is_throttled(status_code: Optional[int]) -> bool:
+    """True for HTTP 429 and DataForSEO rate-limit codes."""
+    return status_code == 429 or status_code in THROTTLE_STATUS_CODES
+
+
+def is_retryable(status_code: Optional[int]) -> bool:
+    """
+    Classify a failure as transient or fatal.
+
+    Args:
+        status_code: HTTP status (3 digits), DataForSEO status code (5 digits),
+            or None for network errors and timeouts
+
+    Returns:
+        True if the same request may succeed on a later attempt
+    """
+    if status_code is None:
+        return True
+    if is_throttled(status_code):
+        return True
+    if status_code < 1000:
+        return status_code in RETRYABLE_HTTP_STATUSES
+    return status_code in RETRYABLE_API_STATUS_CODES or status_code >= 50000
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Server-suggested delay, which takes precedence
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests while the API is failing.
+
+    After ``failure_threshold`` consecutive retryable failures the circuit
+    opens and requests fail fast with DataForSEOCircuitOpenError instead of
+    spending rate-limit budget. After ``reset_timeout`` seconds one probe
+    request is let through (half-open); its success closes the circuit and
+    its failure re-opens it for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before probing again
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    def before_request(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            DataForSEOCircuitOpenError: If the circuit is open
+        """
+        if self.state == self.CLOSED:
+            return
+
+        remaining = self._opened_at + self.reset_timeout - time.monotonic()
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        # A probe that never reported back (e.g. cancelled) must not block forever
+        probe_stale = time.monotonic() - self._probe_started > self.reset_timeout
+        if self.state == self.HALF_OPEN and (not self._probe_in_flight or probe_stale):
+            self._probe_in_flight = True
+            self._probe_started = time.monotonic()
+            logger.info("Circuit half-open, sending probe request")
+            return
+
+        raise DataForSEOCircuitOpenError(
+            f"Circuit open after {self._failures} consecutive failures; "
+            f"retry in {max(0.0, remaining):.0f}s",
+            retry_after=max(0.0, remaining)
+        )
+
+    def record_success(self) -> None:
+        """Close the circuit after the API answered."""
+        if self.state != self.CLOSED:
+            logger.info("Circuit closed, API recovered")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.error(
+                    f"Circuit opened after {self._failures} consecutive failures; "
+                    f"pausing requests for {self.reset_timeout:.0f}s"
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
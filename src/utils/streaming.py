@@ -0,0 +1,177 @@
+import re
+from typing import List, Optional, Sequence
+import logging
+
+import msgspec
+
+logger = logging.getLogger(__name__)
+
+
+_TOKEN = re.compile(rb'["{}\[\],]')
+_STRING_END = re.compile(rb'["\\]')
+
+_QUOTE, _BACKSLASH = ord('"'), ord('\\')
+_OPEN_OBJECT, _CLOSE_OBJECT = ord('{'), ord('}')
+_OPEN_ARRAY, _CLOSE_ARRAY = ord('['), ord(']')
+_COMMA = ord(',')
+
+
+class ResultStreamParser:
+    """
+    Incremental splitter for the row arrays of a DataForSEO response.
+
+    Feed it the body chunk by chunk; each call returns the raw JSON of every
+    object in ``$.tasks[*].result[*]`` (or another ``array_path``) completed
+    so far, ready for ``msgspec`` to decode. Everything else in the body - the
+    envelope and each task's status, cost, data - is kept as a small
+    "skeleton" document whose row arrays are empty, returned by ``close()``.
+
+    Only the row being parsed and the skeleton are buffered, so memory does
+    not grow with the number of rows.
+    """
+
+    def __init__(self, array_path: Sequence[str] = ("tasks", "result")):
+        """
+        Initialize parser.
+
+        Args:
+            array_path: Keys leading to the row arrays; each key names an
+                array whose elements are objects, the last one holds the rows
+        """
+        self.array_path = tuple(array_path)
+        self._buf = bytearray()
+        self._pos = 0
+        # One [is_object, current_key] pair per open container
+        self._stack: List[list] = []
+        self._expect_key = False
+        self._in_string = False
+        self._string_start = 0
+        self._skeleton = bytearray()
+        self._copy_from: Optional[int] = 0  # None while inside a row array
+        self._rows_depth: Optional[int] = None
+        self._row_start: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Consume the next chunk of the body.
+
+        Returns:
+            Raw JSON of each row completed by this chunk
+        """
+        self._buf += chunk
+        rows: List[bytes] = []
+        buf = self._buf
+        pos = self._pos
+
+        while True:
+            if self._in_string:
+                match = _STRING_END.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                end = match.start()
+                if buf[end] == _BACKSLASH:
+                    if end + 1 >= len(buf):
+                        # Escape split across chunks; resume at the backslash
+                        pos = end
+                        break
+                    pos = end + 2
+                    continue
+                self._in_string = False
+                pos = end + 1
+                if self._expect_key:
+                    self._stack[-1][1] = msgspec.json.decode(bytes(buf[self._string_start:pos]))
+                    self._expect_key = False
+                continue
+
+            match = _TOKEN.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            i = match.start()
+            char = buf[i]
+            pos = i + 1
+
+            if char == _QUOTE:
+                self._in_string = True
+                self._string_start = i
+            elif char == _COMMA:
+                self._expect_key = bool(self._stack) and self._stack[-1][0]
+            elif char == _OPEN_OBJECT:
+                if self._rows_depth == len(self._stack) and self._row_start is None:
+                    self._row_start = i
+                self._stack.append([True, None])
+                self._expect_key = True
+            elif char == _OPEN_ARRAY:
+                self._stack.append([False, None])
+                self._expect_key = False
+                if self._rows_depth is None and self._is_rows_array():
+                    self._rows_depth = len(self._stack)
+                    self._skeleton += buf[self._copy_from:pos]
+                    self._copy_from = None
+            elif char == _CLOSE_OBJECT:
+                self._stack.pop()
+                self._expect_key = False
+                if self._row_start is not None and len(self._stack) == self._rows_depth:
+                    rows.append(bytes(buf[self._row_start:pos]))
+                    self._row_start = None
+            elif char == _CLOSE_ARRAY:
+                if self._rows_depth == len(self._stack):
+                    self._rows_depth = None
+                    self._copy_from = i
+                self._stack.pop()
+                self._expect_key = False
+
+        self._pos = pos
+        self._compact()
+        return rows
+
+    def close(self) -> bytes:
+        """
+        Finish parsing.
+
+        Returns:
+            The skeleton document (the body with empty row arrays)
+
+        Raises:
+            ValueError: If the body ended mid-document
+        """
+        if self._stack or self._in_string:
+            raise ValueError("Response body ended before the JSON document was complete")
+        if self._copy_from is not None:
+            self._skeleton += self._buf[self._copy_from:]
+        return bytes(self._skeleton)
+
+    def _is_rows_array(self) -> bool:
+        """True if the array just opened is at ``array_path``."""
+        stack = self._stack
+        if len(stack) != 2 * len(self.array_path):
+            return False
+        for depth, key in enumerate(self.array_path):
+            is_object, current_key = stack[2 * depth]
+            if not is_object or current_key != key or stack[2 * depth + 1][0]:
+                return False
+        return True
+
+    def _compact(self) -> None:
+        """Move skeleton bytes out and drop everything already consumed."""
+        if self._copy_from is not None:
+            self._skeleton += self._buf[self._copy_from:self._pos]
+            self._copy_from = self._pos
+
+        keep = self._pos
+        if self._row_start is not None:
+            keep = min(keep, self._row_start)
+        if self._in_string:
+            keep = min(keep, self._string_start)
+        if not keep:
+            return
+
+        del self._buf[:keep]
+        self._pos -= keep
+        if self._copy_from is not None:
+            self._copy_from -= keep
+        if self._row_start is not None:
+            self._row_start -= keep
+        if self._in_string:
+            self._string_start -= keep
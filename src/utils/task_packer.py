@@ -0,0 +1,147 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+import logging
+
+from .errors import DataForSEOError
+
+logger = logging.getLogger(__name__)
+
+
+# DataForSEO accepts up to 100 tasks in the array of a single POST
+MAX_TASKS_PER_REQUEST = 100
+
+# How long the first queued task waits for others to join its POST
+DEFAULT_PACK_WINDOW = 0.05  # seconds
+
+
+SendFunc = Callable[..., Awaitable[Dict[str, Any]]]
+
+# Endpoint plus the send options a POST was submitted with
+PackKey = Tuple[str, Tuple[Tuple[str, Hashable], ...]]
+
+
+class TaskPacker:
+    """
+    Packs tasks submitted concurrently to the same endpoint into one POST.
+
+    Each caller submits a single task and awaits its own entry of the
+    response's ``tasks`` array. A POST is sent as soon as ``max_tasks`` are
+    queued for an endpoint, or ``pack_window`` seconds after the first task
+    was queued, whichever comes first. DataForSEO returns ``tasks`` in the
+    order they were posted, so entries are routed back by position.
+
+    Send options given to ``submit`` are passed on to ``send``; only tasks
+    submitted with the same endpoint and options share a POST.
+    """
+
+    def __init__(
+        self,
+        send: SendFunc,
+        max_tasks: int = MAX_TASKS_PER_REQUEST,
+        pack_window: float = DEFAULT_PACK_WINDOW
+    ):
+        """
+        Initialize task packer.
+
+        Args:
+            send: Coroutine that POSTs a task array to an endpoint, with any send
+                options as keyword arguments, and returns the response
+            max_tasks: Maximum tasks per POST (1 disables packing)
+            pack_window: Seconds to wait for more tasks before sending
+        """
+        if not 1 <= max_tasks <= MAX_TASKS_PER_REQUEST:
+            raise ValueError(f"max_tasks must be between 1 and {MAX_TASKS_PER_REQUEST}")
+
+        self._send = send
+        self.max_tasks = max_tasks
+        self.pack_window = pack_window
+        self._pending: Dict[PackKey, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._timers: Dict[PackKey, asyncio.TimerHandle] = {}
+        self._flushes: set = set()
+
+    async def submit(self, endpoint: str, task: Dict[str, Any], **options: Hashable) -> Dict[str, Any]:
+        """
+        Queue one task and wait for its entry in the response.
+
+        Args:
+            endpoint: API endpoint path
+            task: Task object as it would appear in the POST array
+            **options: Keyword arguments for ``send``
+
+        Returns:
+            The matching object from the response's ``tasks`` array
+
+        Raises:
+            Whatever ``send`` raised for the POST carrying this task
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (endpoint, tuple(sorted(options.items())))
+        pending = self._pending.setdefault(key, [])
+        pending.append((task, future))
+
+        if len(pending) >= self.max_tasks:
+            self._schedule_flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(
+                self.pack_window, self._schedule_flush, key
+            )
+
+        return await future
+
+    def _schedule_flush(self, key: PackKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        pending = self._pending.pop(key, [])
+        if not pending:
+            return
+
+        flush = asyncio.ensure_future(self._flush(key, pending))
+        # Keep a reference so the flush is not garbage collected mid-flight
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self,
+        key: PackKey,
+        pending: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        """Send queued tasks and route each response task to its caller."""
+        endpoint, options = key
+        # Callers that were cancelled while queued don't need to be sent
+        pending = [(task, future) for task, future in pending if not future.done()]
+        if not pending:
+            return
+
+        if len(pending) > 1:
+            logger.debug(f"Packing {len(pending)} tasks into one POST to {endpoint}")
+
+        try:
+            response = await self._send(endpoint, [task for task, _ in pending], **dict(options))
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        tasks = response.get("tasks") or []
+        if len(tasks) != len(pending):
+            error = DataForSEOError(
+                f"Sent {len(pending)} tasks to {endpoint} but received {len(tasks)}; "
+                f"cannot match results to requests"
+            )
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), task in zip(pending, tasks):
+            if not future.done():
+                future.set_result(task)
+
@@ -0,0 +1,354 @@
+import asyncio
+import gzip
+import json
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
+import logging
+
+from aiohttp import web
+
+from .errors import DataForSEOError
+from .task_packer import MAX_TASKS_PER_REQUEST
+
+if TYPE_CHECKING:
+    from .dataforseo_client import DataForSEOClient
+
+logger = logging.getLogger(__name__)
+
+
+# DataForSEO task status codes used by the standard queue
+TASK_CREATED = 20100
+TASK_OK = 20000
+TASK_IN_QUEUE = 40602
+TASK_HANDED = 40601
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class PingbackReceiver:
+    """
+    Local aiohttp server that DataForSEO calls when a queued task finishes.
+
+    Two callback styles are supported:
+    - pingback: DataForSEO sends ``GET {pingback_url}`` with the task id and
+      tag, and the runner fetches the result with ``task_get``
+    - postback: DataForSEO POSTs the full (usually gzipped) result to
+      ``postback_url`` and no ``task_get`` call is needed
+
+    ``public_url`` is the address DataForSEO can reach, for example a tunnel
+    in front of ``host:port``. For local testing against a mock server it
+    can simply be ``http://127.0.0.1:{port}``.
+    """
+
+    PINGBACK_PATH = "/dataforseo/pingback"
+    POSTBACK_PATH = "/dataforseo/postback"
+
+    def __init__(
+        self,
+        public_url: str,
+        host: str = "0.0.0.0",
+        port: int = 8765,
+        use_postback: bool = False
+    ):
+        """
+        Initialize receiver.
+
+        Args:
+            public_url: Base URL under which DataForSEO reaches this server
+            host: Interface to bind
+            port: Port to bind
+            use_postback: Ask for full results via postback instead of pingbacks
+        """
+        self.public_url = public_url.rstrip('/')
+        self.host = host
+        self.port = port
+        self.use_postback = use_postback
+        self.events: asyncio.Queue = asyncio.Queue()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def pingback_url(self) -> str:
+        """Pingback URL with DataForSEO's $id/$tag placeholders"""
+        return f"{self.public_url}{self.PINGBACK_PATH}?id=$id&tag=$tag"
+
+    @property
+    def postback_url(self) -> str:
+        return f"{self.public_url}{self.POSTBACK_PATH}"
+
+    def task_fields(self) -> Dict[str, str]:
+        """Extra fields to add to each posted task."""
+        if self.use_postback:
+            return {"postback_url": self.postback_url, "postback_data": "regular"}
+        return {"pingback_url": self.pingback_url}
+
+    async def start(self) -> None:
+        """Start listening for callbacks."""
+        app = web.Application()
+        app.router.add_get(self.PINGBACK_PATH, self._handle_pingback)
+        app.router.add_post(self.POSTBACK_PATH, self._handle_postback)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        logger.info(f"Task callback receiver listening on {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def _handle_pingback(self, request: web.Request) -> web.Response:
+        task_id = request.query.get("id")
+        if not task_id:
+            return web.Response(status=400, text="missing id")
+        await self.events.put(("ready", task_id))
+        return web.Response(text="ok")
+
+    async def _handle_postback(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        if body[:2] == GZIP_MAGIC:
+            body = gzip.decompress(body)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            logger.error("Discarding postback with invalid JSON body")
+            return web.Response(status=400, text="invalid json")
+
+        for task in payload.get("tasks") or []:
+            await self.events.put(("result", task))
+        return web.Response(text="ok")
+
+
+class QueuedTaskRunner:
+    """
+    Runs tasks through DataForSEO's standard queue.
+
+    Tasks are posted in bulk with ``task_post``, completion is discovered by
+    polling ``tasks_ready`` (with exponential backoff while nothing is
+    ready) and/or by a PingbackReceiver, and finished tasks are fetched
+    concurrently with ``task_get``. Every task carries a unique ``tag`` so
+    results can be matched back to requests.
+    """
+
+    def __init__(
+        self,
+        client: "DataForSEOClient",
+        api_path: str,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        backoff_factor: float = 1.5,
+        timeout: float = 3600.0,
+        receiver: Optional[PingbackReceiver] = None
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            client: Open DataForSEOClient used for all requests
+            api_path: Endpoint family, e.g. "keywords_data/google/search_volume"
+            poll_interval: Initial seconds between tasks_ready polls
+            max_poll_interval: Upper bound for the poll interval
+            backoff_factor: Interval multiplier after an empty poll
+            timeout: Seconds to wait for all tasks before giving up
+            receiver: Optional callback receiver; polling continues as a fallback
+        """
+        self.client = client
+        self.api_path = api_path.strip('/')
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.receiver = receiver
+
+    async def post(self, tasks: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Post tasks to the queue, tagging any task without a tag.
+
+        Args:
+            tasks: Task objects as for the live endpoint
+
+        Returns:
+            Mapping of task id to the task_post response entry; rejected
+            tasks keep their error status_code. Tasks of a chunk whose
+            task_post failed are keyed by tag, with a None status_code and
+            the error as status_message
+        """
+        extra = self.receiver.task_fields() if self.receiver else {}
+        prepared = [
+            {**task, "tag": task.get("tag") or uuid.uuid4().hex, **extra}
+            for task in tasks
+        ]
+
+        chunks = [
+            prepared[i:i + MAX_TASKS_PER_REQUEST]
+            for i in range(0, len(prepared), MAX_TASKS_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(*[
+            self.client.request("POST", f"{self.api_path}/task_post", chunk)
+            for chunk in chunks
+        ], return_exceptions=True)
+
+        posted = {}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, DataForSEOError):
+                error = response
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                entries = response.get("tasks") or []
+                error = None if len(entries) == len(chunk) else DataForSEOError(
+                    f"Sent {len(chunk)} tasks to {self.api_path}/task_post but received {len(entries)}"
+                )
+            if error:
+                # Other chunks may already be queued; keep them and report these
+                logger.error(f"task_post failed for {len(chunk)} tasks: {error}")
+                for sent in chunk:
+                    posted[sent["tag"]] = {"status_code": None, "status_message": str(error), "data": sent}
+                continue
+            for sent, task in zip(chunk, entries):
+                if task.get("status_code") != TASK_CREATED:
+                    logger.error(
+                        f"task_post rejected task {sent['tag']}: "
+                        f"{task.get('status_code')} {task.get('status_message')}"
+                    )
+                # Make sure every entry can be matched back by tag
+                task["data"] = task.get("data") or sent
+                posted[task.get("id") or sent["tag"]] = task
+
+        logger.info(f"Posted {len(posted)} tasks to {self.api_path}")
+        return posted
+
+    async def ready_ids(self) -> List[str]:
+        """Return ids of all tasks in this endpoint family that are ready to collect."""
+        response = await self.client.request("GET", f"{self.api_path}/tasks_ready")
+        ids = []
+        for task in response.get("tasks") or []:
+            for ready in task.get("result") or []:
+                if ready.get("id"):
+                    ids.append(ready["id"])
+        return ids
+
+    async def fetch(self, task_id: str) -> Dict[str, Any]:
+        """Fetch one finished task with task_get."""
+        response = await self.client.request("GET", f"{self.api_path}/task_get/{task_id}")
+        tasks = response.get("tasks") or []
+        if not tasks:
+            raise DataForSEOError(f"task_get returned no task for {task_id}")
+        return tasks[0]
+
+    async def _try_fetch(self, task_id: str) -> Tuple[str, Union[Dict[str, Any], DataForSEOError]]:
+        try:
+            return task_id, await self.fetch(task_id)
+        except DataForSEOError as e:
+            return task_id, e
+
+    async def run(self, tasks: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Post tasks and yield each finished task object as soon as it is collected.
+
+        Tasks that could not be posted are yielded first, with their error.
+        A task whose task_get fails stays outstanding and is fetched again
+        on the next poll, until the timeout.
+
+        Yields:
+            Task objects as returned by task_get (or by postback); the
+            original tag is in ``task["data"]["tag"]``
+
+        Raises:
+            DataForSEOError: If tasks are still pending at timeout
+        """
+        posted = await self.post(tasks)
+        outstanding: Set[str] = set()
+        for task_id, task in posted.items():
+            if task.get("status_code") == TASK_CREATED:
+                outstanding.add(task_id)
+            else:
+                # Rejected at post time; hand the error back to the caller now
+                yield task
+                
+        deadline = time.monotonic() + self.timeout
+        interval = self.poll_interval
+        # Ready tasks whose task_get failed, fetched again next round
+        retry: Set[str] = set()
+
+        while outstanding:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DataForSEOError(
+                    f"Timed out waiting for {len(outstanding)} queued tasks on {self.api_path}"
+                )
+
+            ready, delivered = await self._wait_for_ready(min(interval, remaining))
+
+            for task in delivered:
+                if task.get("id") in outstanding:
+                    outstanding.discard(task["id"])
+                    yield task
+
+            if not ready:
+                ready = set(await self.ready_ids())
+            ready = (ready | retry) & outstanding
+            retry.clear()
+
+            if not ready and not delivered:
+                interval = min(self.max_poll_interval, interval * self.backoff_factor)
+                continue
+            interval = self.poll_interval
+
+            fetches = [asyncio.ensure_future(self._try_fetch(task_id)) for task_id in ready]
+            try:
+                for next_done in asyncio.as_completed(fetches):
+                    task_id, task = await next_done
+                    if isinstance(task, DataForSEOError):
+                        logger.warning(f"task_get failed for {task_id}; retrying next poll: {task}")
+                        retry.add(task_id)
+                        continue
+                    if task.get("status_code") in (TASK_IN_QUEUE, TASK_HANDED):
+                        # Reported ready but not yet collectable; try again next round
+                        continue
+                    outstanding.discard(task.get("id"))
+                    yield task
+            finally:
+                for fetch in fetches:
+                    fetch.cancel()
+
+    async def _wait_for_ready(self, delay: float):
+        """
+        Sleep until the next poll, waking early on receiver callbacks.
+
+        Returns:
+            Tuple of (task ids reported ready, full task objects delivered)
+        """
+        ready: Set[str] = set()
+        delivered: List[Dict[str, Any]] = []
+
+        if not self.receiver:
+            await asyncio.sleep(delay)
+            return ready, delivered
+
+        try:
+            kind, value = await asyncio.wait_for(self.receiver.events.get(), timeout=delay)
+        except asyncio.TimeoutError:
+            return ready, delivered
+
+        # Drain everything else that already arrived
+        events = [(kind, value)]
+        while not self.receiver.events.empty():
+            events.append(self.receiver.events.get_nowait())
+
+        for kind, value in events:
+            if kind == "ready":
+                ready.add(value)
+            else:
+                delivered.append(value)
+        return ready, delivered
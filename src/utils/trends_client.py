@@ -0,0 +1,385 @@
+import asyncio
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import msgspec
+
+from .dataforseo_client import DataForSEOClient
+from .decoding import ItemsResult, decode_rows
+from .errors import DataForSEOError
+from .monthly_series import MISSING
+from .rate_limiter import MAX_SIMULTANEOUS_REQUESTS
+from .response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+EXPLORE_ENDPOINT = "keywords_data/google_trends/explore/live"
+
+# Google Trends compares at most five keywords per request
+MAX_KEYWORDS_PER_EXPLORE = 5
+
+GRAPH_ITEM = "google_trends_graph"
+
+
+class TrendsPoint(msgspec.Struct):
+    """One point of a google_trends_graph item as returned by the API"""
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    timestamp: Optional[int] = None
+    missing_data: Optional[bool] = None
+    values: List[Optional[int]] = []
+
+
+class TrendsGraphItem(msgspec.Struct):
+    """google_trends_graph item; other item types decode with empty data"""
+    type: str = ""
+    keywords: List[str] = []
+    data: List[TrendsPoint] = []
+    averages: List[Optional[int]] = []
+
+
+class TrendsSeries:
+    """
+    Interest-over-time for up to five keywords on one shared 0-100 scale.
+
+    Point timestamps (epoch seconds, UTC) are one int64 array; the values
+    are one keyword-major int64 array, so each keyword's series is a
+    contiguous slice. Points Google marked as missing, or returned as null,
+    hold MISSING.
+    """
+
+    __slots__ = ("keywords", "timestamps", "values", "averages", "location_code", "language_code")
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        timestamps: Optional[array] = None,
+        values: Optional[array] = None,
+        averages: Optional[array] = None,
+        location_code: Optional[int] = None,
+        language_code: Optional[str] = None
+    ):
+        """
+        Initialize series.
+
+        Args:
+            keywords: Keywords in request order
+            timestamps: array("q") of point start times, oldest first
+            values: array("q") of len(keywords) * len(timestamps) values, keyword-major
+            averages: array("q") of each keyword's average over the period
+            location_code: Location the data is for
+            language_code: Language the data is for
+        """
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self.timestamps = timestamps if timestamps is not None else array("q")
+        self.values = values if values is not None else array("q", [MISSING]) * (len(self.keywords) * len(self.timestamps))
+        self.averages = averages if averages is not None else array("q", [MISSING]) * len(self.keywords)
+        self.location_code = location_code
+        self.language_code = language_code
+        if len(self.values) != len(self.keywords) * len(self.timestamps):
+            raise ValueError("values must hold one point per keyword and timestamp")
+
+    @classmethod
+    def from_item(
+        cls,
+        keywords: List[str],
+        item: TrendsGraphItem,
+        location_code: Optional[int] = None,
+        language_code: Optional[str] = None
+    ) -> "TrendsSeries":
+        """Build from a decoded google_trends_graph item, in ``keywords`` order."""
+        points = item.data
+        count = len(points)
+        timestamps = array("q", (_point_timestamp(point) for point in points))
+        values = array("q", [MISSING]) * (len(keywords) * count)
+        for t, point in enumerate(points):
+            if point.missing_data:
+                continue
+            for k, value in enumerate(point.values[:len(keywords)]):
+                if value is not None:
+                    values[k * count + t] = value
+        averages = array("q", (
+            value if value is not None else MISSING
+            for value in (list(item.averages) + [None] * len(keywords))[:len(keywords)]
+        ))
+        return cls(keywords, timestamps, values, averages, location_code, language_code)
+
+    def __len__(self) -> int:
+        """Number of points."""
+        return len(self.timestamps)
+
+    def series(self, keyword: str) -> array:
+        """One keyword's values, oldest first (MISSING where absent)."""
+        count = len(self.timestamps)
+        k = self.keywords.index(keyword)
+        return self.values[k * count:(k + 1) * count]
+
+    def average(self, keyword: str) -> Optional[int]:
+        value = self.averages[self.keywords.index(keyword)]
+        return None if value == MISSING else value
+
+    def latest(self, keyword: str) -> Optional[int]:
+        """Most recent value that is not missing."""
+        for value in reversed(self.series(keyword)):
+            if value != MISSING:
+                return value
+        return None
+
+    def dates(self) -> List[date]:
+        """UTC date of each point."""
+        return [datetime.fromtimestamp(ts, tz=timezone.utc).date() for ts in self.timestamps]
+
+    def as_dict(self) -> Dict[str, Dict[str, Optional[int]]]:
+        """{keyword: {"YYYY-MM-DD": value}} with None for missing points."""
+        labels = [day.isoformat() for day in self.dates()]
+        return {
+            keyword: {
+                label: None if value == MISSING else value
+                for label, value in zip(labels, self.series(keyword))
+            }
+            for keyword in self.keywords
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TrendsSeries):
+            return NotImplemented
+        return (
+            self.keywords == other.keywords
+            and self.timestamps == other.timestamps
+            and self.values == other.values
+            and self.averages == other.averages
+        )
+
+    def __repr__(self) -> str:
+        return f"TrendsSeries(keywords={list(self.keywords)}, points={len(self)})"
+
+
+@dataclass
+class TrendsBatch:
+    """Outcome of one keyword group of a bulk explore request"""
+    batch_number: int
+    keywords: List[str]
+    series: Optional[TrendsSeries] = None
+    error: Optional[Exception] = None
+
+
+def _point_timestamp(point: TrendsPoint) -> int:
+    if point.timestamp is not None:
+        return point.timestamp
+    if point.date_from:
+        day = date.fromisoformat(point.date_from[:10])
+        return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+    return MISSING
+
+
+def date_range(
+    days_back: int = 30,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Resolve an explore period to (date_from, date_to) as YYYY-MM-DD.
+
+    Explicit dates win; otherwise the period ends today and starts
+    ``days_back`` days earlier.
+    """
+    if date_from and date_to:
+        return date_from, date_to
+    end = date.fromisoformat(date_to) if date_to else date.today()
+    return (end - timedelta(days=days_back)).isoformat(), end.isoformat()
+
+
+class GoogleTrendsClient:
+    """
+    Async client for the Google Trends explore endpoint.
+
+    Sits on a DataForSEOClient and uses its pooled session, rate limiter
+    (the google_trends budget), retries, circuit breaker, metrics and cache.
+    Pass an existing client to share them with search volume calls, or
+    credentials to have one opened and closed with this client.
+
+    Each explore request compares at most five keywords. ``explore_many``
+    dispatches any number of groups concurrently; the limiter, not fixed
+    sleeps, keeps them within the account's limits.
+    """
+
+    def __init__(
+        self,
+        login: Optional[str] = None,
+        password: Optional[str] = None,
+        client: Optional[DataForSEOClient] = None,
+        **client_kwargs: Any
+    ):
+        """
+        Initialize Google Trends client.
+
+        Args:
+            login: DataForSEO login email (when not passing ``client``)
+            password: DataForSEO API password (when not passing ``client``)
+            client: Existing DataForSEOClient to share; left open on exit
+            **client_kwargs: Passed to DataForSEOClient when one is created here
+        """
+        if client is None:
+            if not (login and password):
+                raise ValueError("Either client or login and password are required")
+            client = DataForSEOClient(login, password, **client_kwargs)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+        self.client = client
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        if self._owns_client:
+            await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        if self._owns_client:
+            await self.client.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def explore(
+        self,
+        keywords: List[str],
+        days_back: int = 30,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        location_code: Optional[int] = 2840,
+        language_code: str = "en",
+        tag: Optional[str] = None
+    ) -> TrendsSeries:
+        """
+        Get interest over time for up to five keywords on one scale.
+
+        Args:
+            keywords: Keywords to compare (1-5)
+            days_back: Days to look back from today (ignored if both dates given)
+            date_from: Start date (YYYY-MM-DD)
+            date_to: End date (YYYY-MM-DD)
+            location_code: Location code (default: 2840, United States; None for worldwide)
+            language_code: Language code (default: "en")
+            tag: Optional task identifier
+
+        Returns:
+            TrendsSeries in ``keywords`` order
+
+        Raises:
+            ValueError: If the keyword count is out of range
+            DataForSEOError: If the API returns an error
+        """
+        if not keywords:
+            raise ValueError("Keywords list cannot be empty")
+
+        if len(keywords) > MAX_KEYWORDS_PER_EXPLORE:
+            raise ValueError(f"Maximum {MAX_KEYWORDS_PER_EXPLORE} keywords allowed per explore request")
+
+        start, end = date_range(days_back, date_from, date_to)
+        task_data: Dict[str, Any] = {
+            "keywords": list(keywords),
+            "language_code": language_code,
+            "date_from": start,
+            "date_to": end,
+            # Only the interest-over-time graph; skips maps and topic lists
+            "item_types": [GRAPH_ITEM]
+        }
+        if location_code:
+            task_data["location_code"] = location_code
+
+        cache = self.client.cache
+        key = ResponseCache.key(EXPLORE_ENDPOINT, task_data, ", ".join(keywords))
+        if cache:
+            cached = cache.get_many(EXPLORE_ENDPOINT, [key], TrendsGraphItem)
+            if key in cached:
+                return TrendsSeries.from_item(keywords, cached[key], location_code, language_code)
+
+        if tag:
+            task_data["tag"] = tag
+
+        task = await self.client.post_live_task(EXPLORE_ENDPOINT, task_data)
+        if task.get("status_code") != 20000:
+            raise DataForSEOError(f"Task error {task.get('status_code')}: {task.get('status_message')}")
+
+        item = None
+        for result in decode_rows(task.get("result"), ItemsResult[TrendsGraphItem], "google_trends"):
+            item = next((i for i in result.items or [] if i.type == GRAPH_ITEM), None)
+            if item is not None:
+                break
+        if item is None:
+            # No graph means Google has no data for the period; an empty series, not an error
+            item = TrendsGraphItem(type=GRAPH_ITEM, keywords=list(keywords))
+
+        if cache:
+            cache.put_many(EXPLORE_ENDPOINT, {key: item})
+        return TrendsSeries.from_item(keywords, item, location_code, language_code)
+
+    async def explore_many(
+        self,
+        keyword_groups: Iterable[List[str]],
+        days_back: int = 30,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        location_code: Optional[int] = 2840,
+        language_code: str = "en",
+        tag_prefix: Optional[str] = None,
+        max_concurrency: int = MAX_SIMULTANEOUS_REQUESTS
+    ) -> AsyncIterator[TrendsBatch]:
+        """
+        Explore many keyword groups concurrently.
+
+        Each group is one request and has its own 0-100 scale. Batches are
+        yielded in completion order; a failed group is yielded with
+        ``error`` set and the others keep going.
+
+        Args:
+            keyword_groups: Groups of 1-5 keywords
+            days_back, date_from, date_to, location_code, language_code: As for ``explore``
+            tag_prefix: Optional prefix; groups are tagged "{tag_prefix}_{n}"
+            max_concurrency: Maximum requests in flight at once
+
+        Yields:
+            TrendsBatch objects as each group finishes
+
+        Raises:
+            ValueError: If a group is empty or has more than five keywords
+        """
+        groups = [list(group) for group in keyword_groups]
+        for group in groups:
+            if not 1 <= len(group) <= MAX_KEYWORDS_PER_EXPLORE:
+                raise ValueError(f"Each group needs 1-{MAX_KEYWORDS_PER_EXPLORE} keywords, got {group}")
+
+        # Resolve the period once so every group covers the same dates
+        start, end = date_range(days_back, date_from, date_to)
+        in_flight = asyncio.Semaphore(max_concurrency)
+
+        async def run_group(batch_number: int, group: List[str]) -> TrendsBatch:
+            async with in_flight:
+                try:
+                    series = await self.explore(
+                        group,
+                        date_from=start,
+                        date_to=end,
+                        location_code=location_code,
+                        language_code=language_code,
+                        tag=f"{tag_prefix}_{batch_number}" if tag_prefix else None
+                    )
+                    return TrendsBatch(batch_number, group, series)
+                except DataForSEOError as e:
+                    logger.error(f"Trends group {batch_number}/{len(groups)} failed: {e}")
+                    return TrendsBatch(batch_number, group, error=e)
+
+        tasks = [
+            asyncio.ensure_future(run_group(number, group))
+            for number, group in enumerate(groups, 1)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Caller stopped early or failed: don't leave orphaned requests running
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,413 @@
+import math
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+from .monthly_series import MISSING
+from .trends_client import GoogleTrendsClient, TrendsSeries, MAX_KEYWORDS_PER_EXPLORE, date_range
+
+logger = logging.getLogger(__name__)
+
+
+# On the 0-100 scale of one request, a keyword averaging below this has
+# lost too much to integer rounding (over 10% error) to rescale reliably
+DEFAULT_MIN_VALUE = 5.0
+
+# The common scale: the anchor's average over the period
+ANCHOR_AVERAGE = 100.0
+
+
+@dataclass
+class _Measurement:
+    """One keyword as measured against one bridge keyword"""
+    values: Optional[List[float]]  # on the common scale; None if the bridge read all zeros
+    precision: float               # smaller of the keyword's and the bridge's mean raw value
+    bridge: str
+
+
+class NormalizedTrends:
+    """
+    Trends for any number of keywords on one common scale.
+
+    Values are floats where the anchor's average over the period is 100,
+    stored keyword-major in one array("d") sharing a timestamp array;
+    missing points are NaN. Keywords whose value could only be estimated
+    coarsely (see ``TrendsNormalizer``) are reported by ``is_precise``.
+    """
+
+    __slots__ = ("keywords", "anchor", "timestamps", "values", "precise", "_index")
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        anchor: str,
+        timestamps: array,
+        values: array,
+        precise: Iterable[bool]
+    ):
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self.anchor = anchor
+        self.timestamps = timestamps
+        self.values = values
+        self.precise = array("b", precise)
+        self._index = {keyword: i for i, keyword in enumerate(self.keywords)}
+        if len(values) != len(self.keywords) * len(timestamps):
+            raise ValueError("values must hold one point per keyword and timestamp")
+
+    def series(self, keyword: str) -> array:
+        """One keyword's values on the common scale, oldest first."""
+        count = len(self.timestamps)
+        k = self._index[keyword]
+        return self.values[k * count:(k + 1) * count]
+
+    def average(self, keyword: str) -> Optional[float]:
+        return _mean(self.series(keyword))
+
+    def dates(self) -> List[date]:
+        """UTC date of each point."""
+        return [datetime.fromtimestamp(ts, tz=timezone.utc).date() for ts in self.timestamps]
+
+    def is_precise(self, keyword: str) -> bool:
+        return bool(self.precise[self._index[keyword]])
+
+    def ranking(self) -> List[Tuple[str, float]]:
+        """Keywords with data by average, highest first."""
+        averages = ((keyword, self.average(keyword)) for keyword in self.keywords)
+        return sorted(
+            ((keyword, average) for keyword, average in averages if average is not None),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    def as_dict(self) -> Dict[str, Dict[str, object]]:
+        """{keyword: {"average", "precise", "series"}} with rounded values."""
+        return {
+            keyword: {
+                "average": _round(self.average(keyword)),
+                "precise": self.is_precise(keyword),
+                "series": [_round(value) for value in self.series(keyword)]
+            }
+            for keyword in self.keywords
+        }
+
+    def __repr__(self) -> str:
+        imprecise = len(self.keywords) - sum(self.precise)
+        return (
+            f"NormalizedTrends(anchor={self.anchor!r}, keywords={len(self.keywords)}, "
+            f"points={len(self.timestamps)}, imprecise={imprecise})"
+        )
+
+
+def _mean(values: Iterable[float]) -> Optional[float]:
+    present = [value for value in values if not math.isnan(value)]
+    return sum(present) / len(present) if present else None
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None or math.isnan(value) else round(value, 3)
+
+
+class TrendsNormalizer:
+    """
+    Puts any number of keywords on one Google Trends scale.
+
+    Trends values are relative within a request (the highest point is 100),
+    so keywords from different requests cannot be compared directly. Each
+    request here holds up to four keywords plus a shared anchor; the
+    anchor's series, identical up to scale in every request, gives each
+    group's rescaling factor. All groups run concurrently.
+
+    Values are integers, so a keyword far smaller than its anchor rounds to
+    0-2 and loses its shape; an anchor far smaller than a keyword in its
+    group does the same to the factor. Keywords measured that way are
+    re-requested in later rounds against a bridge - the keyword already
+    measured precisely whose level is closest to theirs - chaining the
+    scale through as many steps as needed, up to ``max_rounds``. A keyword
+    flattened by a third one in its group is retried in a group of similar
+    levels. When no bridge is within reach (e.g. the anchor is far below
+    every keyword), the keyword whose estimate is closest to a bridge is
+    re-measured alone against it, as a stepping stone that becomes the
+    next bridge. Keywords that never measure precisely keep their best
+    estimate and are flagged.
+    """
+
+    def __init__(
+        self,
+        trends: GoogleTrendsClient,
+        min_value: float = DEFAULT_MIN_VALUE,
+        max_rounds: int = 4
+    ):
+        """
+        Initialize normalizer.
+
+        Args:
+            trends: Open GoogleTrendsClient
+            min_value: Mean raw value (0-100) below which a measurement is imprecise
+            max_rounds: Request rounds, including the first anchor round
+        """
+        self.trends = trends
+        self.min_value = min_value
+        self.max_rounds = max_rounds
+        self.group_size = MAX_KEYWORDS_PER_EXPLORE - 1
+
+    async def normalize(
+        self,
+        keywords: List[str],
+        anchor: str,
+        days_back: int = 30,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        location_code: Optional[int] = 2840,
+        language_code: str = "en",
+        tag_prefix: Optional[str] = None
+    ) -> NormalizedTrends:
+        """
+        Measure every keyword against ``anchor`` on one scale.
+
+        Args:
+            keywords: Keywords to compare (any number)
+            anchor: Keyword in every first-round group; pick one of middling
+                popularity for the set so fewer keywords need bridging
+            days_back, date_from, date_to, location_code, language_code: As for
+                ``GoogleTrendsClient.explore``; every request covers the same dates
+            tag_prefix: Optional prefix; groups are tagged "{tag_prefix}_r{round}_{n}"
+
+        Returns:
+            NormalizedTrends with the anchor first, then ``keywords`` in order
+        """
+        start, end = date_range(days_back, date_from, date_to)
+        targets = [keyword for keyword in dict.fromkeys(keywords) if keyword != anchor]
+        if not targets:
+            raise ValueError("Need at least one keyword besides the anchor")
+
+        timeline = _Timeline()
+        # Common-scale series of keywords measured precisely, usable as bridges
+        bridges: Dict[str, List[float]] = {}
+        best: Dict[str, _Measurement] = {}
+        tried: Dict[str, Set[str]] = defaultdict(set)
+        # Keywords re-measured on their own against each bridge
+        alone: Dict[str, Set[str]] = defaultdict(set)
+
+        pending = [(anchor, targets[i:i + self.group_size]) for i in range(0, len(targets), self.group_size)]
+        for round_number in range(1, self.max_rounds + 1):
+            if not pending:
+                break
+            logger.info(f"Trends normalization round {round_number}: {len(pending)} groups")
+            groups = [[bridge] + members for bridge, members in pending]
+            results: Dict[int, TrendsSeries] = {}
+            async for batch in self.trends.explore_many(
+                groups,
+                date_from=start,
+                date_to=end,
+                location_code=location_code,
+                language_code=language_code,
+                tag_prefix=f"{tag_prefix}_r{round_number}" if tag_prefix else None
+            ):
+                if batch.series is not None:
+                    results[batch.batch_number] = batch.series
+
+            if anchor not in bridges:
+                reference = _anchor_reference(anchor, results.values(), timeline)
+                if reference is None:
+                    logger.error(f"Anchor {anchor!r} has no trends data; nothing can be normalized")
+                    break
+                bridges[anchor] = reference
+
+            for number, (bridge, members) in enumerate(pending, 1):
+                series = results.get(number)
+                if series is None:
+                    for member in members:
+                        tried[member].add(bridge)
+                    continue
+                raw_bridge = timeline.aligned(series, bridge)
+                factor = _factor(bridges[bridge], raw_bridge)
+                bridge_mean = _mean(raw_bridge) or 0.0
+                raws = {member: timeline.aligned(series, member) for member in members}
+                means = {member: _mean(raw) or 0.0 for member, raw in raws.items()}
+                top = max(bridge_mean, *means.values())
+                for member, raw in raws.items():
+                    if max(means[member], bridge_mean) >= top:
+                        # Measured as well as this pair allows; a third keyword
+                        # setting the scale is worth a retry in a cleaner group
+                        tried[member].add(bridge)
+                    measurement = _Measurement(
+                        values=[value * factor for value in raw] if factor is not None else None,
+                        precision=min(means[member], bridge_mean),
+                        bridge=bridge
+                    )
+                    current = best.get(member)
+                    if current is None or measurement.precision > current.precision:
+                        best[member] = measurement
+                    if measurement.values is not None and measurement.precision >= self.min_value:
+                        bridges.setdefault(member, measurement.values)
+
+            pending = self._next_round(targets, best, bridges, tried, alone)
+
+        return self._assemble(anchor, targets, bridges, best, timeline)
+
+    def _next_round(
+        self,
+        targets: List[str],
+        best: Dict[str, _Measurement],
+        bridges: Dict[str, List[float]],
+        tried: Dict[str, Set[str]],
+        alone: Dict[str, Set[str]]
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Pair each imprecise keyword with the untried bridge closest to its
+        level, if one is near enough to measure it precisely. Keywords out
+        of every bridge's reach work outwards from the highest or lowest
+        bridge: those of unknown level are measured against it, and the
+        closest of the rest is re-measured alone against it as a stepping
+        stone that, once precise, bridges to the others.
+        """
+        levels = {keyword: _mean(values) or 0.0 for keyword, values in bridges.items()}
+        # Widest level ratio at which the smaller of two keywords still reads min_value
+        reach = math.log(100.0 / self.min_value)
+        estimates: Dict[str, float] = {}
+        by_bridge: Dict[str, List[str]] = defaultdict(list)
+        stalled: List[str] = []
+        for keyword in targets:
+            measurement = best.get(keyword)
+            if measurement is not None and measurement.precision >= self.min_value and measurement.values is not None:
+                continue
+            candidates = [bridge for bridge in bridges if bridge not in tried[keyword] and levels[bridge] > 0]
+            if measurement is None:
+                # Failed request: retry against the anchor-closest bridge available
+                estimates[keyword] = ANCHOR_AVERAGE
+                if candidates:
+                    by_bridge[min(candidates, key=lambda bridge: _distance(levels[bridge], ANCHOR_AVERAGE))].append(keyword)
+                continue
+
+            level = estimates[keyword] = _estimate(measurement)
+            if math.isinf(level):
+                choice = None
+            elif level <= 0:
+                # Flattened to zeros by its bridge; only a lower one can help
+                lower = [bridge for bridge in candidates if levels[bridge] < levels[measurement.bridge]]
+                choice = min(lower, key=levels.get, default=None)
+            else:
+                near = [bridge for bridge in candidates if _distance(levels[bridge], level) <= reach]
+                choice = min(near, key=lambda bridge: _distance(levels[bridge], level), default=None)
+            if choice is None:
+                stalled.append(keyword)
+            else:
+                by_bridge[choice].append(keyword)
+
+        positive = [bridge for bridge in levels if levels[bridge] > 0]
+        stones: Dict[str, List[str]] = defaultdict(list)
+        for keyword in stalled:
+            level = estimates[keyword]
+            if math.isinf(level) or level <= 0:
+                # Level unknown beyond its bridge: measure against the outermost one
+                edge = (max if math.isinf(level) else min)(positive, key=levels.get)
+                if edge not in tried[keyword]:
+                    by_bridge[edge].append(keyword)
+                continue
+            edge = min(positive, key=lambda bridge: _distance(level, levels[bridge]))
+            if keyword not in alone[edge]:
+                stones[edge].append(keyword)
+
+        groups = []
+        for bridge, members in by_bridge.items():
+            # Keywords of similar level share a group, so none sets a scale
+            # that flattens the others; those of unknown level go together
+            known = sorted((keyword for keyword in members if not math.isinf(estimates[keyword])), key=estimates.get)
+            unknown = [keyword for keyword in members if math.isinf(estimates[keyword])]
+            for run in (known, unknown):
+                groups.extend((bridge, run[i:i + self.group_size]) for i in range(0, len(run), self.group_size))
+        for edge, keywords in stones.items():
+            stone = min(keywords, key=lambda keyword: _distance(estimates[keyword], levels[edge]))
+            alone[edge].add(stone)
+            groups.append((edge, [stone]))
+        return groups
+
+    def _assemble(
+        self,
+        anchor: str,
+        targets: List[str],
+        bridges: Dict[str, List[float]],
+        best: Dict[str, _Measurement],
+        timeline: "_Timeline"
+    ) -> NormalizedTrends:
+        timestamps = timeline.timestamps
+        count = len(timestamps)
+        keywords = [anchor] + targets
+        values = array("d")
+        precise = []
+        for keyword in keywords:
+            if keyword in bridges:
+                series, is_precise = bridges[keyword], True
+            else:
+                measurement = best.get(keyword)
+                series = measurement.values if measurement and measurement.values is not None else None
+                is_precise = False
+            values.extend(series if series is not None else [math.nan] * count)
+            precise.append(is_precise)
+
+        imprecise = [keyword for keyword, flag in zip(keywords, precise) if not flag]
+        if imprecise:
+            logger.warning(
+                f"{len(imprecise)} of {len(keywords)} keywords could not be scaled precisely: "
+                f"{', '.join(imprecise[:10])}{'...' if len(imprecise) > 10 else ''}"
+            )
+        return NormalizedTrends(keywords, anchor, timestamps, values, precise)
+
+
+def _estimate(measurement: _Measurement) -> float:
+    """A measured keyword's level on the common scale; inf if it reduced its bridge to zeros."""
+    return math.inf if measurement.values is None else _mean(measurement.values) or 0.0
+
+
+def _distance(level: float, other: float) -> float:
+    """How far apart two levels are, as a log ratio (inf if either is 0 or inf)."""
+    if not (0 < level < math.inf and 0 < other < math.inf):
+        return math.inf
+    return abs(math.log(level / other))
+
+
+def _factor(reference: List[float], raw: List[float]) -> Optional[float]:
+    """Scale taking ``raw`` onto ``reference``, over points both have."""
+    ref_sum = raw_sum = 0.0
+    for ref, value in zip(reference, raw):
+        if not (math.isnan(ref) or math.isnan(value)):
+            ref_sum += ref
+            raw_sum += value
+    return ref_sum / raw_sum if raw_sum > 0 else None
+
+
+class _Timeline:
+    """Point timestamps shared by every group of one normalization"""
+
+    def __init__(self):
+        self.timestamps = array("q")
+        self._slots: Dict[int, int] = {}
+
+    def aligned(self, series: TrendsSeries, keyword: str) -> List[float]:
+        """A keyword's raw values on this timeline, NaN where missing."""
+        if not self._slots:
+            # The first group returned defines the timeline
+            self.timestamps = array("q", series.timestamps)
+            self._slots = {ts: t for t, ts in enumerate(self.timestamps)}
+        aligned = [math.nan] * len(self.timestamps)
+        for ts, value in zip(series.timestamps, series.series(keyword)):
+            slot = self._slots.get(ts)
+            if slot is not None and value != MISSING:
+                aligned[slot] = float(value)
+        return aligned
+
+
+def _anchor_reference(anchor: str, results: Iterable[TrendsSeries], timeline: _Timeline) -> Optional[List[float]]:
+    """Anchor series scaled to ANCHOR_AVERAGE, from the group where it reads highest."""
+    best_raw, best_mean = None, 0.0
+    for series in results:
+        raw = timeline.aligned(series, anchor)
+        mean = _mean(raw) or 0.0
+        if mean > best_mean:
+            best_raw, best_mean = raw, mean
+    if best_raw is None:
+        return None
+    return [value * ANCHOR_AVERAGE / best_mean for value in best_raw]
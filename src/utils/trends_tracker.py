@@ -0,0 +1,452 @@
+import asyncio
+import hashlib
+import math
+import re
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+import msgspec
+
+from .monthly_series import MISSING
+from .trends_client import GoogleTrendsClient, TrendsSeries, MAX_KEYWORDS_PER_EXPLORE
+
+logger = logging.getLogger(__name__)
+
+
+# Google Trends returns hourly points for windows of a week or less and
+# weekly points beyond ~270 days; tracking windows stay in the daily range
+MIN_DAILY_WINDOW = 8
+MAX_DAILY_WINDOW = 269
+
+# Days re-fetched before the newest stored day: they rescale the new
+# window onto the stored one and pick up Google's revisions of recent days
+DEFAULT_OVERLAP_DAYS = 14
+
+# Window for a group's first snapshot
+DEFAULT_INITIAL_DAYS = 30
+
+# Bytes per stored value (float64)
+_ITEM = array("d").itemsize
+
+
+class TrendsSnapshot(msgspec.Struct):
+    """One day's fetch for a keyword group, as written (once) to the store"""
+    keywords: List[str]
+    fetched_on: str
+    date_from: str
+    date_to: str
+    days: List[str]
+    # Keyword-major raw 0-100 values; null where Google had none
+    values: List[List[Optional[int]]]
+    # Multiplier taking the raw values onto the group's tracked scale
+    factor: float
+    # Incremented when a gap left no overlap and the scale had to restart
+    segment: int = 0
+
+
+class HistoryMeta(msgspec.Struct):
+    """Header of a group's materialized history"""
+    keywords: List[str]
+    start: Optional[str] = None
+    days: int = 0
+    last_snapshot: Optional[str] = None
+    segment: int = 0
+    # Factor of the last applied snapshot (None in histories written before it was kept)
+    factor: Optional[float] = None
+
+    def end(self) -> Optional[date]:
+        if self.start is None or not self.days:
+            return None
+        return date.fromisoformat(self.start) + timedelta(days=self.days - 1)
+
+
+class TrackedHistory:
+    """
+    A keyword group's tracked values, one row per day from ``start``.
+
+    Values are one day-major array("d") (a row of ``len(keywords)`` floats
+    per day) on the group's tracked scale - the scale of its first snapshot
+    - with NaN for days without data.
+    """
+
+    __slots__ = ("keywords", "start", "values")
+
+    def __init__(self, keywords: Sequence[str], start: Optional[date], values: array):
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self.start = start
+        self.values = values
+
+    def __len__(self) -> int:
+        """Number of days."""
+        return len(self.values) // len(self.keywords) if self.keywords else 0
+
+    def dates(self) -> List[date]:
+        return [self.start + timedelta(days=i) for i in range(len(self))] if self.start else []
+
+    def series(self, keyword: str) -> array:
+        """One keyword's values, oldest first."""
+        return self.values[self.keywords.index(keyword)::len(self.keywords)]
+
+    def latest(self) -> Dict[str, Optional[float]]:
+        """Most recent day's value per keyword."""
+        if not len(self):
+            return {keyword: None for keyword in self.keywords}
+        row = self.values[-len(self.keywords):]
+        return {keyword: None if math.isnan(value) else value for keyword, value in zip(self.keywords, row)}
+
+    def as_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """{"YYYY-MM-DD": {keyword: value}} with None for missing days."""
+        width = len(self.keywords)
+        return {
+            day.isoformat(): {
+                keyword: None if math.isnan(value) else round(value, 3)
+                for keyword, value in zip(self.keywords, self.values[i * width:(i + 1) * width])
+            }
+            for i, day in enumerate(self.dates())
+        }
+
+    def __repr__(self) -> str:
+        return f"TrackedHistory(keywords={list(self.keywords)}, start={self.start}, days={len(self)})"
+
+
+def group_id(keywords: Sequence[str]) -> str:
+    """Directory name for a keyword group: readable slug plus a short hash."""
+    slug = "+".join(re.sub(r"[^a-z0-9]+", "-", keyword.lower()).strip("-") for keyword in keywords)
+    digest = hashlib.sha1("\n".join(keywords).encode()).hexdigest()[:8]
+    return f"{slug[:80]}_{digest}"
+
+
+class TrendsSnapshotStore:
+    """
+    On-disk store for tracked keyword groups.
+
+    Layout, per group::
+
+        {root}/{group_id}/snapshots/YYYY-MM-DD.json   # append-only, one per fetch day
+        {root}/{group_id}/history.bin                 # materialized float64 rows
+        {root}/{group_id}/history.json                # HistoryMeta for history.bin
+
+    Snapshots are the source of truth; one is only replaced when a run
+    stopped before applying it and the day is fetched again. The history
+    is derived from them (``rebuild``) and updated in place, so reading any
+    date range is a seek and one ``array.fromfile`` regardless of how many
+    snapshots there are.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def group_dir(self, keywords: Sequence[str]) -> Path:
+        return self.root / group_id(keywords)
+
+    def meta(self, keywords: Sequence[str]) -> Optional[HistoryMeta]:
+        path = self.group_dir(keywords) / "history.json"
+        if not path.exists():
+            return None
+        return msgspec.json.decode(path.read_bytes(), type=HistoryMeta)
+
+    def write_snapshot(self, snapshot: TrendsSnapshot) -> Path:
+        """
+        Write a snapshot atomically. A snapshot already stored for its day
+        (left by a run that stopped before updating the history) is replaced.
+        """
+        directory = self.group_dir(snapshot.keywords) / "snapshots"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{snapshot.fetched_on}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(msgspec.json.encode(snapshot))
+        tmp.replace(path)
+        return path
+
+    def snapshots(self, keywords: Sequence[str]) -> List[TrendsSnapshot]:
+        """All stored snapshots of a group, oldest fetch first."""
+        directory = self.group_dir(keywords) / "snapshots"
+        if not directory.exists():
+            return []
+        decoder = msgspec.json.Decoder(TrendsSnapshot)
+        return [decoder.decode(path.read_bytes()) for path in sorted(directory.glob("*.json"))]
+
+    def latest_snapshot(self, keywords: Sequence[str]) -> Optional[TrendsSnapshot]:
+        """The most recently fetched snapshot of a group, if any."""
+        paths = sorted((self.group_dir(keywords) / "snapshots").glob("*.json"))
+        return msgspec.json.decode(paths[-1].read_bytes(), type=TrendsSnapshot) if paths else None
+
+    def apply(self, snapshot: TrendsSnapshot, meta: Optional[HistoryMeta] = None) -> HistoryMeta:
+        """Write a snapshot's rescaled days into the group's history."""
+        keywords = snapshot.keywords
+        width = len(keywords)
+        meta = meta or self.meta(keywords) or HistoryMeta(keywords=list(keywords))
+        if not snapshot.days:
+            meta.last_snapshot = snapshot.fetched_on
+            self._write_meta(keywords, meta)
+            return meta
+
+        first = date.fromisoformat(snapshot.days[0])
+        start = date.fromisoformat(meta.start) if meta.start else first
+        path = self.group_dir(keywords) / "history.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if first < start:
+            # Only a rebuild from an earlier snapshot moves the start back
+            self._prepend(path, width, (start - first).days, meta.days)
+            meta.days += (start - first).days
+            start = first
+
+        rows: Dict[int, array] = {}
+        for t, day in enumerate(snapshot.days):
+            row = array("d", [math.nan]) * width
+            for k in range(width):
+                value = snapshot.values[k][t]
+                if value is not None:
+                    row[k] = value * snapshot.factor
+            rows[(date.fromisoformat(day) - start).days] = row
+
+        last = max(rows)
+        with open(path, "r+b" if path.exists() else "w+b") as f:
+            if last >= meta.days:
+                # Extend with empty rows for any gap, then overwrite below
+                f.seek(meta.days * width * _ITEM)
+                (array("d", [math.nan]) * (width * (last + 1 - meta.days))).tofile(f)
+                meta.days = last + 1
+            for offset in sorted(rows):
+                f.seek(offset * width * _ITEM)
+                rows[offset].tofile(f)
+
+        meta.start = start.isoformat()
+        meta.last_snapshot = snapshot.fetched_on
+        meta.segment = snapshot.segment
+        meta.factor = snapshot.factor
+        self._write_meta(keywords, meta)
+        return meta
+
+    def read(
+        self,
+        keywords: Sequence[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> TrackedHistory:
+        """Tracked values of a group between ``start`` and ``end`` (inclusive)."""
+        meta = self.meta(keywords)
+        if meta is None or meta.start is None:
+            return TrackedHistory(keywords, None, array("d"))
+        width = len(keywords)
+        first = date.fromisoformat(meta.start)
+        lo = max(0, (start - first).days) if start else 0
+        hi = min(meta.days, (end - first).days + 1) if end else meta.days
+        values = array("d")
+        if hi > lo:
+            with open(self.group_dir(keywords) / "history.bin", "rb") as f:
+                f.seek(lo * width * _ITEM)
+                values.fromfile(f, (hi - lo) * width)
+        return TrackedHistory(keywords, first + timedelta(days=lo), values)
+
+    def rebuild(self, keywords: Sequence[str]) -> HistoryMeta:
+        """Recreate a group's history from its snapshots."""
+        directory = self.group_dir(keywords)
+        for name in ("history.bin", "history.json"):
+            (directory / name).unlink(missing_ok=True)
+        meta = HistoryMeta(keywords=list(keywords))
+        for snapshot in self.snapshots(keywords):
+            meta = self.apply(snapshot, meta)
+        return meta
+
+    def _prepend(self, path: Path, width: int, rows: int, existing: int) -> None:
+        values = array("d")
+        if path.exists() and existing:
+            with open(path, "rb") as f:
+                values.fromfile(f, existing * width)
+        with open(path, "wb") as f:
+            (array("d", [math.nan]) * (rows * width)).tofile(f)
+            values.tofile(f)
+
+    def _write_meta(self, keywords: Sequence[str], meta: HistoryMeta) -> None:
+        path = self.group_dir(keywords) / "history.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(msgspec.json.encode(meta))
+        tmp.replace(path)
+
+
+class TrendsTracker:
+    """
+    Daily Google Trends tracking for keyword groups.
+
+    Each group (up to five keywords, compared in one request) keeps the
+    scale of its first snapshot. Every later update fetches only the days
+    since the newest stored day plus ``overlap_days`` before it; the
+    overlap gives the factor that rescales the new window onto the stored
+    scale, and its rescaled values replace the stored ones so Google's
+    revisions of recent days are picked up. A group already updated today
+    is not fetched again.
+
+    If a group was not updated for longer than the daily window allows,
+    there is no overlap left: the newest window starts a new segment on
+    its own scale and a warning is logged.
+    """
+
+    def __init__(
+        self,
+        trends: GoogleTrendsClient,
+        store: TrendsSnapshotStore,
+        overlap_days: int = DEFAULT_OVERLAP_DAYS,
+        initial_days: int = DEFAULT_INITIAL_DAYS,
+        location_code: Optional[int] = 2840,
+        language_code: str = "en"
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            trends: Open GoogleTrendsClient
+            store: Snapshot store
+            overlap_days: Stored days re-fetched to rescale each update
+            initial_days: Window of a group's first snapshot
+            location_code: Location code (default: 2840, United States)
+            language_code: Language code (default: "en")
+        """
+        self.trends = trends
+        self.store = store
+        self.overlap_days = overlap_days
+        self.initial_days = initial_days
+        self.location_code = location_code
+        self.language_code = language_code
+        # Failures of the last ``update``, per group
+        self.errors: Dict[Tuple[str, ...], BaseException] = {}
+
+    def window(self, meta: Optional[HistoryMeta], today: date) -> Tuple[date, date]:
+        """Dates to fetch for a group today."""
+        end = meta.end() if meta else None
+        if end is None:
+            start = today - timedelta(days=self.initial_days)
+        else:
+            start = min(end, today) - timedelta(days=self.overlap_days)
+        start = min(start, today - timedelta(days=MIN_DAILY_WINDOW - 1))
+        return max(start, today - timedelta(days=MAX_DAILY_WINDOW - 1)), today
+
+    async def update(
+        self,
+        groups: Sequence[Sequence[str]],
+        today: Optional[date] = None
+    ) -> Dict[Tuple[str, ...], Optional[TrendsSnapshot]]:
+        """
+        Bring every group up to ``today`` (default: today), concurrently.
+
+        A group that fails does not stop the others: each group's history
+        is saved as soon as its own update completes, and the failures are
+        logged and kept in ``errors``.
+
+        Returns:
+            Snapshot written per group; None for groups already current or
+            whose update failed
+        """
+        today = today or date.today()
+        for group in groups:
+            if not 1 <= len(group) <= MAX_KEYWORDS_PER_EXPLORE:
+                raise ValueError(f"Each group needs 1-{MAX_KEYWORDS_PER_EXPLORE} keywords, got {list(group)}")
+
+        outcomes = await asyncio.gather(
+            *(self._update_group(list(group), today) for group in groups),
+            return_exceptions=True
+        )
+        self.errors = {}
+        results: Dict[Tuple[str, ...], Optional[TrendsSnapshot]] = {}
+        for group, outcome in zip(groups, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Trends group {list(group)} failed: {outcome!r}")
+                self.errors[tuple(group)] = outcome
+                outcome = None
+            results[tuple(group)] = outcome
+        if self.errors:
+            logger.warning(f"Trends update: {len(self.errors)} of {len(groups)} groups failed")
+        return results
+
+    async def _update_group(self, keywords: List[str], today: date) -> Optional[TrendsSnapshot]:
+        meta = self.store.meta(keywords)
+        if meta and meta.last_snapshot == today.isoformat():
+            logger.debug(f"Trends group {keywords} already updated today")
+            return None
+
+        start, end = self.window(meta, today)
+        series = await self.trends.explore(
+            keywords,
+            date_from=start.isoformat(),
+            date_to=end.isoformat(),
+            location_code=self.location_code,
+            language_code=self.language_code,
+            tag=f"track_{today.isoformat()}"
+        )
+
+        days, values = _daily(series)
+        factor, segment = self._rescale(keywords, meta, days, values)
+        snapshot = TrendsSnapshot(
+            keywords=keywords,
+            fetched_on=today.isoformat(),
+            date_from=start.isoformat(),
+            date_to=end.isoformat(),
+            days=days,
+            values=values,
+            factor=factor,
+            segment=segment
+        )
+        self.store.write_snapshot(snapshot)
+        self.store.apply(snapshot, meta)
+        return snapshot
+
+    def _rescale(
+        self,
+        keywords: List[str],
+        meta: Optional[HistoryMeta],
+        days: List[str],
+        values: List[List[Optional[int]]]
+    ) -> Tuple[float, int]:
+        """Factor taking a new window onto the group's stored scale, and its segment."""
+        if meta is None or meta.start is None or not days:
+            return 1.0, 0
+
+        stored = self.store.read(keywords, date.fromisoformat(days[0]), date.fromisoformat(days[-1]))
+        stored_rows = {day.isoformat(): i for i, day in enumerate(stored.dates())}
+        width = len(keywords)
+        stored_sum = raw_sum = 0.0
+        for t, day in enumerate(days):
+            i = stored_rows.get(day)
+            if i is None:
+                continue
+            for k in range(width):
+                old, new = stored.values[i * width + k], values[k][t]
+                if new is not None and not math.isnan(old):
+                    stored_sum += old
+                    raw_sum += new
+
+        if raw_sum > 0 and stored_sum > 0:
+            return stored_sum / raw_sum, meta.segment
+        if stored_rows:
+            # Overlap exists but reads zero (no interest); keep the last factor
+            if meta.factor is not None:
+                return meta.factor, meta.segment
+            previous = self.store.latest_snapshot(keywords)
+            return (previous.factor if previous else 1.0), meta.segment
+        logger.warning(
+            f"Trends group {keywords}: no overlap with stored history (last day {meta.end()}); "
+            f"starting a new scale segment"
+        )
+        return 1.0, meta.segment + 1
+
+    def history(
+        self,
+        keywords: Sequence[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> TrackedHistory:
+        """Tracked values of a group, read straight from the materialized history."""
+        return self.store.read(keywords, start, end)
+
+
+def _daily(series: TrendsSeries) -> Tuple[List[str], List[List[Optional[int]]]]:
+    """A series' ISO days and keyword-major values (None where missing)."""
+    days = [day.isoformat() for day in series.dates()]
+    values = [
+        [None if value == MISSING else value for value in series.series(keyword)]
+        for keyword in series.keywords
+    ]
+    return days, values
@@ -0,0 +1,138 @@
+from array import array
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+import logging
+
+from .monthly_series import MISSING
+
+logger = logging.getLogger(__name__)
+
+
+class VolumeMatrix:
+    """
+    Dense keyword × location search volume matrix.
+
+    Volumes live in one row-major int64 array (a row per keyword, a column
+    per location), with dictionaries mapping each keyword and location to
+    its index. Cells without data hold MISSING and come back as None from
+    ``get``. ``to_numpy()`` wraps the same buffer without copying, so
+    multi-country views are one vectorized step.
+
+    Locations are whatever identifies a column: location codes for the
+    by-location endpoint, country ISO codes for the normalized one.
+    """
+
+    __slots__ = ("keywords", "locations", "keyword_index", "location_index", "values")
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        locations: Sequence[Hashable],
+        values: Optional[array] = None
+    ):
+        """
+        Initialize matrix.
+
+        Args:
+            keywords: Row labels, in order (duplicates are dropped)
+            locations: Column labels, in order (duplicates are dropped)
+            values: Optional array("q") of len(keywords) * len(locations)
+                volumes, row-major; all MISSING by default
+        """
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+        self.locations: List[Hashable] = list(dict.fromkeys(locations))
+        self.keyword_index: Dict[str, int] = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self.location_index: Dict[Hashable, int] = {location: j for j, location in enumerate(self.locations)}
+        size = len(self.keywords) * len(self.locations)
+        if values is None:
+            values = array("q", [MISSING]) * size
+        elif len(values) != size:
+            raise ValueError(f"Expected {size} values, got {len(values)}")
+        self.values = values
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.keywords), len(self.locations)
+
+    def _offset(self, keyword: str, location: Hashable) -> int:
+        return self.keyword_index[keyword] * len(self.locations) + self.location_index[location]
+
+    def get(self, keyword: str, location: Hashable) -> Optional[int]:
+        """Volume for one cell, or None if the API had none."""
+        value = self.values[self._offset(keyword, location)]
+        return None if value == MISSING else value
+
+    def set(self, keyword: str, location: Hashable, volume: Optional[int]) -> None:
+        self.values[self._offset(keyword, location)] = MISSING if volume is None else volume
+
+    def row(self, keyword: str) -> array:
+        """Volumes of one keyword across all locations (MISSING where absent)."""
+        width = len(self.locations)
+        start = self.keyword_index[keyword] * width
+        return self.values[start:start + width]
+
+    def column(self, location: Hashable) -> array:
+        """Volumes of all keywords in one location (MISSING where absent)."""
+        return self.values[self.location_index[location]::len(self.locations)]
+
+    def keyword_totals(self) -> Dict[str, int]:
+        """Sum over locations per keyword, ignoring missing cells."""
+        width = len(self.locations)
+        values = self.values
+        return {
+            keyword: sum(v for v in values[i * width:(i + 1) * width] if v != MISSING)
+            for i, keyword in enumerate(self.keywords)
+        }
+
+    def location_totals(self) -> Dict[Hashable, int]:
+        """Sum over keywords per location, ignoring missing cells."""
+        width = len(self.locations)
+        return {
+            location: sum(v for v in self.values[j::width] if v != MISSING)
+            for j, location in enumerate(self.locations)
+        }
+
+    def cells(self) -> Iterator[Tuple[str, Hashable, int]]:
+        """(keyword, location, volume) for every cell with data."""
+        width = len(self.locations)
+        for offset, value in enumerate(self.values):
+            if value != MISSING:
+                i, j = divmod(offset, width)
+                yield self.keywords[i], self.locations[j], value
+
+    def to_numpy(self):
+        """
+        The matrix as a (keywords, locations) int64 NumPy array sharing this buffer.
+
+        Missing cells are MISSING (-1); mask with ``matrix < 0``.
+        NumPy is optional and only needed for this method.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("VolumeMatrix.to_numpy() requires numpy (pip install numpy)") from e
+        return np.frombuffer(self.values, dtype=np.int64).reshape(self.shape)
+
+    def to_dict(self) -> Dict[str, Dict[Hashable, Optional[int]]]:
+        """Nested {keyword: {location: volume}} view, None where missing."""
+        width = len(self.locations)
+        return {
+            keyword: {
+                location: None if value == MISSING else value
+                for location, value in zip(self.locations, self.values[i * width:(i + 1) * width])
+            }
+            for i, keyword in enumerate(self.keywords)
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VolumeMatrix):
+            return NotImplemented
+        return (
+            self.keywords == other.keywords
+            and self.locations == other.locations
+            and self.values == other.values
+        )
+
+    def __repr__(self) -> str:
+        filled = sum(1 for value in self.values if value != MISSING)
+        rows, cols = self.shape
+        return f"VolumeMatrix({rows} keywords x {cols} locations, {filled} cells with data)"